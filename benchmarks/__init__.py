@@ -0,0 +1,6 @@
+"""Benchmarks of the SDK hot paths
+
+Run them with `python -m benchmarks --output results.json`, queries are
+answered in-process by the mock API store of `tests/server.py` so only the
+overhead of the SDK is measured.
+"""
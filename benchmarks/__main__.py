@@ -0,0 +1,57 @@
+import argparse
+import json
+import sys
+from benchmarks import runner
+from benchmarks import bench_cache  # noqa: F401
+from benchmarks import bench_config  # noqa: F401
+from benchmarks import bench_instance  # noqa: F401
+from benchmarks import bench_json  # noqa: F401
+from benchmarks import bench_lookup  # noqa: F401
+from benchmarks import bench_query  # noqa: F401
+
+
+def _report(result):
+    print("{:<60} {:>12.2f} us  (+/- {:.2f})".format(
+        runner.key(result), result["median"] * 1e6, result["stdev"] * 1e6))
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Benchmark the SDK")
+    parser.add_argument("--output", help="write the results to a JSON file")
+    parser.add_argument("--filter", help="only run the matching benchmarks")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05,
+                        help="minimum duration of a round in seconds")
+    parser.add_argument("--compare", help="results of a previous run")
+    parser.add_argument("--threshold", type=float, default=1.2,
+                        help="median ratio reported as a regression")
+    parser.add_argument("--list", action="store_true",
+                        help="list the benchmarks without running them")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, params, _ in runner.cases(args.filter):
+            print(runner.key({"name": name, "params": params}))
+        return 0
+
+    results = runner.run(args.filter, args.repeat, args.min_time, _report)
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump({"metadata": runner.metadata(), "results": results},
+                      output, indent=2)
+
+    if args.compare:
+        with open(args.compare) as baseline:
+            previous = json.load(baseline)["results"]
+        regressions = runner.compare(results, previous, args.threshold)
+        for key, ratio in regressions:
+            print("Regression: {} is {:.2f}x slower".format(key, ratio))
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+import itertools
+from ibmcloud_python_sdk.auth import get_headers
+from ibmcloud_python_sdk.utils import cache
+from ibmcloud_python_sdk.utils import common
+from benchmarks.environment import offline
+from benchmarks.runner import benchmark
+
+
+@benchmark("cache.lookup", result=["hit", "miss"])
+def cache_lookup(result):
+    """cache.lookup() on the local cache tier
+    """
+    with offline({"local_cache": True}):
+        account = common._account_id(get_headers())
+        path = "/v1/vpcs?version=2020-03-10&generation=2"
+        item_key = "{}{}".format(account, path)
+        namespace = cache.namespace(account, "iaas", path)
+        if result == "hit":
+            _, generation = cache.lookup(item_key, namespace)
+            data = b'{"vpcs": []}'
+            cache.store(item_key, namespace, generation, data, {"vpcs": []})
+            yield lambda: cache.lookup(item_key, namespace)
+        else:
+            keys = ("{}{}".format(item_key, index)
+                    for index in itertools.count())
+            yield lambda: cache.lookup(next(keys), namespace)
+
+
+@benchmark("cache.query", result=["hit", "miss"])
+def cache_query(result):
+    """query_wrapper() answered by the local cache or by the transport
+    """
+    with offline({"local_cache": True}, {"/v1/vpcs": 50}):
+        headers = get_headers()
+        path = "/v1/vpcs?version=2020-03-10&generation=2"
+        if result == "hit":
+            common.query_wrapper("iaas", "GET", path, headers)
+            yield lambda: common.query_wrapper("iaas", "GET", path, headers)
+        else:
+            paths = ("{}&start={}".format(path, index)
+                     for index in itertools.count())
+            yield lambda: common.query_wrapper("iaas", "GET", next(paths),
+                                               headers)
@@ -0,0 +1,40 @@
+from ibmcloud_python_sdk import auth
+from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.utils import common
+from benchmarks.environment import offline
+from benchmarks.runner import benchmark
+
+
+@benchmark("config.params")
+def config_params():
+    """params() returning the memoized cloud configuration
+    """
+    with offline():
+        params()
+        yield params
+
+
+@benchmark("auth.get_headers")
+def get_headers():
+    """get_headers() with a valid token
+    """
+    with offline():
+        auth.get_headers()
+        yield auth.get_headers
+
+
+@benchmark("auth.account_id", memoized=[True, False])
+def account_id(memoized):
+    """Account ID of the current token, decoding the token every time when
+    not memoized
+    """
+    with offline():
+        auth.token_manager.get()
+        if memoized:
+            yield lambda: auth.token_manager.account_id
+        else:
+            def decode():
+                common.claims.cache_clear()
+                return auth.token_manager.account_id
+
+            yield decode
@@ -0,0 +1,32 @@
+from ibmcloud_python_sdk.utils import lookup
+from ibmcloud_python_sdk.vpc import instance
+from benchmarks.environment import offline
+from benchmarks.runner import benchmark
+
+RESOURCES = {
+    "/v1/vpcs": 50,
+    "/v1/images": 200,
+    "/v1/keys": 100,
+    "/v1/subnets": 500,
+}
+
+
+@benchmark("instance.create_instance", index=["cold", "warm"])
+def create_instance(index):
+    """create_instance() resolving the VPC, image, key, subnet and
+    resource group by name
+    """
+    with offline(resources=RESOURCES):
+        vsi = instance.Instance()
+
+        def create():
+            if index == "cold":
+                lookup.name_index.clear()
+            return vsi.create_instance(
+                name="vsi", profile="bx2-2x8", zone="us-south-1",
+                vpc="vpc-49", image="image-199", keys=["key-99"],
+                resource_group="Default",
+                primary_network_interface={"subnet": "subnet-499"})
+
+        create()
+        yield create
@@ -0,0 +1,32 @@
+import json
+from ibmcloud_python_sdk.utils import codec
+from benchmarks.environment import offline
+from benchmarks.runner import benchmark
+from tests.server import Store
+
+SIZES = [100, 1000, 5000]
+
+
+def _listing(size):
+    store = Store("mock-account", "us-south", 0)
+    store.generate("/v1/instances", size)
+
+    return {"instances": store.collections["/v1/instances"]}
+
+
+@benchmark("json.loads", size=SIZES)
+def loads(size):
+    """Decoding a listing of instances
+    """
+    data = json.dumps(_listing(size)).encode()
+    yield lambda: json.loads(data)
+
+
+@benchmark("codec.decode", size=SIZES)
+def decode(size):
+    """Decoding a listing of instances stored in cache with the default
+    codec settings
+    """
+    with offline():
+        value = codec.encode(_listing(size))
+        yield lambda: codec.decode(value)
@@ -0,0 +1,35 @@
+from ibmcloud_python_sdk.utils import lookup
+from ibmcloud_python_sdk.vpc import subnet
+from benchmarks.environment import offline
+from benchmarks.runner import benchmark
+
+SIZES = [100, 1000, 5000]
+
+
+@benchmark("lookup.by_name", size=SIZES)
+def by_name(size):
+    """get_subnet_by_name() listing every page of the collection to find
+    the last subnet
+    """
+    with offline(resources={"/v1/subnets": size}):
+        sn = subnet.Subnet()
+        name = "subnet-{}".format(size - 1)
+        yield lambda: sn.get_subnet_by_name(name)
+
+
+@benchmark("lookup.resolve", size=SIZES, index=["cold", "warm"])
+def resolve(size, index):
+    """get_subnet() resolving a name, through the name index when warm
+    """
+    with offline(resources={"/v1/subnets": size}):
+        sn = subnet.Subnet()
+        name = "subnet-{}".format(size - 1)
+        if index == "warm":
+            sn.get_subnet(name)
+            yield lambda: sn.get_subnet(name)
+        else:
+            def cold():
+                lookup.name_index.clear()
+                return sn.get_subnet(name)
+
+            yield cold
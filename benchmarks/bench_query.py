@@ -0,0 +1,54 @@
+from ibmcloud_python_sdk.auth import get_headers
+from ibmcloud_python_sdk.utils import common
+from benchmarks.environment import offline
+from benchmarks.runner import benchmark
+from tests.server import MockServer
+
+PATH = "/v1/vpcs?version=2020-03-10&generation=2"
+
+
+@benchmark("query_wrapper.overhead", cached=[False, True])
+def query_overhead(cached):
+    """One GET through query_wrapper answered without any socket, with and
+    without the local cache
+    """
+    options = {"local_cache": True} if cached else None
+    with offline(options, {"/v1/vpcs": 10}):
+        headers = get_headers()
+        yield lambda: common.query_wrapper("iaas", "GET", PATH, headers)
+
+
+@benchmark("query_wrapper.loopback")
+def query_loopback():
+    """One GET through query_wrapper, the connection pool and the mock
+    server over a keep-alive loopback connection
+    """
+    with MockServer(resources={"/v1/vpcs": 10}) as server:
+        with offline({"endpoint": server.endpoint}):
+            token = common.transport.set(None)
+            try:
+                headers = get_headers()
+                yield lambda: common.query_wrapper("iaas", "GET", PATH,
+                                                   headers)
+            finally:
+                common.transport.reset(token)
+
+
+@benchmark("query_wrapper.instrumented", hooks=[0, 1])
+def query_instrumented(hooks):
+    """One GET through query_wrapper with a metrics hook registered, the
+    request is only measured when a hook is registered
+    """
+    from ibmcloud_python_sdk.utils import instrumentation
+    from ibmcloud_python_sdk.utils import metrics
+
+    registered = [metrics.MetricsHook() for _ in range(hooks)]
+    with offline(None, {"/v1/vpcs": 10}):
+        headers = get_headers()
+        for hook in registered:
+            instrumentation.add_hook(hook)
+        try:
+            yield lambda: common.query_wrapper("iaas", "GET", PATH, headers)
+        finally:
+            for hook in registered:
+                instrumentation.remove_hook(hook)
@@ -0,0 +1,63 @@
+import contextlib
+import os
+import shutil
+import tempfile
+import yaml
+from ibmcloud_python_sdk import auth
+from ibmcloud_python_sdk import config
+from ibmcloud_python_sdk.utils import cache
+from ibmcloud_python_sdk.utils import common
+from ibmcloud_python_sdk.utils import lookup
+from ibmcloud_python_sdk.utils import pool
+from tests.server import Store, StoreTransport
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+
+def _reset():
+    config.clear()
+    auth.token_manager.reset()
+    common.claims.cache_clear()
+    lookup.name_index.clear()
+    if cache.local_cache is not None:
+        cache.local_cache.clear()
+    pool.clear()
+
+
+@contextlib.contextmanager
+def offline(options=None, resources=None):
+    """Answer the queries from an in-process mock API store
+
+    The cloud configuration of the tests is used, the SDK configuration is
+    built from `options`.
+
+    :param options: sdk.yaml options
+    :type options: dict, optional
+    :param resources: Number of synthetic resources by collection path
+    :type resources: dict, optional
+    :return: Transport answering the queries
+    :rtype: StoreTransport
+    """
+    tmp = tempfile.mkdtemp()
+    environ = dict(os.environ)
+    os.environ["IC_CONFIG_FILE"] = os.path.join(ROOT,
+                                                "test-credentials.yaml")
+    os.environ["IC_SDK_CONFIG_FILE"] = os.path.join(tmp, "sdk.yaml")
+    if options:
+        with open(os.environ["IC_SDK_CONFIG_FILE"], "w") as sdk_file:
+            yaml.safe_dump({"sdk": options}, sdk_file)
+    _reset()
+
+    store = Store("mock-account", "us-south", 0)
+    for path, count in (resources or {}).items():
+        store.generate(path, count)
+    transport = StoreTransport(store)
+    token = common.transport.set(transport)
+    try:
+        yield transport
+    finally:
+        common.transport.reset(token)
+        os.environ.clear()
+        os.environ.update(environ)
+        _reset()
+        shutil.rmtree(tmp)
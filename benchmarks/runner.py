@@ -0,0 +1,169 @@
+import itertools
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+
+# Benchmarks registered by the benchmark() decorator
+registry = []
+
+
+def benchmark(name, **params):
+    """Register a benchmark
+
+    The decorated generator function sets up the benchmark, yields the
+    function to time and cleans up once resumed. It's run once for every
+    combination of the parameters.
+
+    :param name: Benchmark name
+    :type name: str
+    :param params: Parameter values by parameter name
+    :type params: list
+    :return: Decorator
+    :rtype: function
+    """
+    def decorator(func):
+        registry.append((name, params, func))
+        return func
+
+    return decorator
+
+
+def cases(pattern=None):
+    """List the benchmark cases
+
+    :param pattern: Only keep the names containing this string
+    :type pattern: str, optional
+    :return: Generator of (name, params, function)
+    :rtype: generator
+    """
+    for name, params, func in registry:
+        if pattern and pattern not in name:
+            continue
+        names = list(params)
+        for values in itertools.product(*[params[n] for n in names]):
+            yield name, dict(zip(names, values)), func
+
+
+def measure(func, repeat, min_time):
+    """Time a function
+
+    The number of calls per round is calibrated to last at least
+    `min_time` seconds, like `python -m timeit`.
+
+    :param func: Function to time
+    :type func: function
+    :param repeat: Number of rounds
+    :type repeat: int
+    :param min_time: Minimum duration of a round in seconds
+    :type min_time: float
+    :return: Statistics of the duration of a call in seconds
+    :rtype: dict
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time:
+            break
+        number *= 10 if number < 1000 else 2
+
+    rounds = [total / number for total in timer.repeat(repeat, number)]
+
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min": min(rounds),
+        "median": statistics.median(rounds),
+        "mean": statistics.mean(rounds),
+        "stdev": statistics.stdev(rounds) if len(rounds) > 1 else 0,
+    }
+
+
+def run(pattern=None, repeat=5, min_time=0.05, report=None):
+    """Run the benchmarks
+
+    :param pattern: Only run the benchmarks containing this string
+    :type pattern: str, optional
+    :param repeat: Number of rounds
+    :type repeat: int, optional
+    :param min_time: Minimum duration of a round in seconds
+    :type min_time: float, optional
+    :param report: Function called with every result
+    :type report: function, optional
+    :return: Results
+    :rtype: list
+    """
+    results = []
+    for name, params, func in cases(pattern):
+        generator = func(**params)
+        target = next(generator)
+        try:
+            result = {"name": name, "params": params}
+            result.update(measure(target, repeat, min_time))
+        finally:
+            next(generator, None)
+        results.append(result)
+        if report is not None:
+            report(result)
+
+    return results
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, check=True).stdout.decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def metadata():
+    """Describe the environment of the run
+
+    :return: Commit, Python version, platform and timestamp
+    :rtype: dict
+    """
+    return {
+        "commit": _commit(),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": int(time.time()),
+    }
+
+
+def key(result):
+    params = ",".join("{}={}".format(name, value)
+                      for name, value in sorted(result["params"].items()))
+
+    return "{}[{}]".format(result["name"], params) if params else \
+        result["name"]
+
+
+def compare(results, baseline, threshold):
+    """Compare results with a previous run
+
+    :param results: Results of the current run
+    :type results: list
+    :param baseline: Results of the previous run
+    :type baseline: list
+    :param threshold: Ratio of the medians above which a benchmark is
+        reported as a regression
+    :type threshold: float
+    :return: Regressions as (key, ratio) tuples
+    :rtype: list
+    """
+    previous = {key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get(key(result))
+        if before is None or not before["median"]:
+            continue
+        ratio = result["median"] / before["median"]
+        if ratio > threshold:
+            regressions.append((key(result), ratio))
+
+    return regressions
@@ -0,0 +1,185 @@
+import asyncio
+import contextvars
+import inspect
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import common
+from ibmcloud_python_sdk.utils import constants
+from ibmcloud_python_sdk.utils import instrumentation
+from ibmcloud_python_sdk.utils import ratelimit
+from ibmcloud_python_sdk.utils import retry
+from ibmcloud_python_sdk.utils.transport import Transport
+from ibmcloud_python_sdk.aio import transport
+
+
+executor = None
+executor_pid = None
+lock = threading.Lock()
+
+
+def get_executor():
+    """Retrieve the thread pool running the synchronous resource methods
+
+    Its threads mostly wait for the event loop to answer their queries. The
+    number of threads could be configured with the `aio_workers` option
+    from the sdk.yaml file. The pool is rebuilt after a fork().
+
+    :return: Thread pool
+    :rtype: ThreadPoolExecutor
+    """
+    global executor, executor_pid
+
+    if executor is not None and executor_pid == os.getpid():
+        return executor
+
+    with lock:
+        if executor is None or executor_pid != os.getpid():
+            config = sdk() or {}
+            executor = ThreadPoolExecutor(
+                max_workers=config.get("aio_workers", constants.AIO_WORKERS),
+                thread_name_prefix="ibmcloud-sdk-aio")
+            executor_pid = os.getpid()
+
+        return executor
+
+
+class _Bridge(Transport):
+    """Transport sending the queries of a worker thread through the event
+    loop
+
+    The worker thread waits for the response while the event loop keeps
+    running the other tasks.
+
+    :param loop: Running event loop
+    :type loop: asyncio.AbstractEventLoop
+    """
+
+    def __init__(self, loop):
+        self.loop = loop
+
+    def send(self, conn_type, host, method, path, payload, headers):
+        request = (conn_type, host, method, path, payload, headers)
+        future = asyncio.run_coroutine_threadsafe(
+            _send(request, instrumentation.active()), self.loop)
+
+        return future.result()
+
+
+async def _send(request, record=None):
+    """Send a query from the event loop with the rate limits and the retry
+    policy of query_wrapper()
+    """
+    conn_type, host, method, path, payload, headers = request
+    conn = transport.get_pool(host, timeout=params()["http_timeout"])
+    policy = retry.settings()
+    start = time.monotonic()
+    attempt = 0
+    while True:
+        attempt += 1
+        if record:
+            record.attempts += 1
+        delay = ratelimit.reserve(conn_type, host)
+        while delay:
+            await asyncio.sleep(delay)
+            delay = ratelimit.reserve(conn_type, host)
+        try:
+            res, data = await conn.request(method, path, payload, headers)
+        except Exception as error:
+            if not retry.retryable(method, error=error):
+                raise
+            wait = retry.delay(policy, attempt, start)
+            if wait is None:
+                raise
+        else:
+            if not retry.retryable(method, res=res):
+                return res, data
+            wait = retry.delay(policy, attempt, start, res)
+            if wait is None:
+                return res, data
+
+        await asyncio.sleep(wait)
+
+
+def _context(loop):
+    """Copy the current context with the queries sent through the event
+    loop
+    """
+    context = contextvars.copy_context()
+    context.run(common.transport.set, _Bridge(loop))
+
+    return context
+
+
+async def run(func, *args, **kwargs):
+    """Run a synchronous resource method with asyncio queries
+
+    The method is run once by a worker thread and its queries are sent by
+    the event loop. Path building, pagination, caching and error handling
+    stay in the synchronous classes, and their blocking calls never run on
+    the event loop.
+
+    :param func: Resource method
+    :type func: function
+    :return: Method result
+    :rtype: dict
+    """
+    loop = asyncio.get_running_loop()
+    context = _context(loop)
+
+    return await loop.run_in_executor(
+        get_executor(), partial(context.run, func, *args, **kwargs))
+
+
+async def iterate(func, *args, **kwargs):
+    """Run a synchronous resource generator with asyncio queries
+
+    The generator is resumed by a worker thread for every item, see run().
+
+    :param func: Resource generator method
+    :type func: function
+    :return: Asynchronous generator of resources
+    :rtype: async_generator
+    """
+    loop = asyncio.get_running_loop()
+    context = _context(loop)
+    generator = context.run(func, *args, **kwargs)
+    done = object()
+    try:
+        while True:
+            item = await loop.run_in_executor(
+                get_executor(), context.run, next, generator, done)
+            if item is done:
+                return
+            yield item
+    finally:
+        # A generator still resumed by a worker thread after a cancellation
+        # is left to the garbage collector
+        if not generator.gi_running:
+            context.run(generator.close)
+
+
+class AsyncResource():
+    """Expose the methods of a resource class as coroutines
+
+    Generator methods such as `iter_instances()` are exposed as
+    asynchronous generators.
+    """
+
+    resource = None
+
+    def __init__(self, *args, **kwargs):
+        self.sync = self.resource(*args, **kwargs)
+
+    def __getattr__(self, name):
+        attr = getattr(self.sync, name)
+        if name.startswith("_") or not inspect.ismethod(attr):
+            return attr
+        if inspect.isgeneratorfunction(attr):
+            return partial(iterate, attr)
+
+        return partial(run, attr)
@@ -0,0 +1,311 @@
+import asyncio
+import http.client
+import socket
+import ssl
+import time
+import weakref
+from collections import deque
+from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import constants
+from ibmcloud_python_sdk.utils import retry
+from ibmcloud_python_sdk.utils.pool import split_host
+from ibmcloud_python_sdk.utils.transport import Response
+
+
+# Errors raised when a kept-alive connection has been closed by the
+# remote side between two requests.
+STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    asyncio.IncompleteReadError,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+# Connection pools by event loop and host, pools can't be shared between
+# event loops.
+loops = weakref.WeakKeyDictionary()
+context = None
+
+
+def _ssl_context():
+    global context
+
+    if context is None:
+        context = ssl.create_default_context()
+
+    return context
+
+
+class Connection():
+    """Keep-alive HTTP/1.1 connection built on asyncio streams
+
+    :param reader: Stream reader
+    :type reader: asyncio.StreamReader
+    :param writer: Stream writer
+    :type writer: asyncio.StreamWriter
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        # Whether the last query has been entirely written
+        self.sent = False
+
+    def closed(self):
+        return self.reader.at_eof() or self.writer.is_closing()
+
+    def close(self):
+        self.writer.close()
+
+    async def request(self, host, method, path, payload=None, headers=None):
+        """Send a query and read the whole response
+
+        :param host: Host header value
+        :type host: str
+        :param method: HTTP method
+        :type method: str
+        :param path: Path used by within the query
+        :type path: str
+        :param payload: Payload send during the query
+        :type payload: str, optional
+        :param headers: Headers to send with the query
+        :type headers: dict, optional
+        :return: HTTP response and response body
+        :rtype: tuple
+        """
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+
+        lines = ["{} {} HTTP/1.1".format(method, path),
+                 "Host: {}".format(host),
+                 "Accept-Encoding: identity"]
+        for name, value in (headers or {}).items():
+            lines.append("{}: {}".format(name, value))
+        if payload is not None or method in ["POST", "PUT", "PATCH"]:
+            lines.append("Content-Length: {}".format(len(payload or b"")))
+        head = "\r\n".join(lines) + "\r\n\r\n"
+
+        self.sent = False
+        self.writer.write(head.encode("latin-1") + (payload or b""))
+        await self.writer.drain()
+        self.sent = True
+
+        return await self._response(method)
+
+    async def _response(self, method):
+        line = await self.reader.readline()
+        if not line:
+            raise http.client.RemoteDisconnected(
+                "Remote end closed connection without response")
+        version, status, reason = (
+            line.decode("latin-1").rstrip("\r\n").split(" ", 2) + [""])[:3]
+        status = int(status)
+
+        headers = []
+        while True:
+            line = await self.reader.readline()
+            if line in [b"\r\n", b"\n", b""]:
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers.append((name.strip(), value.strip()))
+        res = Response(status, reason, headers)
+
+        connection = (res.getheader("Connection") or "").lower()
+        res.will_close = (connection == "close" or (
+            version == "HTTP/1.0" and connection != "keep-alive"))
+
+        length = res.getheader("Content-Length")
+        encoding = (res.getheader("Transfer-Encoding") or "").lower()
+        if method == "HEAD" or status in [204, 304] or status < 200:
+            data = b""
+        elif "chunked" in encoding:
+            data = await self._chunks()
+        elif length is not None:
+            data = await self.reader.readexactly(int(length))
+        else:
+            # Body delimited by the end of the connection
+            data = await self.reader.read()
+            res.will_close = True
+
+        return res, data
+
+    async def _chunks(self):
+        chunks = []
+        while True:
+            line = await self.reader.readline()
+            size = int(line.split(b";")[0].strip(), 16)
+            if size == 0:
+                break
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readline()
+
+        # Skip trailers
+        while True:
+            line = await self.reader.readline()
+            if line in [b"\r\n", b"\n", b""]:
+                break
+
+        return b"".join(chunks)
+
+
+class ConnectionPool():
+    """Pool of reusable keep-alive connections for a single host
+
+    :param host: Host to connect to with an optional port
+    :type host: str
+    :param size: Maximum number of idle connections kept in the pool
+    :type size: int, optional
+    :param idle_timeout: Seconds after which an idle connection is dropped
+    :type idle_timeout: int, optional
+    :param timeout: Timeout of a query in seconds
+    :type timeout: int, optional
+    :param limit: Maximum number of concurrent queries
+    :type limit: int, optional
+    :param tls: Use TLS to connect to the host
+    :type tls: bool, optional
+    """
+
+    def __init__(self, host, size=constants.POOL_SIZE,
+                 idle_timeout=constants.POOL_IDLE_TIMEOUT,
+                 timeout=constants.HTTP_TIMEOUT,
+                 limit=constants.AIO_CONNECTIONS, tls=True):
+        self.host = host
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.tls = tls
+        self.idle = deque()
+        self.semaphore = asyncio.Semaphore(limit)
+
+    async def _new(self):
+        hostname, _, port = self.host.partition(":")
+        port = int(port) if port else (443 if self.tls else 80)
+        reader, writer = await asyncio.open_connection(
+            hostname, port, ssl=_ssl_context() if self.tls else None)
+
+        return Connection(reader, writer)
+
+    async def get(self):
+        """Retrieve an idle connection or create a new one
+
+        :return: Connection and reuse flag
+        :rtype: tuple
+        """
+        while self.idle:
+            conn, last_used = self.idle.pop()
+            if (time.monotonic() - last_used <= self.idle_timeout
+                    and not conn.closed()):
+                return conn, True
+            conn.close()
+
+        return await self._new(), False
+
+    def put(self, conn):
+        """Release a connection back into the pool
+
+        :param conn: Connection to release
+        :type conn: Connection
+        """
+        if len(self.idle) < self.size:
+            self.idle.append((conn, time.monotonic()))
+        else:
+            conn.close()
+
+    def clear(self):
+        """Close every idle connection of the pool
+        """
+        while self.idle:
+            conn, _ = self.idle.pop()
+            conn.close()
+
+    async def request(self, method, path, payload=None, headers=None):
+        """Execute HTTP query using a pooled connection
+
+        A reused connection closed by the server is transparently replaced
+        by a new one and the query is sent again, unless it was already
+        written and isn't idempotent. Timeouts and truncated responses are
+        raised as `socket.timeout` and `http.client.IncompleteRead`, like
+        the synchronous pool, to be retried by the same policy.
+
+        :param method: HTTP method
+        :type method: str
+        :param path: Path used by within the query
+        :type path: str
+        :param payload: Payload send during the query
+        :type payload: str, optional
+        :param headers: Headers to send with the query
+        :type headers: dict, optional
+        :return: HTTP response and response body
+        :rtype: tuple
+        """
+        async with self.semaphore:
+            while True:
+                conn, reused = await self.get()
+                try:
+                    res, data = await asyncio.wait_for(
+                        conn.request(self.host, method, path, payload,
+                                     headers),
+                        self.timeout)
+                except STALE_ERRORS as error:
+                    conn.close()
+                    # Once written, a query may have been processed by the
+                    # server before it closed the connection, only
+                    # idempotent queries can be sent again.
+                    if reused and (not conn.sent
+                                   or method in retry.IDEMPOTENT_METHODS):
+                        continue
+                    if isinstance(error, asyncio.IncompleteReadError):
+                        raise http.client.IncompleteRead(
+                            error.partial) from error
+                    raise
+                except asyncio.TimeoutError as error:
+                    conn.close()
+                    raise socket.timeout("timed out") from error
+                except BaseException:
+                    conn.close()
+                    raise
+
+                if res.will_close:
+                    conn.close()
+                else:
+                    self.put(conn)
+
+                return res, data
+
+
+def get_pool(host, timeout=constants.HTTP_TIMEOUT):
+    """Retrieve the connection pool dedicated to a host for the running
+    event loop
+
+    Pool size, idle timeout and the maximum number of concurrent queries
+    could be configured with the `pool_size`, `pool_idle_timeout` and
+    `aio_connections` options from the sdk.yaml file.
+
+    :param host: Host to connect to
+    :type host: str
+    :param timeout: Timeout of a query in seconds
+    :type timeout: int, optional
+    :return: Connection pool
+    :rtype: ConnectionPool
+    """
+    pools = loops.setdefault(asyncio.get_running_loop(), {})
+    if host not in pools:
+        config = sdk() or {}
+        scheme, netloc = split_host(host)
+        pools[host] = ConnectionPool(
+            netloc,
+            size=config.get("pool_size", constants.POOL_SIZE),
+            idle_timeout=config.get("pool_idle_timeout",
+                                    constants.POOL_IDLE_TIMEOUT),
+            timeout=timeout,
+            limit=config.get("aio_connections", constants.AIO_CONNECTIONS),
+            tls=scheme != "http")
+
+    return pools[host]
+
+
+async def close():
+    """Close every idle connection of the running event loop
+    """
+    for pool in loops.pop(asyncio.get_running_loop(), {}).values():
+        pool.clear()
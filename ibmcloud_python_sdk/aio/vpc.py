@@ -0,0 +1,71 @@
+from ibmcloud_python_sdk.aio.resource import AsyncResource
+from ibmcloud_python_sdk.vpc import acl
+from ibmcloud_python_sdk.vpc import baremetal
+from ibmcloud_python_sdk.vpc import floating_ip
+from ibmcloud_python_sdk.vpc import gateway
+from ibmcloud_python_sdk.vpc import geo
+from ibmcloud_python_sdk.vpc import image
+from ibmcloud_python_sdk.vpc import instance
+from ibmcloud_python_sdk.vpc import key
+from ibmcloud_python_sdk.vpc import loadbalancer
+from ibmcloud_python_sdk.vpc import security
+from ibmcloud_python_sdk.vpc import subnet
+from ibmcloud_python_sdk.vpc import volume
+from ibmcloud_python_sdk.vpc import vpc
+from ibmcloud_python_sdk.vpc import vpn
+
+
+class Acl(AsyncResource):
+    resource = acl.Acl
+
+
+class Baremetal(AsyncResource):
+    resource = baremetal.Baremetal
+
+
+class Fip(AsyncResource):
+    resource = floating_ip.Fip
+
+
+class Gateway(AsyncResource):
+    resource = gateway.Gateway
+
+
+class Geo(AsyncResource):
+    resource = geo.Geo
+
+
+class Image(AsyncResource):
+    resource = image.Image
+
+
+class Instance(AsyncResource):
+    resource = instance.Instance
+
+
+class Key(AsyncResource):
+    resource = key.Key
+
+
+class Loadbalancer(AsyncResource):
+    resource = loadbalancer.Loadbalancer
+
+
+class Security(AsyncResource):
+    resource = security.Security
+
+
+class Subnet(AsyncResource):
+    resource = subnet.Subnet
+
+
+class Volume(AsyncResource):
+    resource = volume.Volume
+
+
+class Vpc(AsyncResource):
+    resource = vpc.Vpc
+
+
+class Vpn(AsyncResource):
+    resource = vpn.Vpn
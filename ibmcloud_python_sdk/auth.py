@@ -1,12 +1,181 @@
+import copy
+import os
+import threading
+import time
 from ibmcloud_python_sdk.utils import constants
 from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.config import sdk
 from ibmcloud_python_sdk.utils import common
-from jwt import decode
 
-cfg = params()
 headers = {}
 
 
+class TokenManager():
+    """Keep an IAM token valid across the process lifetime
+
+    The token expiration is read from the JWT `exp` claim and the token is
+    renewed `margin` seconds before it expires, either on demand or by a
+    background thread when started. Concurrent callers share the same
+    in-flight refresh.
+
+    :param margin: Seconds before expiration to renew the token
+    :type margin: int, optional
+    """
+
+    def __init__(self, margin=constants.TOKEN_REFRESH_MARGIN):
+        self.margin = margin
+        self.token = None
+        self.expiration = 0
+        self.error = None
+        self.inflight = None
+        self.timer = None
+        self.lock = threading.Lock()
+
+    def _valid(self):
+        return (self.token is not None
+                and time.time() < self.expiration - self.margin)
+
+    def _expiration(self, token):
+        """Read expiration timestamp from the JWT token
+
+        :param token: IAM token with its type
+        :type token: str
+        :return: Expiration timestamp
+        :rtype: float
+        """
+        try:
+            return float(common.claims(token)["exp"])
+        except Exception:
+            return time.time() + constants.TOKEN_TTL
+
+    @property
+    def account_id(self):
+        """Account ID (BSS) of the current token, renewing it if needed
+
+        :return: Account ID
+        :rtype: str
+        """
+        return common.claims(self.get())["account"]["bss"]
+
+    def get(self):
+        """Retrieve a valid token, renewing it if needed
+
+        :return: IAM token
+        :rtype: str
+        """
+        if self._valid():
+            return self.token
+
+        return self.refresh()
+
+    def refresh(self, force=False):
+        """Renew the token, only one refresh is performed at a time
+
+        :param force: Renew even if the current token is still valid
+        :type force: bool, optional
+        :return: IAM token
+        :rtype: str
+        """
+        with self.lock:
+            if not force and self._valid():
+                return self.token
+            event = self.inflight
+            leader = event is None
+            if leader:
+                event = self.inflight = threading.Event()
+
+        if not leader:
+            event.wait()
+            if self.error is not None:
+                raise self.error
+            return self.token
+
+        try:
+            token = get_token(constants.AUTH_URL, params()["key"])
+            with self.lock:
+                self.token = token
+                self.expiration = self._expiration(token)
+                self.error = None
+        except Exception as error:
+            self.error = error
+            raise
+        finally:
+            with self.lock:
+                self.inflight = None
+            event.set()
+
+        # Follow the new expiration when the background refresh is running
+        self._schedule(running=True)
+
+        return token
+
+    def _schedule(self, delay=None, running=False):
+        """Replace the background refresh timer
+
+        :param delay: Seconds before the refresh, defaults to the token
+            expiration minus the margin
+        :type delay: float, optional
+        :param running: Only replace a running timer, the background
+            refresh isn't restarted once stopped
+        :type running: bool, optional
+        """
+        if delay is None:
+            delay = max(self.expiration - self.margin - time.time(), 1)
+        timer = threading.Timer(delay, self._background)
+        timer.daemon = True
+        with self.lock:
+            if running and self.timer is None:
+                return
+            if self.timer is not None:
+                self.timer.cancel()
+            self.timer = timer
+        timer.start()
+
+    def _background(self):
+        try:
+            self.refresh(force=True)
+        except Exception:
+            # Retry later, callers will refresh on demand meanwhile
+            self._schedule(constants.TOKEN_RETRY_DELAY, running=True)
+
+    def start(self):
+        """Renew the token in a background thread before it expires
+        """
+        if self.timer is None:
+            self.get()
+            self._schedule()
+
+    def stop(self):
+        """Stop the background refresh
+        """
+        with self.lock:
+            timer, self.timer = self.timer, None
+        if timer is not None:
+            timer.cancel()
+
+    def reset(self):
+        """Forget the current token and background refresh
+        """
+        self.stop()
+        self.token = None
+        self.expiration = 0
+        self.error = None
+        self._after_fork()
+
+    def _after_fork(self):
+        # Timers don't survive fork() and the lock could be held by another
+        # thread of the parent process, the token itself is still valid.
+        self.timer = None
+        self.inflight = None
+        self.lock = threading.Lock()
+
+
+token_manager = TokenManager()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=token_manager._after_fork)
+
+
 def decode_token():
     """Decode JWT token
 
@@ -15,11 +184,8 @@ def decode_token():
     """
     try:
         token = get_headers()["Authorization"]
-        return decode(
-            token.split(" ")[1],
-            algorithms=["RS256"],
-            options={"verify_signature": False},
-        )
+        # The memoized claims are shared, return a copy the caller owns
+        return copy.deepcopy(common.claims(token))
 
     except Exception as error:
         print("Error decoding token. {}".format(error))
@@ -63,15 +229,26 @@ def get_token(url, key):
 def get_headers():
     """Generates the headers used for authenticated HTTP request.
 
+    The Authorization header is updated every time the IAM token is
+    renewed by the token manager.
+
     :return: Dict of headers
     :rtype: dict
     """
+    token = token_manager.get()
     if not headers:
         headers["Content-Type"] = "application/json"
         headers["Accept"] = "application/json"
         headers["User-Agent"] = constants.USER_AGENT
-        headers["Authorization"] = get_token(constants.AUTH_URL, cfg["key"])
 
-        return headers
+        # Renew the token in background if configured in sdk.yaml
+        config = sdk() or {}
+        token_manager.margin = config.get("token_refresh_margin",
+                                          token_manager.margin)
+        if config.get("token_background_refresh"):
+            token_manager.start()
+
+    if headers.get("Authorization") != token:
+        headers["Authorization"] = token
 
     return headers
@@ -1,12 +1,10 @@
-import ibm_boto3
 import re
 
 from ibmcloud_python_sdk.utils.object_regions import endpoints
 from ibmcloud_python_sdk.resource import resource_instance
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.config import params
-from ibmcloud_python_sdk.auth import decode_token
-from botocore.client import Config
+from ibmcloud_python_sdk.auth import token_manager
 
 
 def _get_endpoint(**kwargs):
@@ -51,7 +49,7 @@ def cos_client(**kwargs):
         'mode': kwargs.get('mode'),
         'location': kwargs.get('location'),
         'service_instance': kwargs.get('service_instance'),
-        'account': kwargs.get('account', decode_token()['account']['bss']),
+        'account': kwargs.get('account', token_manager.account_id),
     }
     ri = resource_instance.ResourceInstance()
 
@@ -79,6 +77,10 @@ def cos_client(**kwargs):
                 if re.search(regex, instance['id']):
                     ri_info = instance
 
+        # Imported on first use, the SDKs are large and only needed here
+        import ibm_boto3
+        from botocore.client import Config
+
         client = ibm_boto3.client(
             's3',
             ibm_api_key_id=cfg["key"],
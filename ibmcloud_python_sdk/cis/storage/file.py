@@ -1,7 +1,6 @@
 from ibmcloud_python_sdk.utils import softlayer as sl
 from ibmcloud_python_sdk.utils.common import resource_error
 from ibmcloud_python_sdk.utils.common import check_args
-from SoftLayer import utils as sl_utils
 
 
 class File():
@@ -372,6 +371,7 @@ class File():
             'order': kwargs.get('order') or None
         }
 
+        sl_utils = sl.SoftLayer.utils
         _kwargs = {}
         _filter = sl_utils.NestedDict({})
         result = []
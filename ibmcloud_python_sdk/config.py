@@ -1,13 +1,93 @@
 from ibmcloud_python_sdk.utils import constants
-from os import environ, path
+from os import environ, path, stat
+import threading
 import yaml
 
+# Environment variables that influence params() and sdk() results
+PARAMS_ENV_VARS = ["IC_CONFIG_NAME", "IC_VERSION", "IC_API_KEY", "IC_REGION",
+                   "IC_GENERATION", "SL_USERNAME", "SL_API_KEY"]
+SDK_ENV_VARS = []
+
+memo = {}
+lock = threading.Lock()
+
+
+def _signature(filename, env_vars):
+    """Build the signature of a configuration source
+
+    :param filename: Configuration file path
+    :type filename: str
+    :param env_vars: Environment variables read by the loader
+    :type env_vars: list
+    :return: Signature changing when the file or the variables change
+    :rtype: tuple
+    """
+    try:
+        info = stat(filename)
+        file_sig = (info.st_ino, info.st_mtime_ns, info.st_size)
+    except OSError:
+        file_sig = None
+
+    return (filename, file_sig, tuple(environ.get(var) for var in env_vars))
+
+
+def _memoize(name, filename, env_vars, loader):
+    """Return loader() result cached until its sources change
+
+    :param name: Cache entry name
+    :type name: str
+    :param filename: Configuration file path
+    :type filename: str
+    :param env_vars: Environment variables read by the loader
+    :type env_vars: list
+    :param loader: Function loading the configuration
+    :type loader: function
+    :return: Copy of the configuration
+    :rtype: dict or bool
+    """
+    signature = _signature(filename, env_vars)
+    entry = memo.get(name)
+    if entry is None or entry[0] != signature:
+        with lock:
+            entry = memo.get(name)
+            if entry is None or entry[0] != signature:
+                value = loader(filename)
+                # Errors are not cached to let the next call retry
+                if value is None:
+                    return value
+                entry = (signature, value)
+                memo[name] = entry
+
+    if isinstance(entry[1], dict):
+        return dict(entry[1])
+
+    return entry[1]
+
+
+def clear():
+    """Drop the cached configurations
+    """
+    with lock:
+        memo.clear()
+
 
 def params():
+    """Retrieve cloud configuration from clouds.yaml or environment variables
+
+    The configuration is parsed once and cached until the file or the
+    related `IC_*` environment variables change.
+
+    :return: Cloud configuration
+    :rtype: dict
+    """
     creds = "{}/.ibmcloud/clouds.yaml".format(environ.get('HOME'))
     if "IC_CONFIG_FILE" in environ:
         creds = environ.get("IC_CONFIG_FILE")
 
+    return _memoize("params", creds, PARAMS_ENV_VARS, _load_params)
+
+
+def _load_params(creds):
     option = {}
     option["auth_url"] = constants.AUTH_URL
     option["dns_url"] = constants.DNS_URL
@@ -65,11 +145,22 @@ def params():
 
 
 def sdk():
+    """Retrieve SDK configuration from sdk.yaml
+
+    The configuration is parsed once and cached until the file changes.
+
+    :return: SDK configuration or False if not configured
+    :rtype: dict
+    """
     sdk_config = "{}/.ibmcloud/sdk.yaml".format(environ.get('HOME'))
-    config = None
     if "IC_SDK_CONFIG_FILE" in environ:
         sdk_config = environ.get("IC_SDK_CONFIG_FILE")
 
+    return _memoize("sdk", sdk_config, SDK_ENV_VARS, _load_sdk)
+
+
+def _load_sdk(sdk_config):
+    config = None
     if path.isfile(sdk_config):
         with open(sdk_config, "r") as config_file:
             try:
@@ -1,6 +1,5 @@
-import SoftLayer
-
 from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.utils import softlayer as sl
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import check_args
 
@@ -11,10 +10,10 @@ class Dns():
 
     def __init__(self):
         self.cfg = params()
-        self.client = SoftLayer.create_client_from_env(
+        self.client = sl.SoftLayer.create_client_from_env(
             username=self.cfg['cis_username'],
             api_key=self.cfg['cis_apikey'])
-        self.dns = SoftLayer.DNSManager(self.client)
+        self.dns = sl.SoftLayer.DNSManager(self.client)
 
     def create_zone(self, zone, serial=None):
         """Create a zone for the specified zone
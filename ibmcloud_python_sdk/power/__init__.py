@@ -1,13 +1,23 @@
 import re
 from ibmcloud_python_sdk.utils import constants
 from ibmcloud_python_sdk.config import params
-from ibmcloud_python_sdk.auth import decode_token
 from ibmcloud_python_sdk.resource import resource_instance
-from ibmcloud_python_sdk.auth import get_token
+from ibmcloud_python_sdk.auth import token_manager
 
-cfg = params()
-ri = resource_instance.ResourceInstance()
 power_headers = {}
+clients = {}
+
+
+def _resource_instance():
+    """Create the resource instance client on first use
+
+    :return: Resource instance client
+    :rtype: ResourceInstance
+    """
+    if "ri" not in clients:
+        clients["ri"] = resource_instance.ResourceInstance()
+
+    return clients["ri"]
 
 
 def get_power_headers(**kwargs):
@@ -24,16 +34,21 @@ def get_power_headers(**kwargs):
     """
     # Build dict of argument and assign default value when needed
     args = {
-        'region': kwargs.get('region', cfg["region"]),
-        'account': kwargs.get('account', decode_token()['account']['bss']),
+        'region': kwargs.get('region'),
+        'account': kwargs.get('account'),
         'instance': kwargs.get('instance'),
     }
 
     ri_info = None
     if not power_headers:
+        ri = _resource_instance()
         if args['instance']:
             ri_info = ri.get_resource_instance(args['instance'])
         else:
+            if not args['region']:
+                args['region'] = params()["region"]
+            if not args['account']:
+                args['account'] = token_manager.account_id
             # Automatically detect if power-iaas service exists.
             regex = "crn:v1:bluemix:public:power-iaas:{}:a/{}".format(
                 args['region'], args['account'])
@@ -50,10 +65,12 @@ def get_power_headers(**kwargs):
         power_headers["Content-Type"] = "application/json"
         power_headers["Accept"] = "application/json"
         power_headers["User-Agent"] = constants.USER_AGENT
-        power_headers["Authorization"] = get_token(
-            constants.AUTH_URL, cfg["key"])
+        power_headers["Authorization"] = token_manager.get()
         power_headers['CRN'] = ri_info
 
         return power_headers
 
+    # Keep the token up to date, it's shared with get_headers()
+    power_headers["Authorization"] = token_manager.get()
+
     return power_headers
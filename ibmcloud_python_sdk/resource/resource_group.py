@@ -3,6 +3,8 @@ import re
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.lookup import resolve
+from ibmcloud_python_sdk.utils.common import query_all
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
@@ -24,7 +26,7 @@ class ResourceGroup():
             path = "/v2/resource_groups"
 
             # Return data
-            return qw("rg", "GET", path, headers())["data"]
+            return query_all(qw, "rg", path, headers())
 
         except Exception as error:
             print("Error fetching resource groups. {}".format(error))
@@ -59,18 +61,9 @@ class ResourceGroup():
         :return: Resource group information
         :rtype: dict
         """
-        by_name = self.get_resource_group_by_name(group)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_resource_group_by_id(group)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve("resource_groups", group,
+                       self.get_resource_group_by_name,
+                       self.get_resource_group_by_id, "global")
 
     def get_resource_group_by_id(self, id):
         """Retrieve specific resource group by ID
@@ -133,7 +126,7 @@ class ResourceGroup():
             path = "/v2/resource_groups?account_id={}".format(id)
 
             # Return data
-            return qw("rg", "GET", path, headers())["data"]
+            return query_all(qw, "rg", path, headers())
 
         except Exception as error:
             print("Error fetching resource groups for account {}. {}".format(
@@ -151,7 +144,7 @@ class ResourceGroup():
             path = "/v2/quota_definitions"
 
             # Return data
-            return qw("rg", "GET", path, headers())["data"]
+            return query_all(qw, "rg", path, headers())
 
         except Exception as error:
             print("Error fetching quota_definitions. {}".format(error))
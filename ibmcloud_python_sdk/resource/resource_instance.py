@@ -2,6 +2,8 @@ import json
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.lookup import resolve
+from ibmcloud_python_sdk.utils.common import query_all
 from ibmcloud_python_sdk.utils.common import resource_error
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
@@ -103,7 +105,7 @@ class ResourceInstance():
                 path = ("/v2/resource_instances?resource_group={}"
                         "&type=service_instance".format(resource_group))
 
-            return qw("rg", "GET", path, headers())["data"]
+            return query_all(qw, "rg", path, headers())
 
         except Exception as error:
             print("Error fetching resource instances. {}".format(error))
@@ -117,19 +119,9 @@ class ResourceInstance():
         :return: Resource instance information
         :rtype: dict
         """
-        by_name = self.get_resource_instance_by_name(resource_instance)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_guid = self.get_resource_instance_by_guid(
-                        resource_instance)
-                    if "errors" in by_guid:
-                        return by_guid
-                    return by_guid
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve("resource_instances", resource_instance,
+                       self.get_resource_instance_by_name,
+                       self.get_resource_instance_by_guid, "global")
 
     def get_resource_instance_by_guid(self, guid):
         """Retrieve specific resoure instance by GUID
@@ -2,6 +2,8 @@ import json
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.lookup import resolve
+from ibmcloud_python_sdk.utils.common import query_all
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
@@ -23,7 +25,7 @@ class ResourceKey():
             path = "/v2/resource_keys"
 
             # Return data
-            return qw("rg", "GET", path, headers())["data"]
+            return query_all(qw, "rg", path, headers())
 
         except Exception as error:
             print("Error fetching resource keys. {}".format(error))
@@ -37,18 +39,8 @@ class ResourceKey():
         :return: Resource key information
         :rtype: dict
         """
-        by_name = self.get_resource_key_by_name(key)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_resource_key_by_id(key)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve("resource_keys", key, self.get_resource_key_by_name,
+                       self.get_resource_key_by_id, "global")
 
     def get_resource_key_by_id(self, id):
         """Retrieve specific resource key by ID
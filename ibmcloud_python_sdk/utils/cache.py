@@ -1,56 +1,684 @@
-from pymemcache.client import base
-from pymemcache.client import hash
+import fnmatch
+import hashlib
+import os
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
 from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import codec
+from ibmcloud_python_sdk.utils import constants
+from ibmcloud_python_sdk.utils import instrumentation
 
 
-config = sdk()
+memcached = None
+memcached_nodes = None
+memcached_pid = None
+lock = threading.Lock()
+local_cache = None
+local_settings = None
+generations = {}
+
+# Path segments identifying a resource instead of a collection
+ID_REGEXP = re.compile(r"^(?=.*[0-9])[\w:%.@-]{8,}$")
+
+
+class LocalCache():
+    """In-process LRU cache storing decoded objects
+
+    Memory is bounded by a number of entries and by the total size of the
+    raw payloads the objects were decoded from. Returned objects are shared
+    between callers and should not be modified.
+
+    :param max_entries: Maximum number of entries
+    :type max_entries: int, optional
+    :param max_size: Maximum total size of the payloads in bytes
+    :type max_size: int, optional
+    :param ttl: Default time to live of an entry in seconds
+    :type ttl: int, optional
+    """
+
+    def __init__(self, max_entries=constants.LOCAL_CACHE_ENTRIES,
+                 max_size=constants.LOCAL_CACHE_SIZE,
+                 ttl=constants.CACHE_TTL):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.ttl = ttl
+        self.size = 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """Retrieve an object and mark it as recently used
+
+        :param key: Entry key
+        :type key: str
+        :return: Decoded object or None if missing or expired
+        :rtype: dict
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                self._remove(key)
+                return None
+            self.entries.move_to_end(key)
+
+            return entry[2]
+
+    def peek(self, key):
+        """Retrieve an object even if expired and mark it as recently used
+
+        :param key: Entry key
+        :type key: str
+        :return: Decoded object, size of its payload and freshness or None
+            if missing
+        :rtype: tuple
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            self.entries.move_to_end(key)
+
+            return entry[2], entry[1], entry[0] >= time.monotonic()
+
+    def set(self, key, value, size, ttl=None):
+        """Store an object and evict the least recently used entries
+
+        :param key: Entry key
+        :type key: str
+        :param value: Decoded object
+        :type value: dict
+        :param size: Size of the raw payload
+        :type size: int
+        :param ttl: Time to live in seconds
+        :type ttl: int, optional
+        """
+        if size > self.max_size:
+            return
+
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = (expires, size, value)
+            self.size += size
+            while (len(self.entries) > self.max_entries
+                   or self.size > self.max_size):
+                self._remove(next(iter(self.entries)))
+
+    def delete(self, key):
+        """Remove an entry
+
+        :param key: Entry key
+        :type key: str
+        """
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+
+    def clear(self):
+        """Remove every entry
+        """
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def _remove(self, key):
+        self.size -= self.entries.pop(key)[1]
+
+
+def local():
+    """Retrieve the in-process cache if configured in sdk.yaml
+
+    :return: In-process cache
+    :rtype: LocalCache
+    """
+    global local_cache, local_settings
+
+    config = sdk()
+    if not config or not config.get("local_cache"):
+        return None
+
+    settings = config.get("local_cache")
+    if settings is True:
+        settings = {}
+    if local_cache is not None and local_settings == settings:
+        return local_cache
+
+    with lock:
+        if local_cache is None or local_settings != settings:
+            local_cache = LocalCache(
+                max_entries=settings.get("max_entries",
+                                         constants.LOCAL_CACHE_ENTRIES),
+                max_size=settings.get("max_size",
+                                      constants.LOCAL_CACHE_SIZE),
+                ttl=settings.get("ttl", config.get("cache_ttl",
+                                                   constants.CACHE_TTL)))
+            local_settings = settings
+
+        return local_cache
+
+
+def enabled():
+    """Check if at least one caching tier is configured
+
+    :return: Caching status
+    :rtype: bool
+    """
+    return bool(local() or client())
+
+
+def _root(path):
+    """Retrieve the collection a path belongs to, such as `/v1/subnets` for
+    `/v1/subnets/{id}/public_gateway?version=...`.
+    """
+    root = []
+    for segment in path.split("?")[0].split("/"):
+        if not segment:
+            continue
+        if ID_REGEXP.match(segment):
+            break
+        root.append(segment)
+
+    return "/{}".format("/".join(root))
+
+
+def namespace(account, conn_type, path):
+    """Build the invalidation namespace of a path
+
+    Every cached collection, item and sub-resource of the same collection
+    share the same namespace.
+
+    :param account: Account ID
+    :type account: str
+    :param conn_type: Connection type
+    :type conn_type: str
+    :param path: Query path
+    :type path: str
+    :return: Namespace
+    :rtype: str
+    """
+    return "{}:{}:{}".format(account, conn_type, _root(path))
+
+
+def related(conn_type, path):
+    """List the collections impacted by a mutation on a path
+
+    :param conn_type: Connection type
+    :type conn_type: str
+    :param path: Query path
+    :type path: str
+    :return: Paths of the impacted collections
+    :rtype: list
+    """
+    root = _root(path)
+
+    return [root] + constants.CACHE_RELATED.get(conn_type, {}).get(root, [])
+
+
+def ttl(path):
+    """Retrieve the time to live of a path from the `cache_ttl_rules` option
+    of sdk.yaml then, when the `cache_ttl_defaults` option is enabled, from
+    constants.CACHE_TTL_RULES
+
+    Rules are path patterns such as `/v1/regions*`, matched in order
+    against the path without its query string.
+
+    :param path: Query path
+    :type path: str
+    :return: Time to live in seconds, 0 if the path shouldn't be cached or
+        None if no rule matches
+    :rtype: int
+    """
+    config = sdk() or {}
+    rules = list((config.get("cache_ttl_rules") or {}).items())
+    if config.get("cache_ttl_defaults", False):
+        rules += list(constants.CACHE_TTL_RULES.items())
+    path = path.split("?")[0]
+    for pattern, value in rules:
+        if fnmatch.fnmatchcase(path, pattern):
+            return value
+
+    return None
+
+
+def _key(item_key):
+    """Make a key usable by memcached, long keys or keys containing spaces
+    are hashed.
+    """
+    if len(item_key) > constants.CACHE_KEY_LENGTH or " " in item_key:
+        return hashlib.sha1(item_key.encode("utf-8")).hexdigest()
+
+    return item_key
+
+
+def _generation(value=None):
+    """Normalize a namespace generation to bytes, a new generation is built
+    when no value is provided.
+    """
+    if value is None:
+        # Generations start from the current time to never reuse a value
+        # even if a namespace counter has been evicted from memcached.
+        value = int(time.time() * 1000)
+    if isinstance(value, bytes):
+        return value
+
+    return str(value).encode("utf-8")
+
+
+def _tag(etag):
+    """Encode an ETag to store it in a memcached envelope
+    """
+    return etag.encode("utf-8").hex().encode("utf-8") if etag else b""
+
+
+def _etag(tag):
+    """Decode an ETag read from a memcached envelope
+    """
+    return bytes.fromhex(tag.decode("utf-8")).decode("utf-8") if tag else None
+
+
+def lookup(item_key, item_namespace, item_ttl=None):
+    """Retrieve decoded object from in-process cache then from memcached
+
+    Entries stored before the last invalidation of their namespace are
+    ignored. Expired memcached entries are kept `cache_stale_ttl` more
+    seconds, the first worker looking one up gets a miss and refreshes it
+    while the others are served the stale object. Expired entries with an
+    ETag are returned with the generation to be revalidated.
+
+    :param item_key: Item key to retrieve
+    :type item_key: str
+    :param item_namespace: Namespace of the item
+    :type item_namespace: str
+    :param item_ttl: Time to live from ttl()
+    :type item_ttl: int, optional
+    :return: Decoded object or None if not cached and generation to use
+        when storing or revalidating the object, its third element is the
+        ETag to send with If-None-Match
+    :rtype: tuple
+    """
+    local_gen = generations.get(item_namespace, 0)
+    etag = stale = None
+    l1 = local()
+    if l1:
+        entry = l1.peek(item_key)
+        if entry is not None and entry[0][0] == local_gen:
+            (_, value, tag), size, fresh = entry
+            if fresh:
+                return value, None
+            if tag:
+                etag, stale = tag, (None, value, size)
+            else:
+                l1.delete(item_key)
+
+    remote_gen = None
+    if client():
+        items = get_items([_key(item_namespace), _key(item_key)])
+        remote_gen = items.get(_key(item_namespace))
+        item = items.get(_key(item_key))
+        if remote_gen is not None:
+            remote_gen = _generation(remote_gen)
+        if remote_gen is not None and item is not None:
+            gen, _, item = item.partition(b":")
+            expires, _, item = item.partition(b":")
+            tag, _, payload = item.partition(b":")
+            if gen == remote_gen and expires.isdigit():
+                # A stale entry is served while a single worker, holding
+                # the lease, refreshes it
+                fresh = int(expires) > time.time()
+                if fresh or not _lease(item_key):
+                    value = _decode(item_key, payload)
+                    if value is not None:
+                        record = instrumentation.active()
+                        if record and not fresh:
+                            record.cache = "stale"
+                        if l1 and fresh:
+                            l1.set(item_key, (local_gen, value, _etag(tag)),
+                                   len(payload), item_ttl)
+                        return value, None
+                elif tag:
+                    etag, stale = _etag(tag), (payload, None, len(payload))
+
+    return None, (local_gen, remote_gen, etag, stale)
+
+
+def store(item_key, item_namespace, generation, item_value, data,
+          item_ttl=None, etag=None):
+    """Store object into every configured caching tier
+
+    :param item_key: Item key to store
+    :type item_key: str
+    :param item_namespace: Namespace of the item
+    :type item_namespace: str
+    :param generation: Generation returned by lookup()
+    :type generation: tuple
+    :param item_value: Raw payload
+    :type item_value: bytes
+    :param data: Decoded payload
+    :type data: dict
+    :param item_ttl: Time to live from ttl(), defaults to the time to live
+        of each tier
+    :type item_ttl: int, optional
+    :param etag: ETag of the response
+    :type etag: str, optional
+    """
+    local_gen, remote_gen = generation[:2]
+    l1 = local()
+    if l1 and generations.get(item_namespace, 0) == local_gen:
+        l1.set(item_key, (local_gen, data, etag), len(item_value), item_ttl)
+
+    if client():
+        if remote_gen is None:
+            # Initialize the namespace, add() keeps any concurrent value
+            add_item(_key(item_namespace), _generation())
+            remote_gen = get_item(_key(item_namespace))
+            if remote_gen is None:
+                return
+            remote_gen = _generation(remote_gen)
+        _store_remote(item_key, remote_gen, codec.encode(data, item_value),
+                      item_ttl, etag)
+
+
+def revalidate(item_key, item_namespace, generation, item_ttl=None):
+    """Refresh an expired entry after a 304 Not Modified response
+
+    The cached payload is stored again with a new expiration, nothing is
+    downloaded from the API.
+
+    :param item_key: Item key to refresh
+    :type item_key: str
+    :param item_namespace: Namespace of the item
+    :type item_namespace: str
+    :param generation: Generation returned by lookup()
+    :type generation: tuple
+    :param item_ttl: Time to live from ttl()
+    :type item_ttl: int, optional
+    :return: Decoded object or None if the entry can't be decoded anymore
+    :rtype: dict
+    """
+    local_gen, remote_gen, etag, (payload, value, size) = generation
+    if value is None:
+        value = _decode(item_key, payload)
+        if value is None:
+            return None
+
+    l1 = local()
+    if l1 and generations.get(item_namespace, 0) == local_gen:
+        l1.set(item_key, (local_gen, value, etag), size, item_ttl)
+
+    if client() and remote_gen is not None:
+        if payload is None:
+            payload = codec.encode(value)
+        _store_remote(item_key, remote_gen, payload, item_ttl, etag)
+
+    return value
+
+
+def _store_remote(item_key, remote_gen, value, item_ttl, etag):
+    """Store an encoded value into memcached within its envelope made of
+    the generation, the expiration, the ETag and the value
+    """
+    config = sdk() or {}
+    if item_ttl is None:
+        item_ttl = config.get("cache_ttl", constants.CACHE_TTL)
+    expires = str(int(time.time() + item_ttl)).encode("utf-8")
+    expire = item_ttl + config.get("cache_stale_ttl",
+                                   constants.CACHE_STALE_TTL)
+
+    # Values larger than the memcached item size are split into chunks
+    # stored before the manifest referencing them
+    size = config.get("memcached_item_size", constants.CACHE_ITEM_SIZE)
+    if len(value) > size:
+        token = uuid.uuid4().hex[:8]
+        chunks = {}
+        for offset in range(0, len(value), size):
+            chunk_key = "{}:{}:{}".format(item_key, token, len(chunks))
+            chunks[_key(chunk_key)] = value[offset:offset + size]
+        set_items(chunks, expire)
+        value = codec.manifest(token, len(chunks))
+
+    set_item(_key(item_key),
+             b":".join([remote_gen, expires, _tag(etag), value]), expire)
+
+
+def _decode(item_key, value):
+    """Decode a value read from memcached, reassembling chunked values
+
+    :param item_key: Item key
+    :type item_key: str
+    :param value: Encoded value or manifest
+    :type value: bytes
+    :return: Decoded object or None if it can't be decoded
+    :rtype: dict
+    """
+    try:
+        manifest = codec.chunks(value)
+        if manifest is not None:
+            token, count = manifest
+            keys = [_key("{}:{}:{}".format(item_key, token, index))
+                    for index in range(count)]
+            items = get_items(keys)
+            if len(items) != count:
+                return None
+            value = b"".join(items[key] for key in keys)
+
+        return codec.decode(value)
+    except Exception as error:
+        print("Error decoding item from memcached. {}".format(error))
+        return None
+
+
+def _lease(item_key):
+    """Acquire the right to refresh a stale entry
+
+    :param item_key: Item key to refresh
+    :type item_key: str
+    :return: True if the lease has been acquired
+    :rtype: bool
+    """
+    try:
+        return client().add(_key("lease:{}".format(item_key)), b"1",
+                            expire=constants.CACHE_LEASE_TTL, noreply=False)
+    except Exception as error:
+        print("Error acquiring lease from memcached. {}".format(error))
+        reset()
+        return True
+
+
+def invalidate(account, conn_type, path):
+    """Invalidate cached entries impacted by a mutation
+
+    The namespace of the path and the related namespaces defined in
+    constants.CACHE_RELATED are invalidated in every caching tier.
+
+    :param account: Account ID
+    :type account: str
+    :param conn_type: Connection type
+    :type conn_type: str
+    :param path: Path of the mutating query
+    :type path: str
+    """
+    for root in related(conn_type, path):
+        item_namespace = namespace(account, conn_type, root)
+        with lock:
+            generations[item_namespace] = (
+                generations.get(item_namespace, 0) + 1)
+
+        if client():
+            key = _key(item_namespace)
+            try:
+                if client().incr(key, 1) is None:
+                    client().set(key, _generation(), expire=0)
+            except Exception as error:
+                print("Error invalidating memcached namespace. {}".format(
+                    error))
+                reset()
+
+
+def _nodes(config):
+    """Parse memcached nodes from sdk.yaml configuration
+
+    :param config: SDK configuration
+    :type config: dict
+    :return: List of (host, port) tuples
+    :rtype: tuple
+    """
+    nodes = []
+    for node in config.get("memcached") or []:
+        host, port = node.split(":")
+        nodes.append((host, int(port)))
+
+    return tuple(nodes)
 
 
 def client():
-    """Create and configure memcached client
+    """Retrieve the process wide memcached client
+
+    The client is created on first use and rebuilt when the configured
+    nodes change or after a fork().
 
     :return: memcached client
     :rtype: map
     """
-    if config:
-        # Check if memcached is configured in sdk.yaml file
-        if config.get("memcached") and len(config.get("memcached")) > 0:
-            cache = []
-            for node in config.get("memcached"):
-                cache.append([node.split(":")[0], node.split(":")[1]])
+    global memcached, memcached_nodes, memcached_pid
+
+    config = sdk()
+    if not config:
+        return False
 
-            if len(config.get("memcached")) > 1:
-                nodes = map(lambda x: (x[0], int(x[1])), cache)
+    # Check if memcached is configured in sdk.yaml file
+    nodes = _nodes(config)
+    if not nodes:
+        return False
 
-                return hash.HashClient(nodes)
+    if (memcached is not None and memcached_nodes == nodes
+            and memcached_pid == os.getpid()):
+        return memcached
 
-            node = config.get("memcached")[0]
-            node = (node.split(":")[0], int(node.split(":")[1]))
+    with lock:
+        if (memcached is None or memcached_nodes != nodes
+                or memcached_pid != os.getpid()):
+            from pymemcache.client import base
+            from pymemcache.client import hash
 
-            return base.Client(node)
+            timeout = config.get("memcached_timeout",
+                                 constants.CACHE_TIMEOUT)
+            if len(nodes) > 1:
+                memcached = hash.HashClient(nodes, use_pooling=True,
+                                            connect_timeout=timeout,
+                                            timeout=timeout)
+            else:
+                memcached = base.PooledClient(nodes[0],
+                                              connect_timeout=timeout,
+                                              timeout=timeout)
+            memcached_nodes = nodes
+            memcached_pid = os.getpid()
+
+        return memcached
+
+
+def reset():
+    """Drop the memcached client, a new one is created on next use
+    """
+    global memcached, memcached_nodes, memcached_pid
 
-    return False
+    with lock:
+        if memcached is not None and memcached_pid == os.getpid():
+            try:
+                memcached.close()
+            except Exception:
+                pass
+        memcached = None
+        memcached_nodes = None
+        memcached_pid = None
 
 
 def get_item(item_key):
     """Retrieve object from memcache
 
+    A failing memcached server is reported as a cache miss.
+
     :param item_key: Item key to retrieve
     :type item_key: str
     :return: Item value
     :rtype: str
     """
-    return client().get(item_key)
+    try:
+        return client().get(item_key)
+    except Exception as error:
+        print("Error retrieving item from memcached. {}".format(error))
+        reset()
+        return None
+
+
+def get_items(item_keys):
+    """Retrieve several objects from memcached in a single round trip
+
+    :param item_keys: Item keys to retrieve
+    :type item_keys: list
+    :return: Found items by key
+    :rtype: dict
+    """
+    try:
+        return client().get_many(item_keys)
+    except Exception as error:
+        print("Error retrieving items from memcached. {}".format(error))
+        reset()
+        return {}
+
+
+def set_items(items, expire):
+    """Store several objects into memcached in a single round trip
+
+    :param items: Item values by key
+    :type items: dict
+    :param expire: Time to live in seconds
+    :type expire: int
+    """
+    try:
+        client().set_many(items, expire=expire)
+    except Exception as error:
+        print("Error storing items into memcached. {}".format(error))
+        reset()
+
+
+def add_item(item_key, item_value):
+    """Store object into memcached only if it doesn't exist yet
+
+    :param item_key: Item key to store
+    :type item_key: str
+    :param item_value: Item value to store
+    :type item_value: str
+    """
+    try:
+        client().add(item_key, item_value, expire=0, noreply=False)
+    except Exception as error:
+        print("Error storing item into memcached. {}".format(error))
+        reset()
 
 
-def set_item(item_key, item_value):
+def set_item(item_key, item_value, expire=None):
     """Store object into memcached
 
     :param item_key: Item key to store
     :type item_key: str
     :param item_value: Item value to store
     :type item_value: str
+    :param expire: Time to live in seconds, defaults to `cache_ttl`
+    :type expire: int, optional
     """
+    config = sdk()
     if config:
-        # Set expire to 60 secondes if not defined in sdk.yaml
-        client().set(item_key, item_value, expire=config.get("cache_ttl", 60))
+        if expire is None:
+            # Set expire to 60 secondes if not defined in sdk.yaml
+            expire = config.get("cache_ttl", constants.CACHE_TTL)
+        try:
+            client().set(item_key, item_value, expire=expire)
+        except Exception as error:
+            print("Error storing item into memcached. {}".format(error))
+            reset()
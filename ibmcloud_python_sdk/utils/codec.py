@@ -0,0 +1,154 @@
+import json
+import zlib
+from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import constants
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# Cached values start with a header made of the format version, the
+# serialization format and the compression algorithm. Values with an
+# unknown header are handled as cache misses.
+VERSION = 1
+CHUNKS = 0
+JSON = 1
+MSGPACK = 2
+NONE = 0
+ZLIB = 1
+ZSTD = 2
+
+FORMATS = {"json": JSON, "msgpack": MSGPACK}
+COMPRESSIONS = {"none": NONE, "zlib": ZLIB, "zstd": ZSTD}
+
+
+def _header(value_format, compression):
+    return bytes([VERSION, value_format, compression])
+
+
+def settings():
+    """Read the codec settings from sdk.yaml
+
+    The `cache_format` option is either `json` *(decoded with orjson when
+    installed)* or `msgpack`, the `cache_compression` option is either
+    `zlib`, `zstd` or `none` and is applied to values larger than
+    `cache_compress_threshold` bytes. Formats and algorithms whose package
+    isn't installed fall back to json and zlib.
+
+    :return: Format, compression and threshold
+    :rtype: tuple
+    """
+    config = sdk() or {}
+    value_format = FORMATS.get(config.get("cache_format"), JSON)
+    if value_format == MSGPACK and msgpack is None:
+        value_format = JSON
+    compression = COMPRESSIONS.get(config.get("cache_compression"), ZLIB)
+    if compression == ZSTD and zstandard is None:
+        compression = ZLIB
+
+    return (value_format, compression,
+            config.get("cache_compress_threshold",
+                       constants.CACHE_COMPRESS_THRESHOLD))
+
+
+def encode(data, raw=None):
+    """Serialize and compress an object to store it in cache
+
+    :param data: Decoded object
+    :type data: dict
+    :param raw: JSON payload the object was decoded from, reused instead of
+        serializing the object again when the format is JSON
+    :type raw: bytes, optional
+    :return: Encoded value with its header
+    :rtype: bytes
+    """
+    value_format, compression, threshold = settings()
+    if value_format == MSGPACK:
+        body = msgpack.packb(data, use_bin_type=True)
+    elif raw is not None:
+        body = raw
+    elif orjson is not None:
+        body = orjson.dumps(data)
+    else:
+        body = json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+    if len(body) <= threshold:
+        compression = NONE
+    elif compression == ZSTD:
+        body = zstandard.ZstdCompressor().compress(body)
+    elif compression == ZLIB:
+        body = zlib.compress(body, 1)
+
+    return _header(value_format, compression) + body
+
+
+def decode(value):
+    """Decompress and deserialize a value read from cache
+
+    :param value: Encoded value with its header
+    :type value: bytes
+    :return: Decoded object
+    :rtype: dict
+    :raise ValueError: Unknown header or missing package
+    """
+    if len(value) < 3 or value[0] != VERSION:
+        raise ValueError("Unknown cache value version")
+    value_format, compression = value[1], value[2]
+    body = value[3:]
+
+    if compression == ZLIB:
+        body = zlib.decompress(body)
+    elif compression == ZSTD and zstandard is not None:
+        body = zstandard.ZstdDecompressor().decompress(body)
+    elif compression != NONE:
+        raise ValueError("Unsupported cache value compression")
+
+    if value_format == JSON:
+        if orjson is not None:
+            return orjson.loads(body)
+        return json.loads(body.decode("utf-8"))
+    if value_format == MSGPACK and msgpack is not None:
+        return msgpack.unpackb(body, raw=False)
+
+    raise ValueError("Unsupported cache value format")
+
+
+def manifest(token, count):
+    """Build the value referencing the chunks of a large value
+
+    :param token: Unique token of the chunks
+    :type token: str
+    :param count: Number of chunks
+    :type count: int
+    :return: Manifest value
+    :rtype: bytes
+    """
+    return _header(CHUNKS, NONE) + "{}:{}".format(token, count).encode()
+
+
+def chunks(value):
+    """Read a manifest value
+
+    :param value: Value read from cache
+    :type value: bytes
+    :return: Token and number of chunks or None if the value isn't a
+        manifest
+    :rtype: tuple
+    """
+    if value[:3] != _header(CHUNKS, NONE):
+        return None
+    token, _, count = value[3:].decode().partition(":")
+
+    return token, int(count)
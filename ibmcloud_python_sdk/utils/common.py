@@ -1,9 +1,70 @@
 import base64
-import http.client
+import contextvars
+import functools
 import json
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit
 from jwt import decode
 from ibmcloud_python_sdk.config import params
+from ibmcloud_python_sdk.config import sdk
 from ibmcloud_python_sdk.utils import cache
+from ibmcloud_python_sdk.utils import constants
+from ibmcloud_python_sdk.utils import instrumentation
+from ibmcloud_python_sdk.utils import pool
+from ibmcloud_python_sdk.utils import ratelimit
+from ibmcloud_python_sdk.utils import retry
+from ibmcloud_python_sdk.utils import singleflight
+
+# Map connection types to the configuration option holding the host
+HOSTS = {
+    "iaas": "is_url",
+    "rg": "rg_url",
+    "auth": "auth_url",
+    "dns": "dns_url",
+    "em": "em_url",
+    "sl": "sl_url",
+    "power": "pi_url",
+    "gc": "gc_url",
+}
+
+MUTATING_METHODS = ["POST", "PUT", "PATCH", "DELETE"]
+
+# Function sending the queries instead of the connection pool, such as the
+# asyncio client replaying the responses it fetched. Called with the
+# connection type, host, method, path, payload and headers, it returns the
+# HTTP response and the response body.
+transport = contextvars.ContextVar("transport", default=None)
+
+# Collections merged by query_all() while a name is resolved, their names
+# are indexed by utils.lookup
+listings = contextvars.ContextVar("listings", default=None)
+
+
+@functools.lru_cache(maxsize=constants.TOKEN_CLAIMS_ENTRIES)
+def claims(token):
+    """Decode the claims of a JWT token
+
+    Tokens are renewed hourly, the claims are memoized per token to keep
+    the decoding out of the query path. The returned dict is shared by
+    every caller and must not be modified.
+
+    :param token: IAM token with its type
+    :type token: str
+    :return: Token claims
+    :rtype: dict
+    """
+    return decode(token.split(" ")[1], algorithms=["RS256"],
+                  options={"verify_signature": False})
+
+
+@functools.lru_cache(maxsize=constants.TOKEN_CLAIMS_ENTRIES)
+def _encoded_account(token):
+    # Encode BSS ID to base64
+    bss = claims(token)["account"]["bss"]
+    encoded = base64.b64encode(bss.encode("utf-8"))
+
+    # Returns base64 string
+    return encoded.decode()
 
 
 def _account_id(headers):
@@ -16,14 +77,7 @@ def _account_id(headers):
     """
     auth = headers.get("Authorization")
     if auth:
-        # Split the Bearer token and decode the JWT
-        jwt = decode(auth.split(" ")[1], verify=False)
-
-        # Encode BSS ID to base64
-        encoded = base64.b64encode(jwt["account"]["bss"].encode("utf-8"))
-
-        # Returns base64 string
-        return encoded.decode()
+        return _encoded_account(auth)
 
 
 def query_wrapper(conn_type, method, path, headers=None, payload=None):
@@ -46,57 +100,337 @@ def query_wrapper(conn_type, method, path, headers=None, payload=None):
     :rtype: dict
     """
     cfg = params()
-    timeout = cfg["http_timeout"]
-
-    if conn_type == "iaas":
-        conn = http.client.HTTPSConnection(cfg["is_url"], timeout=timeout)
-    elif conn_type == "rg":
-        conn = http.client.HTTPSConnection(cfg["rg_url"], timeout=timeout)
-    elif conn_type == "auth":
-        conn = http.client.HTTPSConnection(cfg["auth_url"], timeout=timeout)
-    elif conn_type == "dns":
-        conn = http.client.HTTPSConnection(cfg["dns_url"], timeout=timeout)
-    elif conn_type == "em":
-        conn = http.client.HTTPSConnection(cfg["em_url"], timeout=timeout)
-    elif conn_type == "sl":
+
+    if conn_type not in HOSTS:
+        raise ValueError("Unknown connection type: {}".format(conn_type))
+
+    if conn_type == "sl":
         if headers and cfg["cis_username"] and cfg["cis_apikey"]:
             header = base64.encodebytes(
                 ('%s:%s' % (cfg["cis_username"], cfg["cis_apikey"]))
                 .encode('utf8')).decode('utf8').replace('\n', '')
             headers["Authorization"] = "Basic {}".format(header)
-        conn = http.client.HTTPSConnection(cfg["sl_url"], timeout=timeout)
-    elif conn_type == "power":
-        conn = http.client.HTTPSConnection(cfg["pi_url"], timeout=timeout)
-    elif conn_type == "gc":
-        conn = http.client.HTTPSConnection(cfg["gc_url"], timeout=timeout)
-
-    if cache.client():
-        if method == "GET" and conn_type != "auth":
-            obj = "{}{}".format(_account_id(headers), path)
-            item = cache.get_item(obj)
-            if item is not None:
-                return {"data": json.loads(item.decode("utf-8"))}
-            else:
-                pass
 
-    conn.request(method, path, payload, headers)
+    if instrumentation.hooks:
+        return instrumentation.observe(
+            conn_type, method, path,
+            lambda: _dispatch(cfg, conn_type, method, path, headers,
+                              payload))
+
+    return _dispatch(cfg, conn_type, method, path, headers, payload)
 
-    # Get and read response data
-    res = conn.getresponse()
-    data = res.read()
+
+def _dispatch(cfg, conn_type, method, path, headers, payload):
+    """Execute HTTP query, coalescing identical GET, see query_wrapper()
+    """
+    # Identical concurrent GET share the same query and decoded result.
+    # Queries are identified by credentials rather than by account to
+    # avoid decoding the token, responses replayed to a single caller
+    # aren't shared.
+    if (method == "GET" and conn_type != "auth"
+            and getattr(transport.get(), "shared", True)):
+        key = (conn_type, (headers or {}).get("Authorization"), path)
+        return singleflight.group.do(
+            key, lambda: _query(cfg, conn_type, method, path, headers,
+                                payload))
+
+    return _query(cfg, conn_type, method, path, headers, payload)
+
+
+def _query(cfg, conn_type, method, path, headers, payload):
+    """Execute HTTP query through the caching tiers, see query_wrapper()
+    """
+    obj = None
+    record = instrumentation.active()
+    caching = conn_type != "auth" and cache.enabled()
+    ttl = cache.ttl(path) if caching and method == "GET" else 0
+    if ttl != 0:
+        start = time.perf_counter() if record else None
+        account = _account_id(headers)
+        obj = "{}{}".format(account, path)
+        namespace = cache.namespace(account, conn_type, path)
+        item, generation = cache.lookup(obj, namespace, ttl)
+        if record:
+            record.add("cache", time.perf_counter() - start)
+            # Stale entries are reported by lookup()
+            record.cache = record.cache or ("hit" if item is not None
+                                            else "miss")
+        if item is not None:
+            return {"data": item}
+
+    etag = generation[2] if obj is not None else None
+    if etag:
+        # Revalidate the expired entry instead of downloading it again
+        conditional = dict(headers or {})
+        conditional["If-None-Match"] = etag
+        res, data = _send(cfg, conn_type, method, path, payload,
+                          conditional)
+        if res.status == 304:
+            item = cache.revalidate(obj, namespace, generation, ttl)
+            if item is not None:
+                if record:
+                    record.cache = "revalidated"
+                return {"data": item, "response": res}
+            res, data = _send(cfg, conn_type, method, path, payload,
+                              headers)
+    else:
+        res, data = _send(cfg, conn_type, method, path, payload, headers)
+
+    # Evict cached collections and items impacted by the mutation
+    if caching and method in MUTATING_METHODS:
+        cache.invalidate(_account_id(headers), conn_type, path)
 
     if not data:
         # Return empty data and HTTP response this is mostly
         # due to DELETE request which doesn't return any data
         return {"data": None, "response": res}
     else:
-        if cache.client():
-            obj = "{}{}".format(_account_id(headers), path)
-            # Store item into caching system
-            cache.set_item(obj, data)
+        if record:
+            record.size = len(data)
+            start = time.perf_counter()
+        try:
+            result = json.loads(data)
+        except ValueError:
+            # Error pages sent by proxies and load balancers aren't JSON
+            if res.status < 400:
+                raise
+            result = {"errors": [{"code": res.status,
+                                  "message": res.reason}]}
+        if record:
+            record.add("decode", time.perf_counter() - start)
+
+        # Store successful responses into caching system
+        if obj is not None and res.status < 300:
+            start = time.perf_counter() if record else None
+            cache.store(obj, namespace, generation, data, result, ttl,
+                        res.getheader("ETag"))
+            if record:
+                record.add("store", time.perf_counter() - start)
 
         # Return data and HTTP response
-        return {"data": json.loads(data), "response": res}
+        return {"data": result, "response": res}
+
+
+def _send(cfg, conn_type, method, path, payload, headers):
+    """Send HTTP query through the current transport
+
+    :return: HTTP response and response body
+    :rtype: tuple
+    """
+    send = transport.get() or send_http
+    res, data = send(conn_type, _host(cfg, conn_type), method, path, payload,
+                     headers)
+
+    # Attempts are counted by send_http(), other transports send once
+    record = instrumentation.active()
+    if record and not record.attempts:
+        record.attempts = 1
+
+    return res, data
+
+
+def _host(cfg, conn_type):
+    """Retrieve the host of a connection type
+
+    The `endpoint` option of sdk.yaml overrides the hosts from the cloud
+    configuration, either with a URL used by every connection type or with
+    a dict of URLs by connection type with an optional `default` key, such
+    as `http://127.0.0.1:8080` to reach a local server.
+
+    :param cfg: Cloud configuration
+    :type cfg: dict
+    :param conn_type: Connection type
+    :type conn_type: str
+    :return: Host optionally prefixed by its URL scheme
+    :rtype: str
+    """
+    config = sdk() or {}
+    endpoint = config.get("endpoint")
+    if isinstance(endpoint, dict):
+        endpoint = endpoint.get(conn_type, endpoint.get("default"))
+
+    return endpoint or cfg[HOSTS[conn_type]]
+
+
+def send_http(conn_type, host, method, path, payload, headers):
+    """Send HTTP query through a pooled keep-alive connection
+
+    Rate limits are applied and transient failures are retried.
+
+    :param conn_type: Connection type
+    :type conn_type: str
+    :param host: API host
+    :type host: str
+    :param method: HTTP method
+    :type method: str
+    :param path: Path of the query
+    :type path: str
+    :param payload: Payload of the query
+    :type payload: str
+    :param headers: Headers of the query
+    :type headers: dict
+    :return: HTTP response and response body
+    :rtype: tuple
+    """
+    conn = pool.get_pool(host, timeout=params()["http_timeout"])
+    record = instrumentation.active()
+
+    def send():
+        if record:
+            record.attempts += 1
+            start = time.perf_counter()
+            ratelimit.wait(conn_type, host)
+            record.add("ratelimit", time.perf_counter() - start)
+        else:
+            ratelimit.wait(conn_type, host)
+        return conn.request(method, path, payload, headers)
+
+    return retry.call(send, method)
+
+
+def _with_limit(path, limit):
+    """Add the page size to a collection path
+    """
+    if not limit:
+        return path
+    separator = "&" if "?" in path else "?"
+
+    return "{}{}limit={}".format(path, separator, limit)
+
+
+def _next_path(path, data):
+    """Build the path of the next page from a collection page
+
+    VPC collections provide an absolute `next.href` URL while Resource
+    Controller collections provide a `next_url` path. Query parameters from
+    the original path missing from the next link, such as version and
+    generation, are kept.
+
+    :param path: Path of the current page
+    :type path: str
+    :param data: Current page
+    :type data: dict
+    :return: Path of the next page or None if it's the last page
+    :rtype: str
+    """
+    href = None
+    if isinstance(data.get("next"), dict):
+        href = data["next"].get("href")
+    elif data.get("next_url"):
+        href = data["next_url"]
+    if not href:
+        return None
+
+    url = urlsplit(href)
+    query = parse_qsl(url.query, keep_blank_values=True)
+    names = set(name for name, _ in query)
+    for name, value in parse_qsl(urlsplit(path).query,
+                                 keep_blank_values=True):
+        if name not in names:
+            query.append((name, value))
+
+    return "{}?{}".format(url.path, urlencode(query))
+
+
+def paginate(query, conn_type, path, headers=None, limit=None):
+    """Retrieve a collection page by page following the next links
+
+    :param query: Function executing the query, mostly query_wrapper
+    :type query: function
+    :param conn_type: Define which URL should be used for the connection
+    :type conn_type: str
+    :param path: Path of the collection
+    :type path: str
+    :param headers: Headers to send with the queries
+    :type headers: dict, optional
+    :param limit: Number of resources per page
+    :type limit: int, optional
+    :return: Generator of pages, an error page ends the iteration
+    :rtype: generator
+    """
+    path = _with_limit(path, limit)
+    while path:
+        data = query(conn_type, "GET", path, headers)["data"]
+        yield data
+
+        if not isinstance(data, dict) or "errors" in data:
+            return
+
+        next_path = _next_path(path, data)
+        if next_path == path:
+            return
+        path = next_path
+
+
+def query_all(query, conn_type, path, headers=None, limit=None):
+    """Retrieve every page of a collection and merge them
+
+    :param query: Function executing the query, mostly query_wrapper
+    :type query: function
+    :param conn_type: Define which URL should be used for the connection
+    :type conn_type: str
+    :param path: Path of the collection
+    :type path: str
+    :param headers: Headers to send with the queries
+    :type headers: dict, optional
+    :param limit: Number of resources per page
+    :type limit: int, optional
+    :return: First page containing the resources of every page
+    :rtype: dict
+    """
+    result = None
+    for page in paginate(query, conn_type, path, headers, limit):
+        if not isinstance(page, dict) or "errors" in page:
+            return page
+
+        if result is None:
+            result = dict(page)
+            keys = [key for key, value in page.items()
+                    if isinstance(value, list)]
+            for key in keys:
+                result[key] = list(page[key])
+        else:
+            for key in keys:
+                result[key].extend(page.get(key, []))
+
+    result.pop("next", None)
+    result.pop("next_url", None)
+
+    collected = listings.get()
+    if collected is not None:
+        collected.append(result)
+
+    return result
+
+
+def iter_resources(query, conn_type, path, headers=None, limit=None):
+    """Retrieve the resources of a collection one by one, fetching the
+    pages on demand to keep memory usage flat
+
+    :param query: Function executing the query, mostly query_wrapper
+    :type query: function
+    :param conn_type: Define which URL should be used for the connection
+    :type conn_type: str
+    :param path: Path of the collection
+    :type path: str
+    :param headers: Headers to send with the queries
+    :type headers: dict, optional
+    :param limit: Number of resources per page
+    :type limit: int, optional
+    :return: Generator of resources, an error payload is yielded and ends
+        the iteration if a page can't be retrieved
+    :rtype: generator
+    """
+    for page in paginate(query, conn_type, path, headers, limit):
+        if not isinstance(page, dict) or "errors" in page:
+            yield page
+            return
+
+        for key, value in page.items():
+            if isinstance(value, list):
+                for resource in value:
+                    yield resource
+                break
 
 
 def check_args(arguments, **kwargs):
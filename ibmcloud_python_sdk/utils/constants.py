@@ -12,3 +12,60 @@ COS_DOMAIN = "cloud-object-storage.appdomain.cloud"
 GC_URL = "globalcatalog.cloud.ibm.com"
 HTTP_TIMEOUT = 60
 USER_AGENT = "IBM Cloud Python SDK"
+POOL_SIZE = 10
+POOL_IDLE_TIMEOUT = 30
+AIO_CONNECTIONS = 100
+AIO_WORKERS = 100
+MAX_WORKERS = 32
+RETRY_MAX_ATTEMPTS = 4
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_MAX_BACKOFF = 30
+RETRY_DEADLINE = 120
+TOKEN_TTL = 3600
+TOKEN_REFRESH_MARGIN = 300
+TOKEN_RETRY_DELAY = 30
+TOKEN_CLAIMS_ENTRIES = 16
+CACHE_TIMEOUT = 1
+CACHE_TTL = 60
+CACHE_STALE_TTL = 30
+CACHE_LEASE_TTL = 10
+LOCAL_CACHE_ENTRIES = 1024
+LOCAL_CACHE_SIZE = 64 * 1024 * 1024
+CACHE_KEY_LENGTH = 200
+CACHE_COMPRESS_THRESHOLD = 16 * 1024
+# Leave room for the key and the memcached item overhead below 1MB
+CACHE_ITEM_SIZE = 1000 * 1000
+# Time to live in seconds of the cached responses by path pattern, 0
+# disables caching. Only applied when the cache_ttl_defaults option is
+# enabled.
+CACHE_TTL_RULES = {
+    "/v1/regions*": 86400,
+    "/v1/operating_systems*": 86400,
+    "/v1/instance/profiles*": 86400,
+    "/v1/volume/profiles*": 86400,
+    "/v1/bare_metal_server/profiles*": 86400,
+    "/api/v1*": 86400,
+    "/v1/instances*": 10,
+    "/pcloud/v1/tasks/*": 0,
+}
+# Collections whose cached content changes when another collection is
+# mutated, e.g. creating an instance attaches volumes and floating IPs.
+CACHE_RELATED = {
+    "iaas": {
+        "/v1/instances": ["/v1/volumes", "/v1/floating_ips", "/v1/subnets",
+                          "/v1/security_groups"],
+        "/v1/bare_metal_servers": ["/v1/floating_ips", "/v1/subnets",
+                                   "/v1/security_groups"],
+        "/v1/floating_ips": ["/v1/instances", "/v1/bare_metal_servers"],
+        "/v1/volumes": ["/v1/instances"],
+        "/v1/vpcs": ["/v1/network_acls", "/v1/security_groups"],
+        "/v1/subnets": ["/v1/vpcs", "/v1/network_acls",
+                        "/v1/public_gateways"],
+        "/v1/network_acls": ["/v1/subnets"],
+        "/v1/public_gateways": ["/v1/subnets"],
+        "/v1/security_groups": ["/v1/instances", "/v1/bare_metal_servers"],
+        "/v1/load_balancers": ["/v1/subnets"],
+        "/v1/vpn_gateways": ["/v1/subnets"],
+    },
+}
+NAME_INDEX_TTL = 300
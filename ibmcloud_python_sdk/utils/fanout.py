@@ -0,0 +1,110 @@
+import contextvars
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import constants
+
+
+executor = None
+executor_pid = None
+lock = threading.Lock()
+worker = threading.local()
+
+
+def get_executor():
+    """Retrieve the process wide thread pool
+
+    The number of threads could be configured with the `max_workers` option
+    from the sdk.yaml file. The pool is rebuilt after a fork().
+
+    :return: Thread pool
+    :rtype: ThreadPoolExecutor
+    """
+    global executor, executor_pid
+
+    if executor is not None and executor_pid == os.getpid():
+        return executor
+
+    with lock:
+        if executor is None or executor_pid != os.getpid():
+            config = sdk() or {}
+            executor = ThreadPoolExecutor(
+                max_workers=config.get("max_workers", constants.MAX_WORKERS),
+                thread_name_prefix="ibmcloud-sdk")
+            executor_pid = os.getpid()
+
+        return executor
+
+
+def _run(func, item):
+    worker.active = True
+
+    return func(item)
+
+
+def _error(error):
+    return {"errors": [{"code": "exception",
+                        "message": "{}: {}".format(type(error).__name__,
+                                                   error)}]}
+
+
+def map_concurrent(func, items, max_workers=None):
+    """Call a function for each item from the shared thread pool
+
+    Queries are sent through the pooled connections, their number per host
+    is bounded by the `concurrency` option from the sdk.yaml file. An
+    exception raised for an item is returned as an error payload for this
+    item only.
+
+    :param func: Function to call with each item, such as
+        `Instance().get_instance_interfaces`
+    :type func: function
+    :param items: Items to pass to the function, such as resource IDs
+    :type items: list
+    :param max_workers: Maximum number of items processed at the same time
+        by this call
+    :type max_workers: int, optional
+    :return: Results in the same order as the items
+    :rtype: list
+    """
+    items = list(items)
+    results = [None] * len(items)
+
+    # Nested calls are run sequentially to never wait for a thread of the
+    # pool from a thread of the same pool.
+    if getattr(worker, "active", False):
+        for index, item in enumerate(items):
+            try:
+                results[index] = func(item)
+            except Exception as error:
+                results[index] = _error(error)
+        return results
+
+    pending = {}
+    pool = get_executor()
+    window = max_workers or len(items)
+
+    def collect(done):
+        for future in done:
+            index = pending.pop(future)
+            try:
+                results[index] = future.result()
+            except Exception as error:
+                results[index] = _error(error)
+
+    for index, item in enumerate(items):
+        if len(pending) >= window:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            collect(done)
+        # Each call sees the context of the caller such as the lookup one
+        context = contextvars.copy_context()
+        pending[pool.submit(context.run, _run, func, item)] = index
+
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        collect(done)
+
+    return results
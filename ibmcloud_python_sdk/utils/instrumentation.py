@@ -0,0 +1,217 @@
+import contextvars
+import sys
+import time
+
+# Hooks called before and after every query, the instrumentation is
+# skipped entirely while the list is empty
+hooks = []
+
+# Request being executed by query_wrapper() in the current context
+current = contextvars.ContextVar("current", default=None)
+
+
+class Request():
+    """Measurements of a query executed by query_wrapper()
+
+    :param conn_type: Connection type
+    :type conn_type: str
+    :param method: HTTP method
+    :type method: str
+    :param path: Path of the query
+    :type path: str
+    :param resource: Resource method which sent the query such as
+        `Instance.create_instance`
+    :type resource: str
+    """
+
+    __slots__ = ("conn_type", "method", "path", "resource", "start",
+                 "duration", "status", "size", "cache", "attempts",
+                 "timings", "error", "context")
+
+    def __init__(self, conn_type, method, path, resource=None):
+        self.conn_type = conn_type
+        self.method = method
+        self.path = path
+        self.resource = resource
+        self.start = time.time()
+        self.duration = None
+        self.status = None
+        self.size = 0
+        # hit, stale, revalidated, miss or None when not cached
+        self.cache = None
+        self.attempts = 0
+        # Seconds spent by phase: cache, ratelimit, dns, connect, tls,
+        # send, server, read, decode, store
+        self.timings = {}
+        self.error = None
+        # Free for the hooks to keep their own state
+        self.context = {}
+
+    def add(self, phase, seconds):
+        """Add time spent in a phase, retried queries add up
+
+        :param phase: Phase name
+        :type phase: str
+        :param seconds: Duration in seconds
+        :type seconds: float
+        """
+        self.timings[phase] = self.timings.get(phase, 0) + seconds
+
+
+class Hook():
+    """Base class of the instrumentation hooks
+    """
+
+    def before(self, request):
+        """Called before the query is executed
+
+        :param request: Query measurements
+        :type request: Request
+        """
+
+    def after(self, request):
+        """Called once the query is executed or failed
+
+        :param request: Query measurements
+        :type request: Request
+        """
+
+
+def add_hook(hook):
+    """Register a hook called for every query
+
+    :param hook: Hook
+    :type hook: Hook
+    """
+    if hook not in hooks:
+        hooks.append(hook)
+
+
+def remove_hook(hook):
+    """Unregister a hook
+
+    :param hook: Hook
+    :type hook: Hook
+    """
+    if hook in hooks:
+        hooks.remove(hook)
+
+
+def active():
+    """Retrieve the request measured in the current context
+
+    :return: Request or None when the instrumentation is disabled
+    :rtype: Request
+    """
+    return current.get() if hooks else None
+
+
+def _resource():
+    """Find the outermost SDK method on the call stack
+    """
+    resource = None
+    frame = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if (module.startswith("ibmcloud_python_sdk.")
+                and not module.startswith("ibmcloud_python_sdk.utils.")):
+            owner = frame.f_locals.get("self")
+            name = frame.f_code.co_name
+            resource = ("{}.{}".format(type(owner).__name__, name)
+                        if owner is not None else name)
+        frame = frame.f_back
+
+    return resource
+
+
+def _call(method, request):
+    for hook in list(hooks):
+        try:
+            getattr(hook, method)(request)
+        except Exception as error:
+            print("Error in instrumentation hook. {}".format(error))
+
+
+def observe(conn_type, method, path, query):
+    """Execute a query and report its measurements to the hooks
+
+    :param conn_type: Connection type
+    :type conn_type: str
+    :param method: HTTP method
+    :type method: str
+    :param path: Path of the query
+    :type path: str
+    :param query: Function executing the query
+    :type query: function
+    :return: Query result
+    :rtype: dict
+    """
+    request = Request(conn_type, method, path, _resource())
+    _call("before", request)
+    token = current.set(request)
+    start = time.perf_counter()
+    try:
+        result = query()
+    except Exception as error:
+        request.error = error
+        raise
+    else:
+        res = result.get("response") if isinstance(result, dict) else None
+        if res is not None:
+            request.status = res.status
+        elif request.cache in ("hit", "stale"):
+            request.status = 200
+        return result
+    finally:
+        request.duration = time.perf_counter() - start
+        current.reset(token)
+        _call("after", request)
+
+
+class OpenTelemetryHook(Hook):
+    """Report every query as an OpenTelemetry client span
+
+    The phases timings, the cache result and the number of attempts are
+    added as span attributes. Requires the `opentelemetry-api` package.
+
+    :param tracer: Tracer, defaults to the tracer of the global provider
+    :type tracer: opentelemetry.trace.Tracer, optional
+    """
+
+    def __init__(self, tracer=None):
+        from opentelemetry import trace
+
+        self.trace = trace
+        self.tracer = tracer or trace.get_tracer("ibmcloud_python_sdk")
+
+    def before(self, request):
+        attributes = {
+            "http.method": request.method,
+            "http.target": request.path,
+            "ibmcloud.conn_type": request.conn_type,
+        }
+        if request.resource:
+            attributes["code.function"] = request.resource
+        request.context["span"] = self.tracer.start_span(
+            "{} {}".format(request.method, request.path.split("?")[0]),
+            kind=self.trace.SpanKind.CLIENT, attributes=attributes)
+
+    def after(self, request):
+        span = request.context.pop("span", None)
+        if span is None:
+            return
+
+        if request.status is not None:
+            span.set_attribute("http.status_code", request.status)
+        span.set_attribute("http.response_content_length", request.size)
+        span.set_attribute("ibmcloud.attempts", request.attempts)
+        if request.cache:
+            span.set_attribute("ibmcloud.cache", request.cache)
+        for phase, seconds in request.timings.items():
+            span.set_attribute("ibmcloud.timing.{}".format(phase), seconds)
+        if request.error is not None:
+            span.record_exception(request.error)
+            span.set_status(self.trace.Status(self.trace.StatusCode.ERROR))
+        elif request.status is not None and request.status >= 400:
+            span.set_status(self.trace.Status(self.trace.StatusCode.ERROR))
+        span.end()
@@ -0,0 +1,323 @@
+import contextlib
+import contextvars
+import re
+import threading
+import time
+from ibmcloud_python_sdk import auth
+from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import common
+from ibmcloud_python_sdk.utils import constants
+
+
+# VPC IDs (with or without zone/region prefix), Resource Controller IDs
+# and CRNs
+ID_REGEXP = re.compile(
+    r"^(crn:.+"
+    r"|([a-z0-9]{4}-)?[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}"
+    r"-[0-9a-f]{12}"
+    r"|[0-9a-f]{32})$")
+
+
+class NameIndex():
+    """Name to ID index shared by every resource class
+
+    Entries are stored per account, resource type and scope (mostly the
+    region) and expire after `name_index_ttl` seconds from sdk.yaml.
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def _ttl(self):
+        config = sdk() or {}
+
+        return config.get("name_index_ttl", constants.NAME_INDEX_TTL)
+
+    def get(self, account, resource, scope, name):
+        """Retrieve the ID of a resource from its name
+
+        :param account: Account ID of the token
+        :type account: str
+        :param resource: Resource type
+        :type resource: str
+        :param scope: Scope of the name such as the region
+        :type scope: str
+        :param name: Resource name
+        :type name: str
+        :return: Resource ID or None if not indexed
+        :rtype: str
+        """
+        entry = self.entries.get((account, resource, scope, name))
+        if entry is None:
+            return None
+        if entry[1] < time.monotonic():
+            self.discard(account, resource, scope, name)
+            return None
+
+        return entry[0]
+
+    def set(self, account, resource, scope, name, id):
+        """Index a resource ID by name
+
+        :param account: Account ID of the token
+        :type account: str
+        :param resource: Resource type
+        :type resource: str
+        :param scope: Scope of the name such as the region
+        :type scope: str
+        :param name: Resource name
+        :type name: str
+        :param id: Resource ID
+        :type id: str
+        """
+        self.update(account, resource, scope, {name: id})
+
+    def update(self, account, resource, scope, ids):
+        """Index several resource IDs by name
+
+        :param account: Account ID of the token
+        :type account: str
+        :param resource: Resource type
+        :type resource: str
+        :param scope: Scope of the names such as the region
+        :type scope: str
+        :param ids: Resource IDs by name
+        :type ids: dict
+        """
+        ttl = self._ttl()
+        if not ttl or not ids:
+            return
+
+        expiry = time.monotonic() + ttl
+        with self.lock:
+            for name, id in ids.items():
+                self.entries[(account, resource, scope, name)] = (id, expiry)
+
+    def discard(self, account, resource, scope, name):
+        """Remove a name from the index
+
+        :param account: Account ID of the token
+        :type account: str
+        :param resource: Resource type
+        :type resource: str
+        :param scope: Scope of the name such as the region
+        :type scope: str
+        :param name: Resource name
+        :type name: str
+        """
+        with self.lock:
+            self.entries.pop((account, resource, scope, name), None)
+
+    def clear(self):
+        """Remove every name from the index
+        """
+        with self.lock:
+            self.entries.clear()
+
+
+name_index = NameIndex()
+
+# Resources resolved during the current lookup context
+resolved = contextvars.ContextVar("resolved", default=None)
+
+
+def is_id(value):
+    """Check if a value looks like a resource ID or a CRN
+
+    :param value: Resource name or ID
+    :type value: str
+    :return: True if the value is shaped like an ID
+    :rtype: bool
+    """
+    return isinstance(value, str) and ID_REGEXP.match(value) is not None
+
+
+def _account():
+    """Retrieve the account of the current token without renewing it
+
+    :return: Account ID or None before the first token
+    :rtype: str
+    """
+    token = auth.token_manager.token
+    if token is None:
+        return None
+
+    try:
+        return common.claims(token)["account"]["bss"]
+    except Exception:
+        return None
+
+
+def _listed(data):
+    """Retrieve every name and ID of the listed collections
+
+    :param data: Collections merged by query_all()
+    :type data: list
+    :return: Resource IDs by name
+    :rtype: dict
+    """
+    ids = {}
+    for collection in data:
+        for value in collection.values():
+            if not isinstance(value, list):
+                continue
+            for item in value:
+                if (isinstance(item, dict) and isinstance(item.get("name"),
+                                                          str)
+                        and "id" in item):
+                    ids[item["name"]] = item["id"]
+
+    return ids
+
+
+def _not_found(data):
+    if isinstance(data, dict) and "errors" in data:
+        for error in data["errors"]:
+            if error.get("code") == "not_found":
+                return True
+
+    return False
+
+
+@contextlib.contextmanager
+def context():
+    """Resolve every resource at most once until the context exits
+
+    Nested contexts share the resources resolved by the outermost one. Can
+    also be used as a method decorator with `@context()`.
+
+    :return: Resolved resources by type, scope and value
+    :rtype: dict
+    """
+    memo = resolved.get()
+    if memo is not None:
+        yield memo
+        return
+
+    token = resolved.set({})
+    try:
+        yield resolved.get()
+    finally:
+        resolved.reset(token)
+
+
+def remember(resource, value, fetch, scope=None):
+    """Retrieve a resource once per lookup context
+
+    Successful results are kept under the requested value and under the
+    resource ID, so a parent resolved by name is reused when resolved again
+    by ID. Outside of a lookup context `fetch` is always called.
+
+    :param resource: Resource type
+    :type resource: str
+    :param value: Resource name or ID
+    :type value: str
+    :param fetch: Function retrieving the resource
+    :type fetch: function
+    :param scope: Scope of the name such as the region
+    :type scope: str, optional
+    :return: Resource information
+    :rtype: dict
+    """
+    memo = resolved.get()
+    if memo is None:
+        return fetch()
+
+    key = (resource, scope, value)
+    if key in memo:
+        return memo[key]
+
+    data = fetch()
+    if isinstance(data, dict) and "errors" not in data:
+        memo[key] = data
+        if "id" in data:
+            memo[(resource, scope, data["id"])] = data
+
+    return data
+
+
+def resolve(resource, value, by_name, by_id, scope=None, indexed=True):
+    """Retrieve a resource by name or ID
+
+    Values shaped like an ID are fetched by ID directly. Names are resolved
+    with the name index then fetched by ID, the collection is only listed
+    by `by_name` when the name isn't indexed yet and every name it lists is
+    indexed for the account of the token. Both methods are tried
+    before returning a not found error. Inside a lookup context each value
+    is only resolved once.
+
+    :param resource: Resource type
+    :type resource: str
+    :param value: Resource name or ID
+    :type value: str
+    :param by_name: Method retrieving the resource by name
+    :type by_name: function
+    :param by_id: Method retrieving the resource by ID
+    :type by_id: function
+    :param scope: Scope of the name such as the region
+    :type scope: str, optional
+    :param indexed: Use the name index, disable it for resources not found
+        by name such as listeners (port) or pool members (address)
+    :type indexed: bool, optional
+    :return: Resource information
+    :rtype: dict
+    """
+    return remember(resource, value,
+                    lambda: _resolve(resource, value, by_name, by_id, scope,
+                                     indexed),
+                    scope)
+
+
+@contextlib.contextmanager
+def _listing(collected):
+    # Nested resolutions don't index their listings into the outer one
+    token = common.listings.set(collected)
+    try:
+        yield collected
+    finally:
+        common.listings.reset(token)
+
+
+def _resolve(resource, value, by_name, by_id, scope, indexed):
+    if is_id(value):
+        data = by_id(value)
+        if not _not_found(data):
+            return data
+
+        # A name could look like an ID
+        with _listing(None):
+            return by_name(value)
+
+    if not indexed:
+        with _listing(None):
+            data = by_name(value)
+        if _not_found(data):
+            return by_id(value)
+        return data
+
+    account = _account()
+    resource_id = name_index.get(account, resource, scope, value)
+    if resource_id is not None:
+        data = by_id(resource_id)
+        if (isinstance(data, dict) and "errors" not in data
+                and data.get("name") == value):
+            return data
+
+        # Deleted or renamed resource
+        name_index.discard(account, resource, scope, value)
+
+    # Index every name of the collection listed by by_name
+    with _listing([]) as collected:
+        data = by_name(value)
+
+    # The token could have been renewed while listing
+    account = _account()
+    name_index.update(account, resource, scope, _listed(collected))
+    if _not_found(data):
+        return by_id(value)
+
+    if isinstance(data, dict) and "errors" not in data and "id" in data:
+        name_index.set(account, resource, scope, value, data["id"])
+
+    return data
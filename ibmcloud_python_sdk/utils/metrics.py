@@ -0,0 +1,226 @@
+import bisect
+import threading
+from ibmcloud_python_sdk.utils import instrumentation
+
+# Upper bounds of the histogram buckets
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25,
+                    0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+def _labels(names, values):
+    if not names:
+        return ""
+
+    return "{{{}}}".format(",".join(
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\")
+                         .replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in zip(names, values)))
+
+
+def _number(value):
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Counter():
+    """Monotonic counter by labels
+
+    :param name: Metric name
+    :type name: str
+    :param documentation: Metric help
+    :type documentation: str
+    :param labels: Label names
+    :type labels: tuple, optional
+    """
+
+    kind = "counter"
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def inc(self, *labels, amount=1):
+        """Increment the counter of a labels combination
+
+        :param labels: Label values
+        :type labels: str
+        :param amount: Increment
+        :type amount: float, optional
+        """
+        labels = tuple(str(label) for label in labels)
+        with self.lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+    def samples(self):
+        with self.lock:
+            values = dict(self.values)
+
+        for labels, value in sorted(values.items()):
+            yield self.name + "_total", _labels(self.labels, labels), value
+
+
+class Histogram():
+    """Distribution of observed values by labels
+
+    :param name: Metric name
+    :type name: str
+    :param documentation: Metric help
+    :type documentation: str
+    :param labels: Label names
+    :type labels: tuple, optional
+    :param buckets: Upper bounds of the buckets
+    :type buckets: tuple, optional
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labels=(),
+                 buckets=DURATION_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        """Record a value for a labels combination
+
+        :param value: Observed value
+        :type value: float
+        :param labels: Label values
+        :type labels: str
+        """
+        labels = tuple(str(label) for label in labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            counts, total = self.values.get(labels) or (
+                [0] * (len(self.buckets) + 1), 0)
+            counts[index] += 1
+            self.values[labels] = (counts, total + value)
+
+    def samples(self):
+        with self.lock:
+            values = {labels: (list(counts), total)
+                      for labels, (counts, total) in self.values.items()}
+
+        names = self.labels + ("le",)
+        for labels, (counts, total) in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), counts):
+                cumulative += count
+                le = bound if bound == "+Inf" else _number(bound)
+                yield (self.name + "_bucket",
+                       _labels(names, labels + (le,)), cumulative)
+            yield self.name + "_sum", _labels(self.labels, labels), total
+            yield self.name + "_count", _labels(self.labels, labels), \
+                cumulative
+
+
+class Registry():
+    """Collection of metrics exposed in the Prometheus text format
+    """
+
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        """Add a metric to the registry
+
+        :param metric: Counter or Histogram
+        :type metric: Counter
+        :return: The metric
+        :rtype: Counter
+        """
+        self.metrics.append(metric)
+
+        return metric
+
+    def render(self):
+        """Render every metric in the Prometheus text exposition format
+
+        :return: Metrics
+        :rtype: str
+        """
+        lines = []
+        for metric in self.metrics:
+            lines.append("# HELP {} {}".format(metric.name,
+                                               metric.documentation))
+            lines.append("# TYPE {} {}".format(metric.name, metric.kind))
+            for name, labels, value in metric.samples():
+                lines.append("{}{} {}".format(name, labels, _number(value)))
+
+        return "\n".join(lines) + "\n"
+
+
+class MetricsHook(instrumentation.Hook):
+    """Record the measurements of every query into a registry
+
+    :param registry: Registry receiving the metrics, a new one by default
+    :type registry: Registry, optional
+    :param prefix: Prefix of the metric names
+    :type prefix: str, optional
+    """
+
+    def __init__(self, registry=None, prefix="ibmcloud_sdk"):
+        self.registry = registry or Registry()
+        self.requests = self.registry.register(Counter(
+            prefix + "_requests", "Queries executed by query_wrapper",
+            ("conn_type", "method", "status")))
+        self.duration = self.registry.register(Histogram(
+            prefix + "_request_duration_seconds", "Duration of the queries",
+            ("conn_type", "method")))
+        self.phases = self.registry.register(Histogram(
+            prefix + "_phase_duration_seconds",
+            "Time spent by phase of the queries", ("conn_type", "phase")))
+        self.size = self.registry.register(Histogram(
+            prefix + "_response_size_bytes", "Size of the response bodies",
+            ("conn_type",), SIZE_BUCKETS))
+        self.cache = self.registry.register(Counter(
+            prefix + "_cache", "Cache lookups by result",
+            ("conn_type", "result")))
+        self.retries = self.registry.register(Counter(
+            prefix + "_retries", "Queries sent again after a failure",
+            ("conn_type",)))
+        self.resources = self.registry.register(Counter(
+            prefix + "_resource_requests", "Queries by resource method",
+            ("resource",)))
+
+    def after(self, request):
+        if request.error is not None:
+            status = "error"
+        else:
+            # Followers of a coalesced query don't see the response
+            status = request.status or "unknown"
+        self.requests.inc(request.conn_type, request.method, status)
+        self.duration.observe(request.duration, request.conn_type,
+                              request.method)
+        for phase, seconds in request.timings.items():
+            self.phases.observe(seconds, request.conn_type, phase)
+        if request.size:
+            self.size.observe(request.size, request.conn_type)
+        if request.cache:
+            self.cache.inc(request.conn_type, request.cache)
+        if request.attempts > 1:
+            self.retries.inc(request.conn_type,
+                             amount=request.attempts - 1)
+        if request.resource:
+            self.resources.inc(request.resource)
+
+
+def enable(registry=None):
+    """Record the metrics of every query
+
+    :param registry: Registry receiving the metrics, a new one by default
+    :type registry: Registry, optional
+    :return: Hook recording the metrics, its `registry` attribute renders
+        them with `render()`
+    :rtype: MetricsHook
+    """
+    hook = MetricsHook(registry)
+    instrumentation.add_hook(hook)
+
+    return hook
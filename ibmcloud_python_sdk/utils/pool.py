@@ -0,0 +1,314 @@
+import http.client
+import os
+import select
+import socket
+import threading
+import time
+from collections import deque
+from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import constants
+from ibmcloud_python_sdk.utils import instrumentation
+from ibmcloud_python_sdk.utils import retry
+
+
+# Errors raised when a kept-alive connection has been closed by the
+# remote side between two requests.
+STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+pools = {}
+lock = threading.Lock()
+pid = os.getpid()
+
+
+def split_host(host):
+    """Split a host prefixed by an optional URL scheme
+
+    :param host: Host such as `iam.cloud.ibm.com` or
+        `http://127.0.0.1:8080`
+    :type host: str
+    :return: Scheme, `https` by default, and host with its port
+    :rtype: tuple
+    """
+    scheme, separator, netloc = host.partition("://")
+    if not separator:
+        return "https", host
+
+    return scheme, netloc.rstrip("/")
+
+
+class ConnectionPool():
+    """Pool of reusable keep-alive HTTPS connections for a single host
+
+    :param host: Host to connect to, prefixed by `http://` to connect
+        without TLS
+    :type host: str
+    :param size: Maximum number of idle connections kept in the pool
+    :type size: int, optional
+    :param idle_timeout: Seconds after which an idle connection is dropped
+    :type idle_timeout: int, optional
+    :param timeout: Socket timeout used by the connections
+    :type timeout: int, optional
+    :param limit: Maximum number of concurrent queries, unlimited if None
+    :type limit: int, optional
+    """
+
+    def __init__(self, host, size=constants.POOL_SIZE,
+                 idle_timeout=constants.POOL_IDLE_TIMEOUT,
+                 timeout=constants.HTTP_TIMEOUT, limit=None):
+        self.host = host
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.idle = deque()
+        self.lock = threading.Lock()
+        self.semaphore = threading.BoundedSemaphore(limit) if limit else None
+
+    def _new(self):
+        scheme, host = split_host(self.host)
+        if scheme == "http":
+            return http.client.HTTPConnection(host, timeout=self.timeout)
+
+        return http.client.HTTPSConnection(host, timeout=self.timeout)
+
+    def _healthy(self, conn, last_used):
+        """Check if an idle connection could be reused
+
+        :param conn: Idle connection
+        :type conn: http.client.HTTPSConnection
+        :param last_used: Timestamp of the last release
+        :type last_used: float
+        :return: Connection health
+        :rtype: bool
+        """
+        if time.monotonic() - last_used > self.idle_timeout:
+            return False
+        if conn.sock is None:
+            return False
+
+        # A readable idle socket means the server closed it (EOF) or sent
+        # unexpected data, either way it can't be reused.
+        try:
+            readable, _, _ = select.select([conn.sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+
+        return not readable
+
+    def get(self):
+        """Retrieve an idle connection or create a new one
+
+        :return: Connection and reuse flag
+        :rtype: tuple
+        """
+        with self.lock:
+            while self.idle:
+                conn, last_used = self.idle.pop()
+                if self._healthy(conn, last_used):
+                    return conn, True
+                conn.close()
+
+        return self._new(), False
+
+    def put(self, conn):
+        """Release a connection back into the pool
+
+        :param conn: Connection to release
+        :type conn: http.client.HTTPSConnection
+        """
+        with self.lock:
+            if len(self.idle) < self.size:
+                self.idle.append((conn, time.monotonic()))
+                return
+
+        conn.close()
+
+    def clear(self):
+        """Close every idle connection of the pool
+        """
+        with self.lock:
+            while self.idle:
+                conn, _ = self.idle.pop()
+                conn.close()
+
+    def request(self, method, path, payload=None, headers=None):
+        """Execute HTTP query using a pooled connection
+
+        A reused connection closed by the server is transparently replaced
+        by a new one and the query is sent again, unless it was already
+        written and isn't idempotent. Callers wait while the concurrency
+        limit of the host is reached.
+
+        :param method: HTTP method
+        :type method: str
+        :param path: Path used by within the query
+        :type path: str
+        :param payload: Payload send during the query
+        :type payload: str, optional
+        :param headers: Headers to send with the query
+        :type headers: dict, optional
+        :return: HTTP response and response body
+        :rtype: tuple
+        """
+        if self.semaphore is None:
+            return self._request(method, path, payload, headers)
+
+        with self.semaphore:
+            return self._request(method, path, payload, headers)
+
+    def _request(self, method, path, payload, headers):
+        record = instrumentation.active()
+        while True:
+            conn, reused = self.get()
+            sent = False
+            try:
+                if record and conn.sock is None:
+                    self._connect(conn, record)
+                start = time.perf_counter() if record else None
+                conn.request(method, path, payload, headers or {})
+                sent = True
+                if record:
+                    res, data = self._timed(conn, record, start)
+                else:
+                    res = conn.getresponse()
+                    data = res.read()
+            except STALE_ERRORS:
+                conn.close()
+                # Once written, a query may have been processed by the
+                # server before it closed the connection, only idempotent
+                # queries can be sent again.
+                if reused and (not sent
+                               or method in retry.IDEMPOTENT_METHODS):
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+
+            if res.will_close:
+                conn.close()
+            else:
+                self.put(conn)
+
+            return res, data
+
+    def _timed(self, conn, record, start):
+        """Read the response of a sent query measuring each phase, see
+        instrumentation.Request
+        """
+        sent = time.perf_counter()
+        res = conn.getresponse()
+        received = time.perf_counter()
+        data = res.read()
+        record.add("send", sent - start)
+        record.add("server", received - sent)
+        record.add("read", time.perf_counter() - received)
+
+        return res, data
+
+    def _connect(self, conn, record):
+        """Open a new connection measuring the DNS resolution, the TCP
+        connection and the TLS handshake
+        """
+        timings = {"dns": 0, "connect": 0}
+
+        def create_connection(address, timeout, source_address=None):
+            start = time.perf_counter()
+            infos = socket.getaddrinfo(address[0], address[1], 0,
+                                       socket.SOCK_STREAM)
+            resolved = time.perf_counter()
+            timings["dns"] = resolved - start
+            error = OSError("No address found for {}".format(address[0]))
+            for info in infos:
+                try:
+                    sock = socket.create_connection(info[4][:2], timeout,
+                                                    source_address)
+                except OSError as err:
+                    error = err
+                    continue
+                timings["connect"] = time.perf_counter() - resolved
+                return sock
+
+            raise error
+
+        conn._create_connection = create_connection
+        start = time.perf_counter()
+        conn.connect()
+        total = time.perf_counter() - start
+        for phase, seconds in timings.items():
+            record.add(phase, seconds)
+        if isinstance(conn, http.client.HTTPSConnection):
+            record.add("tls", total - timings["dns"] - timings["connect"])
+
+
+def _reset():
+    """Forget every pool, used after fork() because sockets can't be shared
+    between processes.
+    """
+    global pools, lock, pid
+    pools = {}
+    lock = threading.Lock()
+    pid = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset)
+
+
+def _limit(config, host):
+    """Read the concurrency limit of a host from sdk.yaml, the option is
+    either a number applied to every host or a dict of numbers by host with
+    an optional `default` key.
+    """
+    limit = config.get("concurrency")
+    if isinstance(limit, dict):
+        return limit.get(host, limit.get("default"))
+
+    return limit
+
+
+def get_pool(host, timeout=constants.HTTP_TIMEOUT):
+    """Retrieve the connection pool dedicated to a host
+
+    Pool size, idle timeout and the maximum number of concurrent queries
+    could be configured with the `pool_size`, `pool_idle_timeout` and
+    `concurrency` options from the sdk.yaml file.
+
+    :param host: Host to connect to
+    :type host: str
+    :param timeout: Socket timeout used by the connections
+    :type timeout: int, optional
+    :return: Connection pool
+    :rtype: ConnectionPool
+    """
+    if pid != os.getpid():
+        _reset()
+
+    pool = pools.get(host)
+    if pool is not None:
+        return pool
+
+    with lock:
+        if host not in pools:
+            config = sdk() or {}
+            pools[host] = ConnectionPool(
+                host,
+                size=config.get("pool_size", constants.POOL_SIZE),
+                idle_timeout=config.get("pool_idle_timeout",
+                                        constants.POOL_IDLE_TIMEOUT),
+                timeout=timeout,
+                limit=_limit(config, host))
+
+        return pools[host]
+
+
+def clear():
+    """Close every idle connection from every pool
+    """
+    with lock:
+        for pool in pools.values():
+            pool.clear()
@@ -0,0 +1,192 @@
+import math
+import threading
+import time
+from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import cache
+
+
+limiters = {}
+lock = threading.Lock()
+
+
+class TokenBucket():
+    """Token bucket rate limiter local to the process
+
+    :param rate: Number of queries per second
+    :type rate: float
+    :param burst: Number of queries allowed at once, defaults to the rate
+    :type burst: float, optional
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.capacity = float(burst or max(rate, 1))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token from the bucket
+
+        :return: Seconds to wait before trying again, 0 if a token has
+            been taken
+        :rtype: float
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity,
+                              self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+
+            return (1 - self.tokens) / self.rate
+
+
+class SharedWindow():
+    """Rate limiter shared by every process using the same memcached nodes
+
+    Queries are counted in windows with memcached counters, windows last
+    one second or long enough to allow a query when the rate is below one
+    query per second. The local token bucket is used when memcached isn't
+    reachable.
+
+    :param name: Name of the limited host or connection type
+    :type name: str
+    :param rate: Number of queries per second
+    :type rate: float
+    :param burst: Number of queries allowed at once by the local fallback
+    :type burst: float, optional
+    """
+
+    def __init__(self, name, rate, burst=None):
+        self.name = name
+        self.rate = rate
+        self.window = max(1, math.ceil(1 / rate))
+        self.budget = max(1, int(rate * self.window))
+        self.fallback = TokenBucket(rate, burst)
+
+    def _take(self, key):
+        """Count a query in a window unless its budget is spent
+
+        Refused queries aren't counted to not delay the other processes.
+
+        :return: True if the query has been counted, False if the budget
+            is spent or None if memcached isn't reachable
+        :rtype: bool
+        """
+        memcached = cache.client()
+        if not memcached:
+            return None
+
+        try:
+            count = memcached.get(key)
+            if count is not None and int(count) >= self.budget:
+                return False
+            count = memcached.incr(key, 1)
+            if count is None:
+                # First query of the window, add() keeps a concurrent value
+                if memcached.add(key, b"1", expire=self.window + 1,
+                                 noreply=False):
+                    return True
+                count = memcached.incr(key, 1)
+            if count is not None and count > self.budget:
+                # Another process took the last query of the window
+                memcached.decr(key, 1)
+                return False
+            return True
+        except Exception as error:
+            print("Error counting queries in memcached. {}".format(error))
+            cache.reset()
+            return None
+
+    def reserve(self):
+        """Count a query in the current window
+
+        :return: Seconds to wait before trying again, 0 if the query could
+            be sent
+        :rtype: float
+        """
+        now = time.time()
+        window = int(now // self.window)
+        taken = self._take("ratelimit:{}:{}".format(self.name, window))
+        if taken is None:
+            return self.fallback.reserve()
+        if taken:
+            return 0
+
+        return (window + 1) * self.window - now
+
+
+def limiter(conn_type, host):
+    """Retrieve the rate limiter of a connection type or host
+
+    Limits are read from the `rate_limit` option of sdk.yaml keyed by
+    connection type such as `iaas` or by host. A limit is either a number
+    of queries per second or a dict with `rate`, `burst` and `shared` keys.
+
+    :param conn_type: Connection type
+    :type conn_type: str
+    :param host: API host
+    :type host: str
+    :return: Rate limiter or None if not limited
+    :rtype: TokenBucket
+    """
+    config = sdk() or {}
+    option = config.get("rate_limit") or {}
+    name = conn_type if conn_type in option else host
+    settings = option.get(name)
+    if not settings:
+        return None
+    if not isinstance(settings, dict):
+        settings = {"rate": settings}
+
+    key = (name, settings.get("rate"), settings.get("burst"),
+           bool(settings.get("shared")))
+    bucket = limiters.get(key)
+    if bucket is not None:
+        return bucket
+
+    with lock:
+        if key not in limiters:
+            if settings.get("shared"):
+                limiters[key] = SharedWindow(name, settings["rate"],
+                                             settings.get("burst"))
+            else:
+                limiters[key] = TokenBucket(settings["rate"],
+                                            settings.get("burst"))
+
+        return limiters[key]
+
+
+def reserve(conn_type, host):
+    """Reserve a query for a connection type or host
+
+    :param conn_type: Connection type
+    :type conn_type: str
+    :param host: API host
+    :type host: str
+    :return: Seconds to wait before trying again, 0 if the query could be
+        sent
+    :rtype: float
+    """
+    bucket = limiter(conn_type, host)
+    if bucket is None:
+        return 0
+
+    return bucket.reserve()
+
+
+def wait(conn_type, host):
+    """Block until a query could be sent to a connection type or host
+
+    :param conn_type: Connection type
+    :type conn_type: str
+    :param host: API host
+    :type host: str
+    """
+    delay = reserve(conn_type, host)
+    while delay:
+        time.sleep(delay)
+        delay = reserve(conn_type, host)
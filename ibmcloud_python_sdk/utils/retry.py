@@ -0,0 +1,152 @@
+import email.utils
+import http.client
+import random
+import time
+from ibmcloud_python_sdk.config import sdk
+from ibmcloud_python_sdk.utils import constants
+
+
+# Methods which could be sent again without side effect
+IDEMPOTENT_METHODS = ["GET", "HEAD", "PUT", "DELETE", "OPTIONS"]
+
+# Statuses returned by overloaded or temporarily unavailable endpoints
+RETRY_STATUSES = [429, 500, 502, 503, 504]
+
+# Errors raised when the connection failed or timed out
+RETRY_ERRORS = (OSError, http.client.HTTPException)
+
+
+def settings():
+    """Read the retry policy from the `retry` option of sdk.yaml
+
+    :return: Retry policy with max_attempts, backoff_factor, max_backoff
+        and deadline keys
+    :rtype: dict
+    """
+    config = sdk() or {}
+    option = config.get("retry", {})
+    policy = {
+        "max_attempts": constants.RETRY_MAX_ATTEMPTS,
+        "backoff_factor": constants.RETRY_BACKOFF_FACTOR,
+        "max_backoff": constants.RETRY_MAX_BACKOFF,
+        "deadline": constants.RETRY_DEADLINE,
+    }
+    if option is False:
+        policy["max_attempts"] = 1
+    elif isinstance(option, dict):
+        policy.update(option)
+
+    return policy
+
+
+def retry_after(res):
+    """Read the Retry-After header of a response
+
+    :param res: HTTP response
+    :type res: http.client.HTTPResponse
+    :return: Seconds to wait or None if missing or invalid
+    :rtype: float
+    """
+    value = res.getheader("Retry-After") if res is not None else None
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(date.timestamp() - time.time(), 0)
+
+
+def retryable(method, res=None, error=None):
+    """Check if a query could be sent again
+
+    :param method: HTTP method
+    :type method: str
+    :param res: HTTP response
+    :type res: http.client.HTTPResponse, optional
+    :param error: Exception raised while sending the query
+    :type error: Exception, optional
+    :return: Retry status
+    :rtype: bool
+    """
+    if method not in IDEMPOTENT_METHODS:
+        return False
+    if error is not None:
+        return isinstance(error, RETRY_ERRORS)
+
+    return res.status in RETRY_STATUSES
+
+
+def delay(policy, attempt, start, res=None):
+    """Compute the time to wait before the next attempt
+
+    Exponential backoff with full jitter, a Retry-After header sent by the
+    server takes precedence.
+
+    :param policy: Retry policy returned by settings()
+    :type policy: dict
+    :param attempt: Number of attempts already made
+    :type attempt: int
+    :param start: Monotonic time of the first attempt
+    :type start: float
+    :param res: HTTP response of the last attempt
+    :type res: http.client.HTTPResponse, optional
+    :return: Seconds to wait or None if no attempt is left
+    :rtype: float
+    """
+    if attempt >= policy["max_attempts"]:
+        return None
+
+    wait = retry_after(res)
+    if wait is None:
+        wait = random.uniform(0, min(policy["max_backoff"],
+                                     policy["backoff_factor"] * 2 ** attempt))
+
+    if time.monotonic() + wait - start > policy["deadline"]:
+        return None
+
+    return wait
+
+
+def call(send, method):
+    """Send a query and retry it on transient failures
+
+    Only idempotent methods are retried, on connection errors and on 429
+    and 5xx statuses.
+
+    :param send: Function sending the query and returning the HTTP
+        response and the response body
+    :type send: function
+    :param method: HTTP method
+    :type method: str
+    :return: HTTP response and response body of the last attempt
+    :rtype: tuple
+    """
+    policy = settings()
+    start = time.monotonic()
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            res, data = send()
+        except Exception as error:
+            if not retryable(method, error=error):
+                raise
+            wait = delay(policy, attempt, start)
+            if wait is None:
+                raise
+        else:
+            if not retryable(method, res=res):
+                return res, data
+            wait = delay(policy, attempt, start, res)
+            if wait is None:
+                return res, data
+
+        time.sleep(wait)
@@ -0,0 +1,72 @@
+import os
+import threading
+
+
+class _Call():
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.done = False
+        self.result = None
+        self.error = None
+
+
+class Group():
+    """Share the result of a function between concurrent identical calls
+
+    The first caller of a key runs the function while the others wait for
+    its result, the key is forgotten once the result is available.
+    """
+
+    def __init__(self):
+        self.calls = {}
+        self.lock = threading.Lock()
+
+    def do(self, key, func):
+        """Run a function once for every concurrent caller of a key
+
+        :param key: Key identifying identical calls
+        :type key: tuple
+        :param func: Function to run
+        :type func: function
+        :return: Result of the function, shared by every caller
+        :rtype: dict
+        """
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = self.calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            if not call.done:
+                # The leader has been interrupted, run the function again
+                return self.do(key, func)
+            return call.result
+
+        try:
+            call.result = func()
+            call.done = True
+        except Exception as error:
+            call.error = error
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call.event.set()
+
+        return call.result
+
+    def _after_fork(self):
+        # Calls in flight belong to threads of the parent process
+        self.calls = {}
+        self.lock = threading.Lock()
+
+
+group = Group()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=group._after_fork)
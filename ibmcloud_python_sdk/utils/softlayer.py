@@ -1,13 +1,29 @@
-import SoftLayer
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.utils import constants
 
 
+def __getattr__(name):
+    """Import the SoftLayer package on first use of `softlayer.SoftLayer`
+
+    The package is large and only needed by the classic infrastructure
+    classes, it isn't imported with the other modules.
+    """
+    if name == "SoftLayer":
+        import SoftLayer
+        globals()[name] = SoftLayer
+        return SoftLayer
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(
+        __name__, name))
+
+
 def client():
     """Create SoftLayer client
 
     :return: The SoftLayer client
     """
+    import SoftLayer
+
     cfg = params()
     endpoint_url = "https://{}/rest/v3.1/".format(constants.SL_URL)
     try:
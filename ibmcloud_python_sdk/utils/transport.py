@@ -0,0 +1,215 @@
+import base64
+import contextlib
+import json
+import threading
+import time
+from ibmcloud_python_sdk.utils import common
+
+
+class Response():
+    """HTTP response exposing the same attributes as http.client responses
+
+    :param status: HTTP status code
+    :type status: int
+    :param reason: HTTP reason phrase
+    :type reason: str
+    :param headers: List of (name, value) headers
+    :type headers: list
+    :param will_close: Connection closed by the server after the response
+    :type will_close: bool
+    """
+
+    def __init__(self, status, reason, headers, will_close=False):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.will_close = will_close
+
+    def getcode(self):
+        return self.status
+
+    def getheader(self, name, default=None):
+        for key, value in self.headers:
+            if key.lower() == name.lower():
+                return value
+
+        return default
+
+    def getheaders(self):
+        return self.headers
+
+
+class Transport():
+    """Send the queries of query_wrapper()
+
+    Transports are called with the connection type, host, method, path,
+    payload and headers of a query and return the HTTP response and the
+    response body. Any function with this signature could be used.
+    """
+
+    # Identical concurrent GET share a single query, transports answering
+    # each caller with its own responses disable it
+    shared = True
+
+    def __call__(self, conn_type, host, method, path, payload, headers):
+        return self.send(conn_type, host, method, path, payload, headers)
+
+    def send(self, conn_type, host, method, path, payload, headers):
+        raise NotImplementedError
+
+
+class HTTPTransport(Transport):
+    """Send the queries through the keep-alive connection pools, with rate
+    limits and retries
+    """
+
+    def send(self, conn_type, host, method, path, payload, headers):
+        return common.send_http(conn_type, host, method, path, payload,
+                                headers)
+
+
+def _key(conn_type, method, path, payload):
+    # Hosts and headers such as tokens aren't part of the key to replay
+    # the responses on any region and with any credentials
+    return json.dumps([conn_type, method, path, payload])
+
+
+class RecordingTransport(Transport):
+    """Send the queries through another transport and append the responses
+    to a JSON Lines file
+
+    Token queries aren't recorded to keep the credentials out of the file.
+
+    :param filename: File the responses are appended to
+    :type filename: str
+    :param transport: Transport sending the queries, defaults to
+        HTTPTransport
+    :type transport: Transport, optional
+    """
+
+    def __init__(self, filename, transport=None):
+        self.filename = filename
+        self.transport = transport or HTTPTransport()
+        self.lock = threading.Lock()
+
+    def send(self, conn_type, host, method, path, payload, headers):
+        res, data = self.transport(conn_type, host, method, path, payload,
+                                   headers)
+        if conn_type == "auth":
+            return res, data
+
+        body = data or b""
+        try:
+            response = {"body": body.decode("utf-8")}
+        except UnicodeDecodeError:
+            response = {"base64": base64.b64encode(body).decode()}
+        response.update({
+            "status": res.status,
+            "reason": res.reason,
+            "headers": [list(header) for header in res.getheaders()],
+        })
+        record = {"request": [conn_type, method, path, payload],
+                  "response": response}
+
+        with self.lock:
+            with open(self.filename, "a") as record_file:
+                record_file.write(json.dumps(record) + "\n")
+
+        return res, data
+
+
+def _token(account, ttl):
+    """Build an unsigned token with the claims read by the SDK
+    """
+    claims = {"exp": int(time.time()) + ttl, "account": {"bss": account}}
+    parts = [{"alg": "none", "typ": "JWT"}, claims]
+
+    return "{}.".format(".".join(
+        base64.urlsafe_b64encode(json.dumps(part).encode()).decode()
+        .rstrip("=") for part in parts))
+
+
+class ReplayTransport(Transport):
+    """Answer the queries with the responses recorded by
+    RecordingTransport, without any network access
+
+    Responses of a query are served in the recorded order, the last one
+    is served again once they have all been used. Token queries are
+    answered with an unsigned token.
+
+    :param filename: File of recorded responses
+    :type filename: str
+    :param account: Account ID of the served tokens
+    :type account: str, optional
+    :param latency: Seconds to wait before answering, to simulate the
+        network
+    :type latency: float, optional
+    :raise LookupError: No response has been recorded for a query
+    """
+
+    def __init__(self, filename, account="replay", latency=0):
+        self.account = account
+        self.latency = latency
+        self.responses = {}
+        self.used = {}
+        self.lock = threading.Lock()
+        with open(filename, "r") as record_file:
+            for line in record_file:
+                if line.strip():
+                    record = json.loads(line)
+                    self.responses.setdefault(
+                        _key(*record["request"]), []).append(
+                            record["response"])
+
+    def send(self, conn_type, host, method, path, payload, headers):
+        if self.latency:
+            time.sleep(self.latency)
+
+        if conn_type == "auth":
+            data = {"access_token": _token(self.account, 3600),
+                    "token_type": "Bearer", "expires_in": 3600}
+            return Response(200, "OK", []), json.dumps(data).encode()
+
+        key = _key(conn_type, method, path, payload)
+        responses = self.responses.get(key)
+        if not responses:
+            raise LookupError("No recorded response for {} {}".format(
+                method, path))
+
+        with self.lock:
+            index = self.used.get(key, 0)
+            self.used[key] = index + 1
+        response = responses[min(index, len(responses) - 1)]
+
+        if "base64" in response:
+            data = base64.b64decode(response["base64"])
+        else:
+            data = response["body"].encode("utf-8")
+        headers = [tuple(header) for header in response["headers"]]
+
+        return Response(response["status"], response["reason"], headers), data
+
+
+def set_transport(send):
+    """Send the queries of the current context through a transport
+
+    :param send: Transport, None restores the connection pools
+    :type send: Transport
+    :return: Token restoring the previous transport
+    :rtype: contextvars.Token
+    """
+    return common.transport.set(send)
+
+
+@contextlib.contextmanager
+def use_transport(send):
+    """Send the queries through a transport within a `with` block
+
+    :param send: Transport
+    :type send: Transport
+    """
+    token = set_transport(send)
+    try:
+        yield send
+    finally:
+        common.transport.reset(token)
@@ -2,6 +2,9 @@ import json
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.lookup import resolve
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import iter_resources
 from ibmcloud_python_sdk.vpc import vpc
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
@@ -28,7 +31,25 @@ class Acl():
                 self.cfg["version"], self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
+
+        except Exception as error:
+            print("Error fetching network ACLs. {}".format(error))
+            raise
+
+    def iter_network_acls(self, limit=None):
+        """Retrieve network ACLs page by page
+
+        :param limit: Number of network ACLs per page
+        :type limit: int, optional
+        :return: Generator of network ACLs
+        :rtype: generator
+        """
+        try:
+            path = ("/v1/network_acls?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            yield from iter_resources(qw, "iaas", path, headers(), limit)
 
         except Exception as error:
             print("Error fetching network ACLs. {}".format(error))
@@ -42,18 +63,8 @@ class Acl():
         :return: Network ACL information
         :rtype: dict
         """
-        by_name = self.get_network_acl_by_name(acl)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_network_acl_by_id(acl)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve("network_acls", acl, self.get_network_acl_by_name,
+                       self.get_network_acl_by_id, self.cfg["region"])
 
     def get_network_acl_by_id(self, id):
         """Retrieve specific network ACL by ID
@@ -140,7 +151,7 @@ class Acl():
                                             self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching rules for network ACL with ID"
@@ -169,7 +180,7 @@ class Acl():
                                             self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching network ACL with name {}. {}".format(
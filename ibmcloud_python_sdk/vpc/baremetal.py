@@ -2,6 +2,9 @@ import json
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.lookup import resolve
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import iter_resources
 from ibmcloud_python_sdk.vpc import vpc
 from ibmcloud_python_sdk.vpc import image
 from ibmcloud_python_sdk.vpc import subnet
@@ -38,7 +41,25 @@ class Baremetal():
             path = ("/v1/bare_metal_servers?version={}&generation={}".format(
                 self.cfg["version"], self.cfg["generation"]))
 
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
+
+        except Exception as error:
+            print("Error fetching bare metal server. {}".format(error))
+            raise
+
+    def iter_servers(self, limit=None):
+        """Retrieve bare metal servers page by page
+
+        :param limit: Number of bare metal servers per page
+        :type limit: int, optional
+        :return: Generator of bare metal servers
+        :rtype: generator
+        """
+        try:
+            path = ("/v1/bare_metal_servers?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            yield from iter_resources(qw, "iaas", path, headers(), limit)
 
         except Exception as error:
             print("Error fetching bare metal server. {}".format(error))
@@ -52,18 +73,9 @@ class Baremetal():
         :return: Bare metal server information
         :rtype: dict
         """
-        by_name = self.get_server_by_name(bare_metal_server)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_server_by_id(bare_metal_server)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve("bare_metal_servers", bare_metal_server,
+                       self.get_server_by_name,
+                       self.get_server_by_id, self.cfg["region"])
 
     def get_server_by_id(self, id):
         """Retrieve specific bare metal server by ID
@@ -215,7 +227,7 @@ class Baremetal():
                     "&generation={}".format(id, self.cfg["version"],
                                             self.cfg["generation"]))
 
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching network interfaces for bare metal server"
@@ -241,7 +253,7 @@ class Baremetal():
                                             self.cfg["version"],
                                             self.cfg["generation"]))
 
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching network interfaces for bare metal server"
@@ -448,7 +460,7 @@ class Baremetal():
                         self.cfg["version"],
                         self.cfg["generation"]))
 
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print
@@ -507,7 +519,7 @@ class Baremetal():
             path = ("/v1/bare_metal_server/profiles?version={}&generation={}".
                     format(self.cfg["version"], self.cfg["generation"]))
 
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching bare metal server profiles. {}".format(
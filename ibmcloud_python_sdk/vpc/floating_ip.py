@@ -2,6 +2,9 @@ import json
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.lookup import resolve
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import iter_resources
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.resource import resource_group
@@ -25,7 +28,25 @@ class Fip():
                 self.cfg["version"], self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
+
+        except Exception as error:
+            print("Error fetching floating IPs. {}".format(error))
+            raise
+
+    def iter_floating_ips(self, limit=None):
+        """Retrieve floating IPs page by page
+
+        :param limit: Number of floating IPs per page
+        :type limit: int, optional
+        :return: Generator of floating IPs
+        :rtype: generator
+        """
+        try:
+            path = ("/v1/floating_ips?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            yield from iter_resources(qw, "iaas", path, headers(), limit)
 
         except Exception as error:
             print("Error fetching floating IPs. {}".format(error))
@@ -39,27 +60,14 @@ class Fip():
         :return: Floating IP information
         :rtype: dict
         """
-        by_name = self.get_floating_ip_by_name(fip)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_floating_ip_by_id(fip)
-                    if "errors" in by_id:
-                        for key_id in by_id["errors"]:
-                            if key_id["code"] == "not_found":
-                                by_addr = self.get_floating_ip_by_address(fip)
-                                if "errors" in by_addr:
-                                    return by_addr
-                                else:
-                                    return by_addr
-                            else:
-                                return by_id
-                    else:
-                        return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        by_ref = resolve("floating_ips", fip, self.get_floating_ip_by_name,
+                         self.get_floating_ip_by_id, self.cfg["region"])
+        if "errors" in by_ref:
+            for key_ref in by_ref["errors"]:
+                if key_ref["code"] == "not_found":
+                    return self.get_floating_ip_by_address(fip)
+
+        return by_ref
 
     def get_floating_ip_by_id(self, id):
         """Retrieve specific floating IP by ID
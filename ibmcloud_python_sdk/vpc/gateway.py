@@ -2,6 +2,9 @@ import json
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.lookup import resolve
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import iter_resources
 from ibmcloud_python_sdk.vpc import vpc
 from ibmcloud_python_sdk.vpc import floating_ip
 from ibmcloud_python_sdk.utils.common import resource_not_found
@@ -30,7 +33,25 @@ class Gateway():
                 self.cfg["version"], self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
+
+        except Exception as error:
+            print("Error fetching public gateways. {}".format(error))
+            raise
+
+    def iter_public_gateways(self, limit=None):
+        """Retrieve public gateways page by page
+
+        :param limit: Number of public gateways per page
+        :type limit: int, optional
+        :return: Generator of public gateways
+        :rtype: generator
+        """
+        try:
+            path = ("/v1/public_gateways?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            yield from iter_resources(qw, "iaas", path, headers(), limit)
 
         except Exception as error:
             print("Error fetching public gateways. {}".format(error))
@@ -44,18 +65,9 @@ class Gateway():
         :return: Public gateway information
         :rtype: dict
         """
-        by_name = self.get_public_gateway_by_name(gateway)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_public_gateway_by_id(gateway)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve("public_gateways", gateway,
+                       self.get_public_gateway_by_name,
+                       self.get_public_gateway_by_id, self.cfg["region"])
 
     def get_public_gateway_by_id(self, id):
         """Retrieve specific public gateway by ID
@@ -1,6 +1,7 @@
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.common import query_all
 
 
 class Geo():
@@ -20,7 +21,7 @@ class Geo():
                 self.cfg["version"], self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching regions. {}".format(error))
@@ -59,7 +60,7 @@ class Geo():
             path = ("/v1/regions/{}/zones?version={}&generation={}".format(
                 region, self.cfg["version"], self.cfg["generation"]))
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching zones for region {}. {}".format(
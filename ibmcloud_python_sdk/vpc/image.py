@@ -2,6 +2,9 @@ import json
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.lookup import resolve
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import iter_resources
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
@@ -28,7 +31,7 @@ class Image():
                 self.cfg["version"], self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching operating systems. {}".format(error))
@@ -67,7 +70,25 @@ class Image():
                 self.cfg["version"], self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
+
+        except Exception as error:
+            print("Error fetching images. {}".format(error))
+            raise
+
+    def iter_images(self, limit=None):
+        """Retrieve images page by page
+
+        :param limit: Number of images per page
+        :type limit: int, optional
+        :return: Generator of images
+        :rtype: generator
+        """
+        try:
+            path = ("/v1/images?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            yield from iter_resources(qw, "iaas", path, headers(), limit)
 
         except Exception as error:
             print("Error fetching images. {}".format(error))
@@ -81,18 +102,8 @@ class Image():
         :return: Image information
         :rtype: dict
         """
-        by_name = self.get_image_by_name(image)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_image_by_id(image)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve("images", image, self.get_image_by_name,
+                       self.get_image_by_id, self.cfg["region"])
 
     def get_image_by_id(self, id):
         """Retrieve specific image by ID
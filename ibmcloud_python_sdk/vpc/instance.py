@@ -2,6 +2,9 @@ import json
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.lookup import resolve
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import iter_resources
 from ibmcloud_python_sdk.vpc import vpc
 from ibmcloud_python_sdk.vpc import image
 from ibmcloud_python_sdk.vpc import subnet
@@ -36,7 +39,25 @@ class Instance():
             path = ("/v1/instances?version={}&generation={}".format(
                 self.cfg["version"], self.cfg["generation"]))
 
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
+
+        except Exception as error:
+            print("Error fetching instances. {}".format(error))
+            raise
+
+    def iter_instances(self, limit=None):
+        """Retrieve instances page by page
+
+        :param limit: Number of instances per page
+        :type limit: int, optional
+        :return: Generator of instances
+        :rtype: generator
+        """
+        try:
+            path = ("/v1/instances?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            yield from iter_resources(qw, "iaas", path, headers(), limit)
 
         except Exception as error:
             print("Error fetching instances. {}".format(error))
@@ -50,18 +71,8 @@ class Instance():
         :return: Instance information
         :rtype: dict
         """
-        by_name = self.get_instance_by_name(instance)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_instance_by_id(instance)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve("instances", instance, self.get_instance_by_name,
+                       self.get_instance_by_id, self.cfg["region"])
 
     def get_instance_by_id(self, id):
         """Retrieve specific instance by ID
@@ -205,7 +216,7 @@ class Instance():
                     "&generation={}".format(id, self.cfg["version"],
                                             self.cfg["generation"]))
 
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching network interfaces for instance with ID"
@@ -230,7 +241,7 @@ class Instance():
                                             self.cfg["version"],
                                             self.cfg["generation"]))
 
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching network interfaces for instance with name"
@@ -345,7 +356,7 @@ class Instance():
                                                        self.cfg["version"],
                                                        self.cfg["generation"]))
 
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching floating IPs attached to network interface"
@@ -422,7 +433,7 @@ class Instance():
                                                        self.cfg["version"],
                                                        self.cfg["generation"]))
 
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching volumes attached to instance {}. {}".format(
@@ -476,7 +487,7 @@ class Instance():
             path = ("/v1/instance/profiles?version={}&generation={}".format(
                 self.cfg["version"], self.cfg["generation"]))
 
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching instance profiles. {}".format(error))
@@ -1,7 +1,12 @@
 import json
+from functools import partial
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.lookup import context
+from ibmcloud_python_sdk.utils.lookup import resolve
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import iter_resources
 from ibmcloud_python_sdk.vpc import subnet
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
@@ -28,7 +33,25 @@ class Loadbalancer():
                 self.cfg["version"], self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
+
+        except Exception as error:
+            print("Error fetching load balancers. {}".format(error))
+            raise
+
+    def iter_lbs(self, limit=None):
+        """Retrieve load balancers page by page
+
+        :param limit: Number of load balancers per page
+        :type limit: int, optional
+        :return: Generator of load balancers
+        :rtype: generator
+        """
+        try:
+            path = ("/v1/load_balancers?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            yield from iter_resources(qw, "iaas", path, headers(), limit)
 
         except Exception as error:
             print("Error fetching load balancers. {}".format(error))
@@ -42,18 +65,8 @@ class Loadbalancer():
         :return: Load balancer information
         :rtype: dict
         """
-        by_name = self.get_lb_by_name(lb)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_lb_by_id(lb)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve("load_balancers", lb, self.get_lb_by_name,
+                       self.get_lb_by_id, self.cfg["region"])
 
     def get_lb_by_id(self, id):
         """Retrieve specific load balancer by ID
@@ -151,13 +164,14 @@ class Loadbalancer():
                                             self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching listeners for load balancer {}. {}".format(
                 lb, error))
             raise
 
+    @context()
     def get_lb_listener(self, lb, listener):
         """Retrieve specific load balancer
 
@@ -168,19 +182,17 @@ class Loadbalancer():
         :return: Listener information
         :rtype: dict
         """
-        by_port = self.get_lb_listener_by_port(lb, listener)
-        if "errors" in by_port:
-            for key_name in by_port["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_lb_listener_by_id(lb, listener)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_port
-        else:
-            return by_port
+        # Retrieve load balancer information
+        lb_info = self.get_lb(lb)
+        if "errors" in lb_info:
+            return lb_info
+
+        return resolve("listeners", listener,
+                       partial(self.get_lb_listener_by_port, lb_info["id"]),
+                       partial(self.get_lb_listener_by_id, lb_info["id"]),
+                       lb_info["id"], indexed=False)
 
+    @context()
     def get_lb_listener_by_id(self, lb, id):
         """Retrieve specific listener from load balancer by ID
 
@@ -210,6 +222,7 @@ class Loadbalancer():
                   " {}. {}".format(id, lb, error))
             raise
 
+    @context()
     def get_lb_listener_by_port(self, lb, port):
         """Retrieve specific listener from load balancer by port
 
@@ -245,6 +258,7 @@ class Loadbalancer():
                   " {}. {}".format(str(port), lb, error))
             raise
 
+    @context()
     def get_lb_listener_policies(self, lb, listener):
         """Retrieve policies for specific listeners
 
@@ -273,13 +287,14 @@ class Loadbalancer():
                                             self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching policies for listeners {} on load balancer"
                   " {}. {}".format(listener, lb, error))
             raise
 
+    @context()
     def get_lb_listener_policy(self, lb, listener, policy):
         """Retrieve specific policy from listener
 
@@ -292,19 +307,22 @@ class Loadbalancer():
         :return: Listerner information
         :rtype: dict
         """
-        by_name = self.get_lb_listener_policy_by_name(lb, listener, policy)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_lb_listener_policy_by_id(lb, listener,
-                                                              policy)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        # Retrieve load balancer information
+        lb_info = self.get_lb(lb)
+        if "errors" in lb_info:
+            return lb_info
+
+        # Retrieve listener information
+        listener_info = self.get_lb_listener(lb_info["id"], listener)
+        if "errors" in listener_info:
+            return listener_info
+
+        return resolve("policies", policy,
+                       partial(self.get_lb_listener_policy_by_name,
+                               lb_info["id"], listener_info["id"]),
+                       partial(self.get_lb_listener_policy_by_id,
+                               lb_info["id"], listener_info["id"]),
+                       listener_info["id"])
 
     def get_lb_listener_policy_by_id(self, lb, listener, id):
         """Retrieve specific policy from listener by ID
@@ -333,6 +351,7 @@ class Loadbalancer():
                   " on load balancer {}. {}".format(id, listener, lb, error))
             raise
 
+    @context()
     def get_lb_listener_policy_by_name(self, lb, listener, name):
         """Retrieve specific policy from listener by name
 
@@ -376,6 +395,7 @@ class Loadbalancer():
                   " on load balancer {}. {}".format(name, listener, lb, error))
             raise
 
+    @context()
     def get_lb_listener_policy_rules(self, lb, listener, policy):
         """Retrieve rules from listener's policy
 
@@ -413,7 +433,7 @@ class Loadbalancer():
                                                        self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching rules in policy {} for listeners {} on"
@@ -471,13 +491,14 @@ class Loadbalancer():
                                             self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching pools from load balancer {}. {}".format(
                 lb, error))
             raise
 
+    @context()
     def get_lb_pool(self, lb, pool):
         """Retrieve specific pool from load balancer
 
@@ -488,19 +509,17 @@ class Loadbalancer():
         :return: Pool information
         :rtype: dict
         """
-        by_name = self.get_lb_pool_by_name(lb, pool)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_lb_pool_by_id(lb, pool)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        # Retrieve load balancer information
+        lb_info = self.get_lb(lb)
+        if "errors" in lb_info:
+            return lb_info
+
+        return resolve("pools", pool,
+                       partial(self.get_lb_pool_by_name, lb_info["id"]),
+                       partial(self.get_lb_pool_by_id, lb_info["id"]),
+                       lb_info["id"])
 
+    @context()
     def get_lb_pool_by_id(self, lb, id):
         """Retrieve specific pool from load balancer by ID
 
@@ -531,6 +550,7 @@ class Loadbalancer():
                   " {}. {}".format(id, lb, error))
             raise
 
+    @context()
     def get_lb_pool_by_name(self, lb, name):
         """Retrieve specific pool from load balancer by name
 
@@ -566,6 +586,7 @@ class Loadbalancer():
                   " {}. {}".format(name, lb, error))
             raise
 
+    @context()
     def get_lb_pool_members(self, lb, pool):
         """Retrieve pools from loadbalancer
 
@@ -594,13 +615,14 @@ class Loadbalancer():
                                             self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching members from pool {} for load balancer"
                   " {}. {}".format(pool, lb, error))
             raise
 
+    @context()
     def get_lb_pool_member(self, lb, pool, member):
         """Retrieve specific pool from load balancer
 
@@ -608,24 +630,29 @@ class Loadbalancer():
         :type lb: str
         :param pool: Pool name or ID
         :type pool: str
-        :param member: Member ID
+        :param member: Member address or ID
         :type member: str
         :return: Member information
         :rtype: dict
         """
-        by_address = self.get_lb_pool_member_by_address(lb, pool, member)
-        if "errors" in by_address:
-            for key_name in by_address["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_lb_pool_member_by_id(lb, pool, member)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_address
-        else:
-            return by_address
+        # Retrieve load balancer information
+        lb_info = self.get_lb(lb)
+        if "errors" in lb_info:
+            return lb_info
+
+        # Retrieve pool information
+        pool_info = self.get_lb_pool(lb_info["id"], pool)
+        if "errors" in pool_info:
+            return pool_info
+
+        return resolve("members", member,
+                       partial(self.get_lb_pool_member_by_address,
+                               lb_info["id"], pool_info["id"]),
+                       partial(self.get_lb_pool_member_by_id, lb_info["id"],
+                               pool_info["id"]),
+                       pool_info["id"], indexed=False)
 
+    @context()
     def get_lb_pool_member_by_id(self, lb, pool, id):
         """Retrieve specific pool from load balancer by ID
 
@@ -663,6 +690,7 @@ class Loadbalancer():
                   " balancer {}. {}".format(id, pool, lb, error))
             raise
 
+    @context()
     def get_lb_pool_member_by_address(self, lb, pool, address):
         """Retrieve specific pool from load balancer by ID
 
@@ -692,8 +720,8 @@ class Loadbalancer():
                 return data
 
             # Loop over members until filter match
-            for member in data["pools"]:
-                if member["name"] == address:
+            for member in data["members"]:
+                if member["target"].get("address") == address:
                     # Return data
                     return member
 
@@ -702,7 +730,7 @@ class Loadbalancer():
 
         except Exception as error:
             print("Error fetching member with address {} in pool {} from"
-                  " load balancer {}. {}".format(member, pool, lb, error))
+                  " load balancer {}. {}".format(address, pool, lb, error))
             raise
 
     def create_lb(self, **kwargs):
@@ -785,6 +813,7 @@ class Loadbalancer():
             print("Error creating load balancer. {}".format(error))
             raise
 
+    @context()
     def create_listener(self, **kwargs):
         """Create listener
 
@@ -859,6 +888,7 @@ class Loadbalancer():
                 lb_info["id"], error))
             raise
 
+    @context()
     def create_policy(self, **kwargs):
         """Create policy
 
@@ -929,6 +959,7 @@ class Loadbalancer():
                   " {}. {}".format(listener_info["id"], lb_info["id"], error))
             raise
 
+    @context()
     def create_rule(self, **kwargs):
         """Create rule
 
@@ -1079,6 +1110,7 @@ class Loadbalancer():
                 lb_info["id"], error))
             raise
 
+    @context()
     def create_member(self, **kwargs):
         """Create member and add member to the pool
 
@@ -1173,6 +1205,7 @@ class Loadbalancer():
             print("Error deleting load balancer {}. {}".format(lb, error))
             raise
 
+    @context()
     def delete_listener(self, lb, listener):
         """Delete listener from load balancer
 
@@ -1214,6 +1247,7 @@ class Loadbalancer():
                   " {}".format(listener, lb, error))
             raise
 
+    @context()
     def delete_policy(self, lb, listener, policy):
         """Delete policy from listener
 
@@ -1264,6 +1298,7 @@ class Loadbalancer():
                   " {}. {}".format(policy, listener, lb, error))
             raise
 
+    @context()
     def delete_rule(self, lb, listener, policy, rule):
         """Delete rule from policy
 
@@ -1327,6 +1362,7 @@ class Loadbalancer():
                                                  error))
             raise
 
+    @context()
     def delete_pool(self, lb, pool):
         """Delete pool from load balancer
 
@@ -1368,6 +1404,7 @@ class Loadbalancer():
                   " {}".format(pool, lb, error))
             raise
 
+    @context()
     def delete_member(self, lb, pool, member):
         """Delete member from pool
 
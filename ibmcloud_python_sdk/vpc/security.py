@@ -2,6 +2,9 @@ import json
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.lookup import resolve
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import iter_resources
 from ibmcloud_python_sdk.vpc import vpc
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
@@ -30,7 +33,25 @@ class Security():
                 self.cfg["version"], self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
+
+        except Exception as error:
+            print("Error fetching security groups. {}".format(error))
+            raise
+
+    def iter_security_groups(self, limit=None):
+        """Retrieve security groups page by page
+
+        :param limit: Number of security groups per page
+        :type limit: int, optional
+        :return: Generator of security groups
+        :rtype: generator
+        """
+        try:
+            path = ("/v1/security_groups?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            yield from iter_resources(qw, "iaas", path, headers(), limit)
 
         except Exception as error:
             print("Error fetching security groups. {}".format(error))
@@ -44,18 +65,9 @@ class Security():
         :return: Security group information
         :rtype: dict
         """
-        by_name = self.get_security_group_by_name(security_group)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_security_group_by_id(security_group)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve("security_groups", security_group,
+                       self.get_security_group_by_name,
+                       self.get_security_group_by_id, self.cfg["region"])
 
     def get_security_group_by_id(self, id):
         """Retrieve specific security group by ID
@@ -127,7 +139,7 @@ class Security():
                                             self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching network interfaces associated to security"
@@ -250,7 +262,7 @@ class Security():
                                             self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching rules for security group with"
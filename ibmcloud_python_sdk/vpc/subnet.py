@@ -2,6 +2,9 @@ import json
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.lookup import resolve
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import iter_resources
 from ibmcloud_python_sdk.vpc import gateway as gw
 from ibmcloud_python_sdk.vpc import vpc
 from ibmcloud_python_sdk.vpc import acl
@@ -32,7 +35,25 @@ class Subnet():
                 self.cfg["version"], self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
+
+        except Exception as error:
+            print("Error fetching subnets. {}".format(error))
+            raise
+
+    def iter_subnets(self, limit=None):
+        """Retrieve subnets page by page
+
+        :param limit: Number of subnets per page
+        :type limit: int, optional
+        :return: Generator of subnets
+        :rtype: generator
+        """
+        try:
+            path = ("/v1/subnets?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            yield from iter_resources(qw, "iaas", path, headers(), limit)
 
         except Exception as error:
             print("Error fetching subnets. {}".format(error))
@@ -46,18 +67,8 @@ class Subnet():
         :return: Subnet information
         :rtype: dict
         """
-        by_name = self.get_subnet_by_name(subnet)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_subnet_by_id(subnet)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve("subnets", subnet, self.get_subnet_by_name,
+                       self.get_subnet_by_id, self.cfg["region"])
 
     def get_subnet_by_id(self, id):
         """Retrieve specific subnet by ID
@@ -2,6 +2,9 @@ import json
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.lookup import resolve
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import iter_resources
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
@@ -26,7 +29,7 @@ class Volume():
                 self.cfg["version"], self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching volume profiles. {}".format(error))
@@ -66,7 +69,25 @@ class Volume():
                 self.cfg["version"], self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
+
+        except Exception as error:
+            print("Error fetching volumes. {}".format(error))
+            raise
+
+    def iter_volumes(self, limit=None):
+        """Retrieve volumes page by page
+
+        :param limit: Number of volumes per page
+        :type limit: int, optional
+        :return: Generator of volumes
+        :rtype: generator
+        """
+        try:
+            path = ("/v1/volumes?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            yield from iter_resources(qw, "iaas", path, headers(), limit)
 
         except Exception as error:
             print("Error fetching volumes. {}".format(error))
@@ -80,18 +101,8 @@ class Volume():
         :return: Volume information
         :rtype: dict
         """
-        by_name = self.get_volume_by_name(volume)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_volume_by_id(volume)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve("volumes", volume, self.get_volume_by_name,
+                       self.get_volume_by_id, self.cfg["region"])
 
     def get_volume_by_id(self, id):
         """Retrieve specific volume by ID
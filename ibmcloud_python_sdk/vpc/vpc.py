@@ -3,6 +3,9 @@ import json
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.lookup import resolve
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import iter_resources
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
 from ibmcloud_python_sdk.utils.common import check_args
@@ -27,7 +30,25 @@ class Vpc():
                 self.cfg["version"], self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
+
+        except Exception as error:
+            print("Error fetching VPCs. {}".format(error))
+            raise
+
+    def iter_vpcs(self, limit=None):
+        """Retrieve VPCs page by page
+
+        :param limit: Number of VPCs per page
+        :type limit: int, optional
+        :return: Generator of VPCs
+        :rtype: generator
+        """
+        try:
+            path = ("/v1/vpcs?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            yield from iter_resources(qw, "iaas", path, headers(), limit)
 
         except Exception as error:
             print("Error fetching VPCs. {}".format(error))
@@ -41,18 +62,8 @@ class Vpc():
         :return: VPC information
         :rtype: dict
         """
-        by_name = self.get_vpc_by_name(vpc)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_vpc_by_id(vpc)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve("vpcs", vpc, self.get_vpc_by_name,
+                       self.get_vpc_by_id, self.cfg["region"])
 
     def get_vpc_by_id(self, id):
         """Retrieve specific VPC by ID
@@ -178,7 +189,7 @@ class Vpc():
                                             self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching address prefixes in VPC {}. {}".format(
@@ -339,7 +350,7 @@ class Vpc():
                                             self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching routes from VPC {}. {}".format(
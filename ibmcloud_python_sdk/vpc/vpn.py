@@ -2,6 +2,9 @@ import json
 from ibmcloud_python_sdk.config import params
 from ibmcloud_python_sdk.auth import get_headers as headers
 from ibmcloud_python_sdk.utils.common import query_wrapper as qw
+from ibmcloud_python_sdk.utils.lookup import resolve
+from ibmcloud_python_sdk.utils.common import query_all
+from ibmcloud_python_sdk.utils.common import iter_resources
 from ibmcloud_python_sdk.vpc import subnet
 from ibmcloud_python_sdk.utils.common import resource_not_found
 from ibmcloud_python_sdk.utils.common import resource_deleted
@@ -30,7 +33,25 @@ class Vpn():
                 self.cfg["version"], self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
+
+        except Exception as error:
+            print("Error fetching IKE policies. {}".format(error))
+            raise
+
+    def iter_ike_policies(self, limit=None):
+        """Retrieve IKE policies page by page
+
+        :param limit: Number of IKE policies per page
+        :type limit: int, optional
+        :return: Generator of IKE policies
+        :rtype: generator
+        """
+        try:
+            path = ("/v1/ike_policies?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            yield from iter_resources(qw, "iaas", path, headers(), limit)
 
         except Exception as error:
             print("Error fetching IKE policies. {}".format(error))
@@ -44,18 +65,8 @@ class Vpn():
         :return: IKE policy information
         :rtype: dict
         """
-        by_name = self.get_ike_policy_by_name(policy)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_ike_policy_by_id(policy)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve("ike_policies", policy, self.get_ike_policy_by_name,
+                       self.get_ike_policy_by_id, self.cfg["region"])
 
     def get_ike_policy_by_id(self, id):
         """Retrieve specific IKE policy by ID
@@ -125,7 +136,7 @@ class Vpn():
                                             self.cfg["version"],
                                             self.cfg["generation"]))
 
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching connection for IKE policy {}. {}".format(
@@ -144,7 +155,25 @@ class Vpn():
                 self.cfg["version"], self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
+
+        except Exception as error:
+            print("Error fetching IPsec policies. {}".format(error))
+            raise
+
+    def iter_ipsec_policies(self, limit=None):
+        """Retrieve IPsec policies page by page
+
+        :param limit: Number of IPsec policies per page
+        :type limit: int, optional
+        :return: Generator of IPsec policies
+        :rtype: generator
+        """
+        try:
+            path = ("/v1/ipsec_policies?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            yield from iter_resources(qw, "iaas", path, headers(), limit)
 
         except Exception as error:
             print("Error fetching IPsec policies. {}".format(error))
@@ -158,18 +187,9 @@ class Vpn():
         :return: IPSec policy information
         :rtype: dict
         """
-        by_name = self.get_ipsec_policy_by_name(policy)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_ike_policy_by_id(policy)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve("ipsec_policies", policy,
+                       self.get_ipsec_policy_by_name,
+                       self.get_ipsec_policy_by_id, self.cfg["region"])
 
     def get_ipsec_policy_by_id(self, id):
         """Retrieve specific IPsec policy by ID
@@ -240,7 +260,7 @@ class Vpn():
                                             self.cfg["version"],
                                             self.cfg["generation"]))
 
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching connection for IPsec policy {}. {}".format(
@@ -259,7 +279,25 @@ class Vpn():
                 self.cfg["version"], self.cfg["generation"]))
 
             # Return data
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
+
+        except Exception as error:
+            print("Error fetching VPN gateways. {}".format(error))
+            raise
+
+    def iter_vpn_gateways(self, limit=None):
+        """Retrieve VPN gateways page by page
+
+        :param limit: Number of VPN gateways per page
+        :type limit: int, optional
+        :return: Generator of VPN gateways
+        :rtype: generator
+        """
+        try:
+            path = ("/v1/vpn_gateways?version={}&generation={}".format(
+                self.cfg["version"], self.cfg["generation"]))
+
+            yield from iter_resources(qw, "iaas", path, headers(), limit)
 
         except Exception as error:
             print("Error fetching VPN gateways. {}".format(error))
@@ -273,18 +311,8 @@ class Vpn():
         :return: Gateway information
         :rtype: dict
         """
-        by_name = self.get_vpn_gateway_by_name(gateway)
-        if "errors" in by_name:
-            for key_name in by_name["errors"]:
-                if key_name["code"] == "not_found":
-                    by_id = self.get_vpn_gateway_by_id(gateway)
-                    if "errors" in by_id:
-                        return by_id
-                    return by_id
-                else:
-                    return by_name
-        else:
-            return by_name
+        return resolve("vpn_gateways", gateway, self.get_vpn_gateway_by_name,
+                       self.get_vpn_gateway_by_id, self.cfg["region"])
 
     def get_vpn_gateway_by_id(self, id):
         """Retrieve specific VPN gateway by ID
@@ -355,7 +383,7 @@ class Vpn():
                                             self.cfg["version"],
                                             self.cfg["generation"]))
 
-            return qw("iaas", "GET", path, headers())["data"]
+            return query_all(qw, "iaas", path, headers())
 
         except Exception as error:
             print("Error fetching connections for VPN gateway {}. {}".format(
@@ -0,0 +1,258 @@
+import asyncio
+import http.client
+import json
+import socket
+import threading
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk import auth
+from ibmcloud_python_sdk.aio import transport
+from ibmcloud_python_sdk.aio import vpc
+from ibmcloud_python_sdk.utils import common
+from ibmcloud_python_sdk.utils import retry
+from tests.common import get_headers, get_all
+from tests.server import Store
+
+
+async def send(request, record=None):
+    """This function is used to mock the asyncio transport. It returns
+    information collected from get_all() function.
+    """
+    conn_type, host, method, path, payload, headers = request
+    data = json.dumps(get_all(path)['data']).encode('utf-8')
+    return transport.Response(200, 'OK', []), data
+
+
+class StoreSend():
+    """This class mocks the asyncio transport with the mock API store and
+    counts the queries sent.
+    """
+    def __init__(self, subnets):
+        self.store = Store('mock-account', 'us-south', 0)
+        self.store.generate('/v1/subnets', subnets)
+        self.paths = []
+
+    async def __call__(self, request, record=None):
+        conn_type, host, method, path, payload, headers = request
+        self.paths.append(path)
+        status, response_headers, data = self.store.respond(
+            method, path, headers or {}, payload)
+        return transport.Response(status, '', response_headers), data
+
+
+class AsyncResourceTestCase(TestCase):
+
+    def setUp(self):
+        auth.token_manager.reset()
+        self.patcher = patch('ibmcloud_python_sdk.auth.get_token',
+                             lambda url, key: get_headers()['Authorization'])
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        auth.token_manager.reset()
+
+    @patch('ibmcloud_python_sdk.aio.resource._send', send)
+    def test_get_subnets(self):
+        response = asyncio.run(vpc.Subnet().get_subnets())
+        self.assertEqual(response['total_count'], 2)
+
+    @patch('ibmcloud_python_sdk.aio.resource._send', send)
+    def test_concurrent_get_subnet(self):
+        subnet = vpc.Subnet()
+
+        async def fetch():
+            data = await subnet.get_subnets()
+            return await asyncio.gather(*[
+                subnet.get_subnet_by_id(item['id'])
+                for item in data['subnets']])
+
+        response = asyncio.run(fetch())
+        self.assertEqual(len(response), 2)
+        self.assertNotIn('errors', response[0])
+
+    @patch('ibmcloud_python_sdk.aio.resource._send', send)
+    def test_iter_subnets(self):
+        async def collect():
+            return [item async for item in vpc.Subnet().iter_subnets()]
+
+        self.assertEqual(len(asyncio.run(collect())), 2)
+
+    def test_iter_subnets_sends_each_page_once(self):
+        fake = StoreSend(2998)
+
+        async def collect():
+            return [item['name'] async for item
+                    in vpc.Subnet().iter_subnets(limit=100)]
+
+        with patch('ibmcloud_python_sdk.aio.resource._send', fake):
+            with patch('ibmcloud_python_sdk.vpc.subnet.qw',
+                       wraps=common.query_wrapper) as qw:
+                names = asyncio.run(collect())
+
+        self.assertEqual(len(names), 3000)
+        self.assertEqual(len(set(names)), 3000)
+        self.assertEqual(len(fake.paths), 30)
+        self.assertEqual(qw.call_count, 30)
+
+    def test_get_subnets_sends_each_page_once(self):
+        fake = StoreSend(2998)
+        with patch('ibmcloud_python_sdk.aio.resource._send', fake):
+            data = asyncio.run(vpc.Subnet().get_subnets())
+
+        self.assertEqual(len(data['subnets']), 3000)
+        # Pages of 50 subnets by default
+        self.assertEqual(len(fake.paths), 60)
+
+    @patch('ibmcloud_python_sdk.aio.resource._send', send)
+    def test_runs_off_event_loop(self):
+        threads = []
+
+        def record(*args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return common.query_wrapper(*args, **kwargs)
+
+        with patch('ibmcloud_python_sdk.vpc.subnet.qw', record):
+            asyncio.run(vpc.Subnet().get_subnets())
+
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith('ibmcloud-sdk-aio'))
+
+
+class TransportTestCase(TestCase):
+
+    def test_keep_alive(self):
+        connections = []
+
+        async def handle(reader, writer):
+            connections.append(writer)
+            try:
+                while await reader.readuntil(b'\r\n\r\n'):
+                    writer.write(b'HTTP/1.1 200 OK\r\nContent-Length: 2'
+                                 b'\r\n\r\n{}')
+                    await writer.drain()
+            except asyncio.IncompleteReadError:
+                writer.close()
+
+        async def query():
+            server = await asyncio.start_server(handle, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            conn = transport.ConnectionPool('127.0.0.1:{}'.format(port),
+                                            tls=False)
+            first = await conn.request('GET', '/v1/vpcs')
+            second = await conn.request('GET', '/v1/vpcs')
+            conn.clear()
+            server.close()
+            return first, second
+
+        first, second = asyncio.run(query())
+        self.assertEqual(first[0].status, 200)
+        self.assertEqual(second[1], b'{}')
+        self.assertEqual(len(connections), 1)
+
+    def test_chunked_response(self):
+        async def handle(reader, writer):
+            await reader.readuntil(b'\r\n\r\n')
+            writer.write(b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n'
+                         b'Connection: close\r\n\r\n'
+                         b'3\r\n{"a\r\n4\r\n": 1\r\n1\r\n}\r\n0\r\n\r\n')
+            await writer.drain()
+            writer.close()
+
+        async def query():
+            server = await asyncio.start_server(handle, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            conn = transport.ConnectionPool('127.0.0.1:{}'.format(port),
+                                            tls=False)
+            response = await conn.request('GET', '/v1/vpcs')
+            server.close()
+            return response, len(conn.idle)
+
+        (res, data), idle = asyncio.run(query())
+        self.assertEqual(json.loads(data), {'a': 1})
+        self.assertTrue(res.will_close)
+        self.assertEqual(idle, 0)
+
+    def serve(self, drop=(), delay=0):
+        """This function answers keep-alive queries on a local server, the
+        queries listed in drop are read then the connection is closed
+        without response.
+        """
+        received = []
+
+        async def handle(reader, writer):
+            try:
+                while True:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                    length = 0
+                    for line in head.split(b'\r\n'):
+                        name, _, value = line.partition(b':')
+                        if name.lower() == b'content-length':
+                            length = int(value)
+                    await reader.readexactly(length)
+                    received.append(head.split(b' ')[0].decode())
+                    if len(received) in drop:
+                        writer.close()
+                        return
+                    await asyncio.sleep(delay)
+                    writer.write(b'HTTP/1.1 200 OK\r\nContent-Length: 2'
+                                 b'\r\n\r\n{}')
+                    await writer.drain()
+            except (asyncio.IncompleteReadError, ConnectionError):
+                writer.close()
+
+        return received, handle
+
+    def test_idempotent_resent(self):
+        received, handle = self.serve(drop=(2,))
+
+        async def query():
+            server = await asyncio.start_server(handle, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            conn = transport.ConnectionPool('127.0.0.1:{}'.format(port),
+                                            tls=False)
+            await conn.request('GET', '/v1/vpcs')
+            res, _ = await conn.request('GET', '/v1/vpcs')
+            conn.clear()
+            server.close()
+            return res
+
+        self.assertEqual(asyncio.run(query()).status, 200)
+        self.assertEqual(received, ['GET', 'GET', 'GET'])
+
+    def test_post_not_resent(self):
+        received, handle = self.serve(drop=(2,))
+
+        async def query():
+            server = await asyncio.start_server(handle, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            conn = transport.ConnectionPool('127.0.0.1:{}'.format(port),
+                                            tls=False)
+            await conn.request('GET', '/v1/vpcs')
+            try:
+                await conn.request('POST', '/v1/instances', '{}',
+                                   {'Content-Type': 'application/json'})
+            finally:
+                conn.clear()
+                server.close()
+
+        with self.assertRaises(http.client.RemoteDisconnected):
+            asyncio.run(query())
+        self.assertEqual(received, ['GET', 'POST'])
+
+    def test_timeout_is_retryable(self):
+        received, handle = self.serve(delay=1)
+
+        async def query():
+            server = await asyncio.start_server(handle, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            conn = transport.ConnectionPool('127.0.0.1:{}'.format(port),
+                                            timeout=0.05, tls=False)
+            try:
+                await conn.request('GET', '/v1/vpcs')
+            finally:
+                server.close()
+
+        with self.assertRaises(socket.timeout) as context:
+            asyncio.run(query())
+        self.assertTrue(retry.retryable('GET', error=context.exception))
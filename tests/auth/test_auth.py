@@ -1,13 +1,20 @@
 import json
 import os
+import threading
+import time
+import jwt
 from unittest import TestCase
 from mock import patch
+from ibmcloud_python_sdk.utils import common
 from ibmcloud_python_sdk.utils import constants
-from ibmcloud_python_sdk.auth import decode_token, get_token
+from ibmcloud_python_sdk.auth import decode_token, get_token, TokenManager
 from tests.common import get_headers, qw_exception
 
 
 class AuthTestCase(TestCase):
+    def setUp(self):
+        common.claims.cache_clear()
+
     def read_token():
         """This function returns a generated JSON token.
         """
@@ -18,7 +25,7 @@ class AuthTestCase(TestCase):
             except json.JSONDecodeError as err:
                 return err
 
-    def read_decode(token, verify):
+    def read_decode(token, **kwargs):
         """This function returns a decoded JSON token.
         """
         data_file = f'{os.path.dirname(__file__)}/decode.json'
@@ -36,13 +43,21 @@ class AuthTestCase(TestCase):
         return {'data': AuthTestCase.read_token()}
 
     @patch('ibmcloud_python_sdk.auth.get_headers', get_headers)
-    @patch('ibmcloud_python_sdk.auth.decode', read_decode)
+    @patch('ibmcloud_python_sdk.utils.common.decode', read_decode)
     def test_decode_token(self):
         response = decode_token()
         self.assertEqual(response['given_name'], 'Unittest')
 
+    @patch('ibmcloud_python_sdk.auth.get_headers', get_headers)
+    def test_decode_token_is_memoized(self):
+        with patch('ibmcloud_python_sdk.utils.common.decode',
+                   wraps=AuthTestCase.read_decode) as decode:
+            decode_token()['given_name'] = 'Changed'
+            self.assertEqual(decode_token()['given_name'], 'Unittest')
+            self.assertEqual(decode.call_count, 1)
+
     @patch('ibmcloud_python_sdk.auth.get_headers', qw_exception)
-    @patch('ibmcloud_python_sdk.auth.decode', read_decode)
+    @patch('ibmcloud_python_sdk.utils.common.decode', read_decode)
     def test_decode_token_exception(self):
         with self.assertRaises(Exception):
             decode_token()
@@ -61,4 +76,91 @@ class AuthTestCase(TestCase):
         with self.assertRaises(Exception):
             get_token(constants.AUTH_URL,
             '60230291428a3576752104555fa0f623b5045f08'
-        )
\ No newline at end of file
+        )
+
+
+class TokenManagerTestCase(TestCase):
+    def setUp(self):
+        common.claims.cache_clear()
+        self.calls = 0
+        self.manager = TokenManager(margin=60)
+
+    def token(self, lifetime):
+        """This function returns a signed JWT token expiring after lifetime
+        seconds.
+        """
+        self.calls += 1
+        claims = {'exp': int(time.time()) + lifetime, 'n': self.calls,
+                  'account': {'bss': f'account-{self.calls}'}}
+        token = jwt.encode(claims, 'unittest-secret-key-for-hs256-jwt',
+                           algorithm='HS256')
+        return f'Bearer {token}'
+
+    def test_get_reuses_valid_token(self):
+        with patch('ibmcloud_python_sdk.auth.get_token',
+                   lambda url, key: self.token(3600)):
+            first = self.manager.get()
+            self.assertEqual(self.manager.get(), first)
+            self.assertEqual(self.calls, 1)
+
+    def test_get_refreshes_token_before_expiration(self):
+        with patch('ibmcloud_python_sdk.auth.get_token',
+                   lambda url, key: self.token(30)):
+            first = self.manager.get()
+            self.assertNotEqual(self.manager.get(), first)
+            self.assertEqual(self.calls, 2)
+
+    def test_account_id_follows_token(self):
+        with patch('ibmcloud_python_sdk.auth.get_token',
+                   lambda url, key: self.token(30)):
+            self.assertEqual(self.manager.account_id, 'account-1')
+            self.assertEqual(self.manager.account_id, 'account-2')
+
+    def test_concurrent_refresh_is_shared(self):
+        started = threading.Event()
+
+        def slow_token(url, key):
+            started.set()
+            time.sleep(0.2)
+            return self.token(3600)
+
+        results = []
+        with patch('ibmcloud_python_sdk.auth.get_token', slow_token):
+            threads = [threading.Thread(
+                target=lambda: results.append(self.manager.get()))
+                for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(len(set(results)), 1)
+
+    def test_refresh_error_is_raised(self):
+        with patch('ibmcloud_python_sdk.auth.get_token', qw_exception):
+            with self.assertRaises(Exception):
+                self.manager.get()
+
+    def test_stop_cancels_every_timer(self):
+        before = {t for t in threading.enumerate()
+                  if isinstance(t, threading.Timer)}
+        with patch('ibmcloud_python_sdk.auth.get_token',
+                   lambda url, key: self.token(3600)):
+            self.manager.start()
+            for _ in range(5):
+                self.manager.refresh(force=True)
+            timers = [t for t in threading.enumerate()
+                      if isinstance(t, threading.Timer)
+                      and t not in before and t.is_alive()]
+            self.assertEqual(len(timers), 1)
+            self.manager.stop()
+            # Refreshes after stop() don't restart the background refresh
+            self.manager.refresh(force=True)
+
+        for timer in timers:
+            timer.join(1)
+        self.assertEqual([t for t in threading.enumerate()
+                          if isinstance(t, threading.Timer)
+                          and t not in before], [])
+        self.assertIsNone(self.manager.timer)
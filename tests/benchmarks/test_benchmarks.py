@@ -0,0 +1,29 @@
+from unittest import TestCase
+from benchmarks import runner
+from benchmarks import bench_config  # noqa: F401
+from benchmarks import bench_lookup  # noqa: F401
+
+
+class BenchmarksTestCase(TestCase):
+
+    def test_cases_expand_parameters(self):
+        keys = [runner.key({'name': name, 'params': params})
+                for name, params, _ in runner.cases('lookup.by_name')]
+        self.assertEqual(keys, ['lookup.by_name[size=100]',
+                                'lookup.by_name[size=1000]',
+                                'lookup.by_name[size=5000]'])
+
+    def test_run(self):
+        results = runner.run('config.params', repeat=2, min_time=0.001)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['repeat'], 2)
+        self.assertGreater(results[0]['median'], 0)
+
+    def test_compare(self):
+        baseline = [{'name': 'a', 'params': {}, 'median': 1.0},
+                    {'name': 'b', 'params': {'size': 1}, 'median': 1.0}]
+        results = [{'name': 'a', 'params': {}, 'median': 1.1},
+                   {'name': 'b', 'params': {'size': 1}, 'median': 1.5},
+                   {'name': 'c', 'params': {}, 'median': 9.0}]
+        self.assertEqual(runner.compare(results, baseline, 1.2),
+                         [('b[size=1]', 1.5)])
@@ -0,0 +1,407 @@
+import json
+from types import SimpleNamespace
+from unittest import TestCase
+from mock import patch, MagicMock
+from ibmcloud_python_sdk.utils import cache
+from ibmcloud_python_sdk.utils import common
+
+
+class CacheTestCase(TestCase):
+
+    def setUp(self):
+        self.config = {'cache_ttl': 60, 'memcached': ['127.0.0.1:11211']}
+        self.patcher = patch('ibmcloud_python_sdk.utils.cache.sdk',
+                             lambda: self.config)
+        self.patcher.start()
+        cache.reset()
+
+    def tearDown(self):
+        self.patcher.stop()
+        cache.reset()
+
+    def test_client_not_configured(self):
+        self.config = False
+        self.assertFalse(cache.client())
+
+    def test_client_is_reused(self):
+        self.assertIs(cache.client(), cache.client())
+
+    def test_client_rebuilt_when_nodes_change(self):
+        first = cache.client()
+        self.config = {'memcached': ['127.0.0.1:11211', '127.0.0.1:11212']}
+        second = cache.client()
+        self.assertIsNot(first, second)
+        self.assertIs(second, cache.client())
+
+    def test_client_rebuilt_after_fork(self):
+        first = cache.client()
+        cache.memcached_pid = -1
+        self.assertIsNot(first, cache.client())
+
+    def test_get_item_failure_is_a_miss(self):
+        broken = MagicMock()
+        broken.get.side_effect = ConnectionRefusedError
+        with patch('ibmcloud_python_sdk.utils.cache.client', lambda: broken):
+            self.assertIsNone(cache.get_item('key'))
+
+
+class LocalCacheTestCase(TestCase):
+
+    def setUp(self):
+        self.cache = cache.LocalCache(max_entries=2, max_size=100, ttl=60)
+
+    def test_get_returns_stored_object(self):
+        value = {'subnets': []}
+        self.cache.set('key', value, 10)
+        self.assertIs(self.cache.get('key'), value)
+
+    def test_least_recently_used_is_evicted(self):
+        self.cache.set('a', 1, 10)
+        self.cache.set('b', 2, 10)
+        self.cache.get('a')
+        self.cache.set('c', 3, 10)
+        self.assertIsNone(self.cache.get('b'))
+        self.assertEqual(self.cache.get('a'), 1)
+        self.assertEqual(self.cache.get('c'), 3)
+
+    def test_size_is_bounded(self):
+        self.cache.set('a', 1, 60)
+        self.cache.set('b', 2, 60)
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(self.cache.size, 60)
+
+    def test_expired_entry_is_a_miss(self):
+        self.cache.set('a', 1, 10, ttl=-1)
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual(self.cache.size, 0)
+
+    def test_lookup_without_memcached(self):
+        config = {'local_cache': {'max_entries': 10}}
+        with patch('ibmcloud_python_sdk.utils.cache.sdk', lambda: config):
+            _, generation = cache.lookup('key', 'ns')
+            cache.store('key', 'ns', generation, b'{"id": 1}', {'id': 1})
+            self.assertEqual(cache.lookup('key', 'ns')[0], {'id': 1})
+
+
+class FakeMemcached():
+    """This class mimics the pymemcache client methods used by the cache
+    module.
+    """
+    def __init__(self):
+        self.items = {}
+        self.expires = {}
+
+    def get(self, key):
+        return self.items.get(key)
+
+    def get_many(self, keys):
+        return {key: self.items[key] for key in keys if key in self.items}
+
+    def set_many(self, values, expire=0, noreply=None):
+        for key, value in values.items():
+            self.set(key, value, expire)
+        return []
+
+    def set(self, key, value, expire=0, noreply=None):
+        self.expires[key] = expire
+        self.items[key] = value if isinstance(value, bytes) \
+            else str(value).encode()
+
+    def add(self, key, value, expire=0, noreply=None):
+        if key in self.items:
+            return False
+        self.set(key, value)
+        return True
+
+    def incr(self, key, value, noreply=False):
+        if key not in self.items:
+            return None
+        self.items[key] = str(int(self.items[key]) + value).encode()
+        return int(self.items[key])
+
+    def decr(self, key, value, noreply=False):
+        return self.incr(key, -value)
+
+
+class InvalidationTestCase(TestCase):
+
+    def setUp(self):
+        self.memcached = FakeMemcached()
+        self.config = {'cache_ttl': 60, 'local_cache': True}
+        self.patchers = [
+            patch('ibmcloud_python_sdk.utils.cache.sdk', lambda: self.config),
+            patch('ibmcloud_python_sdk.utils.cache.client',
+                  lambda: self.memcached),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+        cache.local().clear()
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def cached(self, path):
+        key = f'acc{path}'
+        namespace = cache.namespace('acc', 'iaas', path)
+        item, generation = cache.lookup(key, namespace)
+        if item is None:
+            cache.store(key, namespace, generation, b'{"id": 1}', {'id': 1})
+        return item
+
+    def test_namespace_is_the_collection(self):
+        self.assertEqual(
+            cache.namespace('acc', 'iaas', '/v1/subnets/0717-a1b2c3d4-e5f6-'
+                            '4a5b-8c9d-0e1f2a3b4c5d/public_gateway?version=1'),
+            cache.namespace('acc', 'iaas', '/v1/subnets?version=1'))
+
+    def test_mutation_invalidates_collection_and_items(self):
+        collection = '/v1/subnets?version=1&generation=2'
+        item = ('/v1/subnets/0717-a1b2c3d4-e5f6-4a5b-8c9d-0e1f2a3b4c5d'
+                '?version=1')
+        self.cached(collection)
+        self.cached(item)
+        self.assertIsNotNone(self.cached(collection))
+        self.assertIsNotNone(self.cached(item))
+
+        cache.invalidate('acc', 'iaas', item)
+        self.assertIsNone(self.cached(collection))
+        self.assertIsNone(self.cached(item))
+
+    def test_invalidation_is_shared_through_memcached(self):
+        collection = '/v1/instances?version=1&generation=2'
+        self.cached(collection)
+        cache.local().clear()
+        self.assertIsNotNone(self.cached(collection))
+
+        # Another process deletes an instance
+        namespace = cache._key(cache.namespace('acc', 'iaas', collection))
+        self.memcached.incr(namespace, 1)
+        cache.local().clear()
+        self.assertIsNone(self.cached(collection))
+
+    def test_related_collections_are_invalidated(self):
+        volumes = '/v1/volumes?version=1&generation=2'
+        self.cached(volumes)
+        cache.invalidate('acc', 'iaas', '/v1/instances?version=1')
+        self.assertIsNone(self.cached(volumes))
+
+    def test_other_collections_are_kept(self):
+        vpcs = '/v1/vpcs?version=1&generation=2'
+        self.cached(vpcs)
+        cache.invalidate('acc', 'iaas', '/v1/keys?version=1')
+        self.assertIsNotNone(self.cached(vpcs))
+
+
+class StampedeTestCase(TestCase):
+
+    def setUp(self):
+        self.memcached = FakeMemcached()
+        self.config = {'cache_ttl': 60, 'cache_stale_ttl': 30}
+        self.now = 1000.0
+        self.patchers = [
+            patch('ibmcloud_python_sdk.utils.cache.sdk', lambda: self.config),
+            patch('ibmcloud_python_sdk.utils.cache.client',
+                  lambda: self.memcached),
+            patch('ibmcloud_python_sdk.utils.cache.time.time',
+                  lambda: self.now),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+        self.namespace = cache.namespace('acc', 'iaas', '/v1/instances')
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def store(self, value):
+        _, generation = cache.lookup('acc/v1/instances', self.namespace)
+        cache.store('acc/v1/instances', self.namespace, generation,
+                    value.encode(), None)
+
+    def test_fresh_entry(self):
+        self.store('{"id": 1}')
+        item, _ = cache.lookup('acc/v1/instances', self.namespace)
+        self.assertEqual(item, {'id': 1})
+
+    def test_single_worker_refreshes_stale_entry(self):
+        self.store('{"id": 1}')
+        self.now += 61
+
+        # The first worker gets the lease and refreshes the entry
+        item, generation = cache.lookup('acc/v1/instances', self.namespace)
+        self.assertIsNone(item)
+        self.assertIsNotNone(generation)
+
+        # Other workers are served the stale entry meanwhile
+        item, _ = cache.lookup('acc/v1/instances', self.namespace)
+        self.assertEqual(item, {'id': 1})
+
+        cache.store('acc/v1/instances', self.namespace, generation,
+                    b'{"id": 2}', None)
+        item, _ = cache.lookup('acc/v1/instances', self.namespace)
+        self.assertEqual(item, {'id': 2})
+
+    def test_invalidated_entry_is_not_served_stale(self):
+        self.store('{"id": 1}')
+        self.now += 61
+        cache.lookup('acc/v1/instances', self.namespace)
+        cache.invalidate('acc', 'iaas', '/v1/instances')
+        item, _ = cache.lookup('acc/v1/instances', self.namespace)
+        self.assertIsNone(item)
+
+
+class TtlRulesTestCase(TestCase):
+
+    def setUp(self):
+        self.memcached = FakeMemcached()
+        self.config = {'cache_ttl': 60, 'cache_stale_ttl': 30,
+                       'cache_ttl_rules': {'/v1/vpcs*': 300,
+                                           '/v1/regions/*/zones*': 0}}
+        self.patchers = [
+            patch('ibmcloud_python_sdk.utils.cache.sdk', lambda: self.config),
+            patch('ibmcloud_python_sdk.utils.cache.client',
+                  lambda: self.memcached),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def test_default_rules_disabled(self):
+        self.assertIsNone(cache.ttl('/v1/regions?version=1'))
+        self.assertIsNone(cache.ttl('/v1/instances/0717-a1b2?version=1'))
+        self.assertIsNone(cache.ttl('/pcloud/v1/tasks/a1b2c3'))
+
+    def test_default_rules(self):
+        self.config['cache_ttl_defaults'] = True
+        self.assertEqual(cache.ttl('/v1/regions?version=1'), 86400)
+        self.assertEqual(cache.ttl('/v1/instances/0717-a1b2?version=1'), 10)
+        self.assertEqual(cache.ttl('/v1/instance/profiles?version=1'), 86400)
+        self.assertEqual(cache.ttl('/pcloud/v1/tasks/a1b2c3'), 0)
+
+    def test_configured_rules_first(self):
+        self.config['cache_ttl_defaults'] = True
+        self.assertEqual(cache.ttl('/v1/vpcs?version=1'), 300)
+        self.assertEqual(cache.ttl('/v1/regions/us-south/zones?version=1'),
+                         0)
+
+    def test_no_rule(self):
+        self.assertIsNone(cache.ttl('/v1/subnets?version=1'))
+
+    def test_store_with_ttl(self):
+        namespace = cache.namespace('acc', 'iaas', '/v1/regions')
+        _, generation = cache.lookup('acc/v1/regions', namespace, 86400)
+        cache.store('acc/v1/regions', namespace, generation, b'{}', {},
+                    86400)
+        self.assertEqual(self.memcached.expires['acc/v1/regions'],
+                         86400 + 30)
+
+
+class ChunkTestCase(TestCase):
+
+    def setUp(self):
+        self.memcached = FakeMemcached()
+        self.config = {'cache_ttl': 60, 'memcached_item_size': 64,
+                       'cache_compression': 'none'}
+        self.patchers = [
+            patch('ibmcloud_python_sdk.utils.cache.sdk', lambda: self.config),
+            patch('ibmcloud_python_sdk.utils.codec.sdk', lambda: self.config),
+            patch('ibmcloud_python_sdk.utils.cache.client',
+                  lambda: self.memcached),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+        self.namespace = cache.namespace('acc', 'iaas', '/v1/images')
+        self.data = {'images': [{'id': index} for index in range(20)]}
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def store(self):
+        _, generation = cache.lookup('acc/v1/images', self.namespace)
+        cache.store('acc/v1/images', self.namespace, generation,
+                    json.dumps(self.data).encode(), self.data)
+
+    def test_large_value_is_chunked(self):
+        self.store()
+        self.assertGreater(len(self.memcached.items), 3)
+        item, _ = cache.lookup('acc/v1/images', self.namespace)
+        self.assertEqual(item, self.data)
+
+    def test_missing_chunk_is_a_miss(self):
+        self.store()
+        chunk = [key for key in self.memcached.items
+                 if key.endswith(':0')][0]
+        del self.memcached.items[chunk]
+        item, _ = cache.lookup('acc/v1/images', self.namespace)
+        self.assertIsNone(item)
+
+
+class RevalidationTestCase(TestCase):
+
+    def setUp(self):
+        self.memcached = FakeMemcached()
+        self.config = {'cache_ttl': 60, 'cache_stale_ttl': 30}
+        self.now = 1000.0
+        self.requests = []
+        self.patchers = [
+            patch('ibmcloud_python_sdk.utils.cache.sdk', lambda: self.config),
+            patch('ibmcloud_python_sdk.utils.cache.client',
+                  lambda: self.memcached),
+            patch('ibmcloud_python_sdk.utils.cache.time.time',
+                  lambda: self.now),
+            patch('ibmcloud_python_sdk.utils.cache.time.monotonic',
+                  lambda: self.now),
+            patch('ibmcloud_python_sdk.utils.common._account_id',
+                  lambda headers: 'acc'),
+            patch('ibmcloud_python_sdk.utils.common.pool.get_pool',
+                  lambda host, timeout=None: self),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+        cache.generations.clear()
+        cache.local_cache = None
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def request(self, method, path, payload=None, headers=None):
+        """This method mimics a connection pool serving a resource with an
+        ETag.
+        """
+        self.requests.append(headers.get('If-None-Match'))
+        etag = {'ETag': '"v1"'}
+        if headers.get('If-None-Match') == '"v1"':
+            return SimpleNamespace(status=304, reason='Not Modified',
+                                   getheader=etag.get), b''
+        return SimpleNamespace(status=200, reason='OK',
+                               getheader=etag.get), b'{"id": "vpc"}'
+
+    def query(self):
+        return common.query_wrapper('iaas', 'GET', '/v1/vpcs/0717-a1b2c3',
+                                    {'Authorization': 'Bearer token'})
+
+    def test_expired_entry_is_revalidated(self):
+        self.query()
+        self.now += 61
+        response = self.query()
+        self.assertEqual(response['data'], {'id': 'vpc'})
+        self.assertEqual(response['response'].status, 304)
+        self.assertEqual(self.requests, [None, '"v1"'])
+
+        # The time to live has been refreshed
+        self.assertEqual(self.query()['data'], {'id': 'vpc'})
+        self.assertEqual(len(self.requests), 2)
+
+    def test_local_entry_is_revalidated(self):
+        self.config = {'cache_ttl': 60, 'local_cache': True}
+        self.memcached = False
+        self.query()
+        self.now += 61
+        self.assertEqual(self.query()['data'], {'id': 'vpc'})
+        self.assertEqual(self.requests, [None, '"v1"'])
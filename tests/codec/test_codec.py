@@ -0,0 +1,53 @@
+import json
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk.utils import codec
+
+
+class CodecTestCase(TestCase):
+
+    def setUp(self):
+        self.config = {'cache_compress_threshold': 128}
+        self.patcher = patch('ibmcloud_python_sdk.utils.codec.sdk',
+                             lambda: self.config)
+        self.patcher.start()
+        self.data = {'instances': [{'id': index, 'name': 'instance'}
+                                   for index in range(50)]}
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_small_value_is_not_compressed(self):
+        value = codec.encode({'id': 1})
+        self.assertEqual(value[:3], bytes([codec.VERSION, codec.JSON,
+                                           codec.NONE]))
+        self.assertEqual(codec.decode(value), {'id': 1})
+
+    def test_large_value_is_compressed(self):
+        raw = json.dumps(self.data).encode()
+        value = codec.encode(self.data, raw)
+        self.assertEqual(value[2], codec.ZLIB)
+        self.assertLess(len(value), len(raw))
+        self.assertEqual(codec.decode(value), self.data)
+
+    def test_raw_payload_is_reused(self):
+        self.config['cache_compression'] = 'none'
+        value = codec.encode({'id': 1}, b'{"id": 1}')
+        self.assertEqual(value[3:], b'{"id": 1}')
+
+    def test_missing_packages_fall_back(self):
+        self.config.update({'cache_format': 'msgpack',
+                            'cache_compression': 'zstd'})
+        with patch('ibmcloud_python_sdk.utils.codec.msgpack', None), \
+                patch('ibmcloud_python_sdk.utils.codec.zstandard', None):
+            self.assertEqual(codec.settings(),
+                             (codec.JSON, codec.ZLIB, 128))
+
+    def test_unknown_version(self):
+        with self.assertRaises(ValueError):
+            codec.decode(b'{"id": 1}')
+
+    def test_manifest(self):
+        value = codec.manifest('a1b2c3d4', 3)
+        self.assertEqual(codec.chunks(value), ('a1b2c3d4', 3))
+        self.assertIsNone(codec.chunks(codec.encode({'id': 1})))
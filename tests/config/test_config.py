@@ -0,0 +1,54 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk import config
+
+
+class ConfigTestCase(TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.creds = f'{self.tmp}/clouds.yaml'
+        shutil.copy(f'{os.path.dirname(__file__)}/../../'
+                    'test-credentials.yaml', self.creds)
+        self.patcher = patch.dict(os.environ, {'IC_CONFIG_FILE': self.creds})
+        self.patcher.start()
+        config.clear()
+
+    def tearDown(self):
+        self.patcher.stop()
+        config.clear()
+        shutil.rmtree(self.tmp)
+
+    def test_params_is_memoized(self):
+        with patch('ibmcloud_python_sdk.config.yaml.safe_load',
+                   wraps=config.yaml.safe_load) as load:
+            config.params()
+            config.params()
+            self.assertEqual(load.call_count, 1)
+
+    def test_params_returns_copy(self):
+        config.params()['region'] = 'eu-de'
+        self.assertEqual(config.params()['region'], 'us-south')
+
+    def test_params_reloaded_when_file_changes(self):
+        self.assertEqual(config.params()['region'], 'us-south')
+        with open(self.creds, 'r') as creds:
+            content = creds.read().replace('us-south', 'eu-de')
+        with open(self.creds, 'w') as creds:
+            creds.write(content)
+        stat = os.stat(self.creds)
+        os.utime(self.creds, ns=(stat.st_atime_ns,
+                                 stat.st_mtime_ns + 1000000000))
+        self.assertEqual(config.params()['region'], 'eu-de')
+
+    def test_params_reloaded_when_environment_changes(self):
+        os.environ.pop('IC_CONFIG_FILE')
+        env = {'IC_VERSION': '2021-06-15', 'IC_API_KEY': 'key',
+               'IC_REGION': 'us-east', 'IC_GENERATION': '2'}
+        with patch.dict(os.environ, env):
+            self.assertEqual(config.params()['region'], 'us-east')
+            os.environ['IC_REGION'] = 'eu-gb'
+            self.assertEqual(config.params()['region'], 'eu-gb')
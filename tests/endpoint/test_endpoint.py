@@ -0,0 +1,116 @@
+import os
+import shutil
+import tempfile
+import time
+import yaml
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk import auth
+from ibmcloud_python_sdk import config
+from ibmcloud_python_sdk.utils import common
+from ibmcloud_python_sdk.utils import pool
+from ibmcloud_python_sdk.vpc import geo
+from ibmcloud_python_sdk.vpc import instance
+from ibmcloud_python_sdk.vpc import subnet
+from ibmcloud_python_sdk.vpc import vpc
+from tests.server import MockServer, Store
+
+
+class EndpointTestCase(TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.creds = f'{self.tmp}/clouds.yaml'
+        shutil.copy(f'{os.path.dirname(__file__)}/../../'
+                    'test-credentials.yaml', self.creds)
+        self.patcher = patch.dict(os.environ, {
+            'IC_CONFIG_FILE': self.creds,
+            'IC_SDK_CONFIG_FILE': f'{self.tmp}/sdk.yaml'})
+        self.patcher.start()
+        self.server = MockServer(resources={'/v1/subnets': 120}).start()
+        self.configure({'endpoint': self.server.endpoint,
+                        'retry': {'max_attempts': 2, 'backoff_factor': 0}})
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.server.stop()
+        pool.clear()
+        pool.pools.clear()
+        auth.token_manager.reset()
+        config.clear()
+        shutil.rmtree(self.tmp)
+
+    def configure(self, options):
+        with open(f'{self.tmp}/sdk.yaml', 'w') as sdk_file:
+            yaml.safe_dump({'sdk': options}, sdk_file)
+        config.clear()
+        auth.token_manager.reset()
+
+    def test_host_override(self):
+        cfg = config.params()
+        self.assertEqual(common._host(cfg, 'iaas'), self.server.endpoint)
+        self.configure({'endpoint': {'rg': 'http://127.0.0.1:1'}})
+        self.assertEqual(common._host(cfg, 'rg'), 'http://127.0.0.1:1')
+        self.assertEqual(common._host(cfg, 'iaas'), cfg['is_url'])
+
+    def test_paginated_collection(self):
+        sn = subnet.Subnet()
+        data = sn.get_subnets()
+        # Subnets from the fixture and 120 synthetic ones
+        self.assertEqual(len(data['subnets']), 122)
+        self.assertEqual(sn.get_subnet('subnet-100')['name'], 'subnet-100')
+        self.assertEqual(auth.token_manager.account_id, 'mock-account')
+        # Token, 3 pages and a page again for the lookup by name
+        self.assertEqual(self.server.requests, 7)
+
+    def test_error_injection(self):
+        auth.token_manager.get()
+        self.server.error_rate = 1
+        data = subnet.Subnet().get_subnet_by_id('missing')
+        self.assertEqual(data['errors'][0]['code'], 'injected')
+        # Token query and the retried one
+        self.assertEqual(self.server.requests, 3)
+
+    def test_latency(self):
+        auth.token_manager.get()
+        self.server.latency = 0.05
+        start = time.monotonic()
+        subnet.Subnet().get_subnet_by_id('missing')
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+    def test_default_collections(self):
+        self.assertEqual(vpc.Vpc().get_vpcs()['vpcs'], [])
+        self.assertEqual(instance.Instance().get_instances()['instances'],
+                         [])
+        zones = geo.Geo().get_region_zones('us-south')['zones']
+        self.assertEqual([zone['name'] for zone in zones],
+                         ['us-south-1', 'us-south-2', 'us-south-3'])
+
+    def test_nested_collections(self):
+        store = Store('mock-account', 'us-south', 0)
+        store.generate('/v1/instances', 1)
+        item = store.collections['/v1/instances'][0]
+        path = '/v1/instances/{}/network_interfaces'.format(item['id'])
+        status, data = store.handle('GET', path, {}, None)
+        self.assertEqual((status, data['network_interfaces']), (200, []))
+        status, nic = store.handle('POST', path, {}, {'name': 'eth0'})
+        self.assertEqual(status, 201)
+        status, data = store.handle('GET', f"{path}/{nic['id']}", {}, None)
+        self.assertEqual((status, data['name']), (200, 'eth0'))
+        status, _ = store.handle('GET', '/v1/instances/missing/'
+                                 'network_interfaces', {}, None)
+        self.assertEqual(status, 404)
+
+    def test_rejected_methods(self):
+        store = Store('mock-account', 'us-south', 0)
+        version = store.version
+        status, _ = store.handle('PUT', '/v1/vpcs', {}, {})
+        self.assertEqual((status, store.version), (405, version))
+        status, _ = store.handle('PUT', '/v1/subnets/missing', {}, {})
+        self.assertEqual((status, store.version), (404, version))
+
+    def test_missing_fixture(self):
+        fixtures = {'/v1/vpcs': ('vpc/vpcs.json', 'vpcs')}
+        with patch('tests.server.FIXTURES', fixtures):
+            with self.assertRaises(FileNotFoundError):
+                Store('mock-account', 'us-south', 0)
@@ -0,0 +1,59 @@
+import threading
+import time
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk.utils import fanout
+from ibmcloud_python_sdk.utils import pool
+
+
+class FanoutTestCase(TestCase):
+
+    def setUp(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def slow(self, item):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(0.01 * (item % 3))
+        with self.lock:
+            self.running -= 1
+        if item == 4:
+            raise ValueError('broken item')
+        return {'id': item}
+
+    def test_results_in_input_order(self):
+        response = fanout.map_concurrent(self.slow, range(8))
+        self.assertEqual([item.get('id') for item in response],
+                         [0, 1, 2, 3, None, 5, 6, 7])
+
+    def test_error_per_item(self):
+        response = fanout.map_concurrent(self.slow, range(8))
+        self.assertEqual(response[4]['errors'][0]['code'], 'exception')
+        self.assertIn('broken item', response[4]['errors'][0]['message'])
+
+    def test_max_workers(self):
+        fanout.map_concurrent(self.slow, range(12), max_workers=2)
+        self.assertLessEqual(self.peak, 2)
+
+    def test_nested_calls(self):
+        response = fanout.map_concurrent(
+            lambda item: fanout.map_concurrent(self.slow, [item, item + 1]),
+            range(4))
+        self.assertEqual(response[2], [{'id': 2}, {'id': 3}])
+
+    def test_pool_concurrency_limit(self):
+        conn = pool.ConnectionPool('localhost', limit=2)
+        with patch.object(conn, '_request',
+                          lambda *args: self.slow(1)):
+            fanout.map_concurrent(
+                lambda item: conn.request('GET', '/v1/vpcs'), range(8))
+        self.assertLessEqual(self.peak, 2)
+
+    def test_pool_limit_by_host(self):
+        config = {'concurrency': {'default': 5, 'example.com': 2}}
+        self.assertEqual(pool._limit(config, 'example.com'), 2)
+        self.assertEqual(pool._limit(config, 'other.com'), 5)
+        self.assertIsNone(pool._limit({}, 'other.com'))
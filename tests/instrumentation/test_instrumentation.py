@@ -0,0 +1,203 @@
+import os
+import shutil
+import tempfile
+import yaml
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk import auth
+from ibmcloud_python_sdk import config
+from ibmcloud_python_sdk.utils import cache
+from ibmcloud_python_sdk.utils import common
+from ibmcloud_python_sdk.utils import instrumentation
+from ibmcloud_python_sdk.utils import metrics
+from ibmcloud_python_sdk.utils import pool
+from ibmcloud_python_sdk.vpc import subnet
+from tests.server import MockServer
+
+
+class Recorder(instrumentation.Hook):
+
+    def __init__(self):
+        self.requests = []
+
+    def after(self, request):
+        self.requests.append(request)
+
+
+class InstrumentationTestCase(TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.creds = f'{self.tmp}/clouds.yaml'
+        shutil.copy(f'{os.path.dirname(__file__)}/../../'
+                    'test-credentials.yaml', self.creds)
+        self.patcher = patch.dict(os.environ, {
+            'IC_CONFIG_FILE': self.creds,
+            'IC_SDK_CONFIG_FILE': f'{self.tmp}/sdk.yaml'})
+        self.patcher.start()
+        self.server = MockServer(resources={'/v1/subnets': 10}).start()
+        self.configure({})
+        auth.token_manager.get()
+        self.recorder = Recorder()
+        instrumentation.add_hook(self.recorder)
+
+    def tearDown(self):
+        instrumentation.remove_hook(self.recorder)
+        self.patcher.stop()
+        self.server.stop()
+        pool.clear()
+        pool.pools.clear()
+        auth.token_manager.reset()
+        if cache.local_cache is not None:
+            cache.local_cache.clear()
+        config.clear()
+        shutil.rmtree(self.tmp)
+
+    def configure(self, options):
+        options = dict(options, endpoint=self.server.endpoint,
+                       retry={'max_attempts': 2, 'backoff_factor': 0})
+        with open(f'{self.tmp}/sdk.yaml', 'w') as sdk_file:
+            yaml.safe_dump({'sdk': options}, sdk_file)
+        config.clear()
+
+    def test_phases(self):
+        subnet.Subnet().get_subnets()
+        request, = self.recorder.requests
+        self.assertEqual(request.conn_type, 'iaas')
+        self.assertEqual(request.method, 'GET')
+        self.assertEqual(request.status, 200)
+        self.assertEqual(request.attempts, 1)
+        self.assertEqual(request.resource, 'Subnet.get_subnets')
+        self.assertGreater(request.size, 0)
+        self.assertIsNone(request.cache)
+        for phase in ('ratelimit', 'send', 'server', 'read', 'decode'):
+            self.assertIn(phase, request.timings)
+        self.assertGreaterEqual(request.duration,
+                                sum(request.timings.values()))
+
+    def test_new_connection(self):
+        pool.clear()
+        subnet.Subnet().get_subnet_by_id('subnet-5')
+        request, = self.recorder.requests
+        self.assertIn('dns', request.timings)
+        self.assertIn('connect', request.timings)
+        # The mock server listens in plain HTTP
+        self.assertNotIn('tls', request.timings)
+
+    def test_outermost_resource(self):
+        subnet.Subnet().get_subnet('subnet-5')
+        self.assertEqual({r.resource for r in self.recorder.requests},
+                         {'Subnet.get_subnet'})
+
+    def test_retries(self):
+        self.server.error_rate = 1
+        subnet.Subnet().get_subnet_by_id('subnet-5')
+        request, = self.recorder.requests
+        self.assertEqual(request.attempts, 2)
+        self.assertEqual(request.status, 503)
+
+    def test_cache(self):
+        self.configure({'local_cache': True})
+        sn = subnet.Subnet()
+        sn.get_subnets()
+        sn.get_subnets()
+        miss, hit = self.recorder.requests
+        self.assertEqual(miss.cache, 'miss')
+        self.assertIn('store', miss.timings)
+        self.assertEqual(hit.cache, 'hit')
+        self.assertEqual(hit.status, 200)
+        self.assertEqual(hit.attempts, 0)
+        self.assertNotIn('send', hit.timings)
+
+    def test_hook_errors(self):
+        failing = instrumentation.Hook()
+        failing.before = failing.after = lambda request: 1 / 0
+        instrumentation.add_hook(failing)
+        try:
+            data = subnet.Subnet().get_subnets()
+        finally:
+            instrumentation.remove_hook(failing)
+        self.assertEqual(len(data['subnets']), 12)
+        self.assertEqual(len(self.recorder.requests), 1)
+
+    def test_query_errors(self):
+        with patch('ibmcloud_python_sdk.utils.common.send_http',
+                   side_effect=ConnectionError('down')):
+            with self.assertRaises(ConnectionError):
+                common.query_wrapper('iaas', 'GET', '/v1/subnets',
+                                     auth.get_headers())
+        request, = self.recorder.requests
+        self.assertIsInstance(request.error, ConnectionError)
+
+    def test_disabled(self):
+        instrumentation.remove_hook(self.recorder)
+        with patch('ibmcloud_python_sdk.utils.instrumentation.Request') \
+                as request:
+            subnet.Subnet().get_subnet_by_id('subnet-5')
+        request.assert_not_called()
+        self.assertIsNone(instrumentation.active())
+
+
+class MetricsTestCase(TestCase):
+
+    def test_render(self):
+        hook = metrics.MetricsHook()
+        request = instrumentation.Request('iaas', 'GET', '/v1/vpcs',
+                                          'VPC.get_vpcs')
+        request.duration = 0.02
+        request.status = 200
+        request.size = 2000
+        request.cache = 'miss'
+        request.attempts = 3
+        request.add('server', 0.015)
+        hook.after(request)
+        hook.after(request)
+        text = hook.registry.render()
+        self.assertIn('# TYPE ibmcloud_sdk_requests counter', text)
+        self.assertIn('ibmcloud_sdk_requests_total{conn_type="iaas",'
+                      'method="GET",status="200"} 2', text)
+        self.assertIn('ibmcloud_sdk_request_duration_seconds_bucket{'
+                      'conn_type="iaas",method="GET",le="0.01"} 0', text)
+        self.assertIn('ibmcloud_sdk_request_duration_seconds_bucket{'
+                      'conn_type="iaas",method="GET",le="0.025"} 2', text)
+        self.assertIn('ibmcloud_sdk_request_duration_seconds_bucket{'
+                      'conn_type="iaas",method="GET",le="+Inf"} 2', text)
+        self.assertIn('ibmcloud_sdk_request_duration_seconds_count{'
+                      'conn_type="iaas",method="GET"} 2', text)
+        self.assertIn('ibmcloud_sdk_phase_duration_seconds_sum{'
+                      'conn_type="iaas",phase="server"} 0.03', text)
+        self.assertIn('ibmcloud_sdk_response_size_bytes_bucket{'
+                      'conn_type="iaas",le="4096"} 2', text)
+        self.assertIn('ibmcloud_sdk_cache_total{conn_type="iaas",'
+                      'result="miss"} 2', text)
+        self.assertIn('ibmcloud_sdk_retries_total{conn_type="iaas"} 4',
+                      text)
+        self.assertIn('ibmcloud_sdk_resource_requests_total{'
+                      'resource="VPC.get_vpcs"} 2', text)
+
+    def test_mixed_status(self):
+        hook = metrics.MetricsHook()
+        for status, error in ((200, None), (None, ConnectionError()),
+                              (None, None)):
+            request = instrumentation.Request('iaas', 'GET', '/v1/vpcs')
+            request.duration = 0.01
+            request.status = status
+            request.error = error
+            hook.after(request)
+        text = hook.registry.render()
+        for status in ('200', 'error', 'unknown'):
+            self.assertIn('ibmcloud_sdk_requests_total{conn_type="iaas",'
+                          'method="GET",status="%s"} 1' % status, text)
+
+    def test_label_escaping(self):
+        counter = metrics.Counter('test', 'Test', ('name',))
+        counter.inc('a"b\\c')
+        self.assertEqual(list(counter.samples()),
+                         [('test_total', '{name="a\\"b\\\\c"}', 1)])
+
+    def test_enable(self):
+        hook = metrics.enable()
+        try:
+            self.assertIn(hook, instrumentation.hooks)
+        finally:
+            instrumentation.remove_hook(hook)
@@ -0,0 +1,89 @@
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk.utils import lookup
+from ibmcloud_python_sdk.vpc.loadbalancer import Loadbalancer
+from tests.common import get_headers
+
+LB_ID = 'r006-0f2c1b1a-8d0e-4d7a-9f3c-2a1b5c4d6e7f'
+LISTENER_ID = 'r006-1a2b3c4d-5e6f-4a7b-8c9d-0e1f2a3b4c5d'
+POLICY_ID = 'r006-2b3c4d5e-6f7a-4b8c-9d0e-1f2a3b4c5d6e'
+POOL_ID = 'r006-3c4d5e6f-7a8b-4c9d-8e1f-2a3b4c5d6e7f'
+MEMBER_ID = 'r006-4d5e6f7a-8b9c-4d0e-9f2a-3b4c5d6e7f8a'
+
+# Fake API answering with one resource of each type
+API = {
+    '/v1/load_balancers': {
+        'load_balancers': [{'id': LB_ID, 'name': 'my-lb'}]},
+    '/v1/load_balancers/{}'.format(LB_ID): {'id': LB_ID, 'name': 'my-lb'},
+    '/v1/load_balancers/{}/listeners'.format(LB_ID): {
+        'listeners': [{'id': LISTENER_ID, 'port': 443}]},
+    '/v1/load_balancers/{}/listeners/{}/policies'.format(
+        LB_ID, LISTENER_ID): {
+        'policies': [{'id': POLICY_ID, 'name': 'my-policy'}]},
+    '/v1/load_balancers/{}/listeners/{}/policies/{}/rules'.format(
+        LB_ID, LISTENER_ID, POLICY_ID): {
+        'rules': [{'id': 'my-rule'}]},
+    '/v1/load_balancers/{}/pools'.format(LB_ID): {
+        'pools': [{'id': POOL_ID, 'name': 'my-pool'}]},
+    '/v1/load_balancers/{}/pools/{}'.format(LB_ID, POOL_ID): {
+        'id': POOL_ID, 'name': 'my-pool'},
+    '/v1/load_balancers/{}/pools/{}/members'.format(LB_ID, POOL_ID): {
+        'members': [{'id': MEMBER_ID,
+                     'target': {'address': '10.0.0.10'}}]},
+    '/v1/load_balancers/{}/pools/{}/members/{}'.format(
+        LB_ID, POOL_ID, MEMBER_ID): {
+        'id': MEMBER_ID, 'target': {'address': '10.0.0.10'}},
+}
+
+
+class LoadbalancerTestCase(TestCase):
+
+    def setUp(self):
+        self.calls = []
+        self.lb = Loadbalancer()
+        self.patcher = patch('ibmcloud_python_sdk.auth.get_token', get_headers)
+        self.patcher.start()
+        lookup.name_index.clear()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def qw(self, arg1, arg2, path, headers=None, payload=None):
+        """This function is used to mock the query_wrapper function from
+        utils/common. It records every query sent to the fake API.
+        """
+        path = path.split('?')[0]
+        self.calls.append(path)
+        if path in API:
+            return {'data': API[path]}
+        return {'data': {'errors': [{'code': 'not_found'}]}}
+
+    def test_get_lb_listener_policy_rules_resolves_once(self):
+        with patch('ibmcloud_python_sdk.vpc.loadbalancer.qw', self.qw):
+            response = self.lb.get_lb_listener_policy_rules('my-lb', 443,
+                                                            'my-policy')
+        self.assertEqual(response['rules'][0]['id'], 'my-rule')
+        self.assertEqual(len(self.calls), 4)
+        self.assertEqual(len(self.calls), len(set(self.calls)))
+
+    def test_get_lb_pool_member_by_id_resolves_once(self):
+        with patch('ibmcloud_python_sdk.vpc.loadbalancer.qw', self.qw):
+            response = self.lb.get_lb_pool_member_by_id('my-lb', 'my-pool',
+                                                        MEMBER_ID)
+        self.assertEqual(response['id'], MEMBER_ID)
+        self.assertEqual(len(self.calls), 3)
+
+    def test_get_lb_pool_member_by_address(self):
+        with patch('ibmcloud_python_sdk.vpc.loadbalancer.qw', self.qw):
+            response = self.lb.get_lb_pool_member(LB_ID, POOL_ID,
+                                                  '10.0.0.10')
+        self.assertEqual(response['id'], MEMBER_ID)
+
+    def test_context_is_request_scoped(self):
+        with patch('ibmcloud_python_sdk.vpc.loadbalancer.qw', self.qw):
+            self.lb.get_lb_listener(LB_ID, 443)
+            self.calls = []
+            self.lb.get_lb_listener(LB_ID, 443)
+        self.assertEqual(self.calls, [
+            '/v1/load_balancers/{}'.format(LB_ID),
+            '/v1/load_balancers/{}/listeners'.format(LB_ID)])
@@ -0,0 +1,142 @@
+import jwt
+from unittest import TestCase
+from ibmcloud_python_sdk import auth
+from ibmcloud_python_sdk.utils import common
+from ibmcloud_python_sdk.utils import lookup
+from ibmcloud_python_sdk.utils.common import resource_not_found
+
+
+class LookupTestCase(TestCase):
+
+    def setUp(self):
+        self.calls = []
+        self.resources = {
+            'r006-a4841334-b584-4293-938e-3bc63b4a5b6a': 'my-subnet',
+        }
+        lookup.name_index.clear()
+        self.addCleanup(auth.token_manager.reset)
+
+    def qw(self, conn_type, method, path, headers=None, payload=None):
+        """This function is used to mock the query_wrapper function from
+        utils/common. It returns the subnets collection.
+        """
+        self.calls.append(('list', path))
+        return {'data': {'subnets': [
+            {'id': id, 'name': name} for id, name in self.resources.items()]}}
+
+    def list_by_name(self, name):
+        self.calls.append(('name', name))
+        data = common.query_all(self.qw, 'iaas', '/v1/subnets')
+        for subnet in data['subnets']:
+            if subnet['name'] == name:
+                return subnet
+        return resource_not_found()
+
+    def login(self, account):
+        """This function sets a token of the account on the token manager.
+        """
+        claims = {'account': {'bss': account}}
+        token = jwt.encode(claims, 'unittest-secret-key-for-hs256-jwt',
+                           algorithm='HS256')
+        auth.token_manager.token = f'Bearer {token}'
+
+    def by_id(self, id):
+        self.calls.append(('id', id))
+        if id in self.resources:
+            return {'id': id, 'name': self.resources[id]}
+        return resource_not_found()
+
+    def by_name(self, name):
+        self.calls.append(('name', name))
+        for id, resource_name in self.resources.items():
+            if resource_name == name:
+                return {'id': id, 'name': name}
+        return resource_not_found()
+
+    def resolve(self, value):
+        return lookup.resolve('subnets', value, self.by_name, self.by_id,
+                              'us-south')
+
+    def test_is_id(self):
+        self.assertTrue(lookup.is_id(
+            'r006-a4841334-b584-4293-938e-3bc63b4a5b6a'))
+        self.assertTrue(lookup.is_id('8722d01c-9c78-4555-82b5-53ad1266f959'))
+        self.assertTrue(lookup.is_id('4a6b6755259e4400bb75f770ab58a20b'))
+        self.assertTrue(lookup.is_id('crn:v1:bluemix:public:is:us-south'))
+        self.assertFalse(lookup.is_id('my-subnet'))
+
+    def test_id_skips_collection(self):
+        response = self.resolve('r006-a4841334-b584-4293-938e-3bc63b4a5b6a')
+        self.assertEqual(response['name'], 'my-subnet')
+        self.assertEqual(self.calls, [
+            ('id', 'r006-a4841334-b584-4293-938e-3bc63b4a5b6a')])
+
+    def test_name_is_indexed(self):
+        self.resolve('my-subnet')
+        self.calls = []
+        response = self.resolve('my-subnet')
+        self.assertEqual(response['name'], 'my-subnet')
+        self.assertEqual(self.calls, [
+            ('id', 'r006-a4841334-b584-4293-938e-3bc63b4a5b6a')])
+
+    def test_renamed_resource_is_listed_again(self):
+        self.resolve('my-subnet')
+        self.resources['r006-a4841334-b584-4293-938e-3bc63b4a5b6a'] = 'other'
+        response = self.resolve('my-subnet')
+        self.assertEqual(response['errors'][0]['code'], 'not_found')
+        self.assertIsNone(lookup.name_index.get(None, 'subnets', 'us-south',
+                                                'my-subnet'))
+
+    def test_listed_names_are_indexed(self):
+        self.resources['r006-0f9e8d7c-6b5a-4938-8271-6a5b4c3d2e1f'] = 'other'
+        lookup.resolve('subnets', 'my-subnet', self.list_by_name, self.by_id,
+                       'us-south')
+        self.calls = []
+        response = lookup.resolve('subnets', 'other', self.list_by_name,
+                                  self.by_id, 'us-south')
+        self.assertEqual(response['name'], 'other')
+        self.assertEqual(self.calls, [
+            ('id', 'r006-0f9e8d7c-6b5a-4938-8271-6a5b4c3d2e1f')])
+        self.assertIsNone(common.listings.get())
+
+    def test_index_is_per_account(self):
+        self.login('account-1')
+        lookup.resolve('subnets', 'my-subnet', self.list_by_name, self.by_id,
+                       'us-south')
+        self.login('account-2')
+        self.calls = []
+        lookup.resolve('subnets', 'my-subnet', self.list_by_name, self.by_id,
+                       'us-south')
+        self.assertEqual(self.calls, [('name', 'my-subnet'),
+                                      ('list', '/v1/subnets')])
+        self.assertEqual(
+            lookup.name_index.get('account-1', 'subnets', 'us-south',
+                                  'my-subnet'),
+            'r006-a4841334-b584-4293-938e-3bc63b4a5b6a')
+
+    def test_unindexed_names_are_not_listed_into_the_index(self):
+        def by_name(name):
+            lookup.resolve('members', '10.0.0.10', self.list_by_name,
+                           self.by_id, 'us-south', indexed=False)
+            return self.by_name(name)
+
+        self.resources['r006-0f9e8d7c-6b5a-4938-8271-6a5b4c3d2e1f'] = 'other'
+        lookup.resolve('subnets', 'my-subnet', by_name, self.by_id,
+                       'us-south')
+        self.assertIsNone(lookup.name_index.get(None, 'subnets', 'us-south',
+                                                'other'))
+
+    def test_not_found(self):
+        response = self.resolve('unknown')
+        self.assertEqual(response['errors'][0]['code'], 'not_found')
+        self.assertEqual(self.calls, [('name', 'unknown'), ('id', 'unknown')])
+
+    def test_context_resolves_once(self):
+        with lookup.context():
+            self.resolve('my-subnet')
+            self.resolve('my-subnet')
+            response = self.resolve(
+                'r006-a4841334-b584-4293-938e-3bc63b4a5b6a')
+        self.assertEqual(response['name'], 'my-subnet')
+        self.assertEqual(self.calls, [('name', 'my-subnet')])
+        self.assertIsNone(lookup.resolved.get())
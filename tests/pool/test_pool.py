@@ -0,0 +1,74 @@
+import http.client
+import socketserver
+import threading
+from unittest import TestCase
+from ibmcloud_python_sdk.utils import pool
+
+
+class Handler(socketserver.StreamRequestHandler):
+    """Answer keep-alive queries, the queries listed in `drop` are read
+    then the connection is closed without response
+    """
+
+    def handle(self):
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            length = 0
+            while True:
+                header = self.rfile.readline()
+                if header in (b"\r\n", b""):
+                    break
+                name, _, value = header.decode().partition(":")
+                if name.lower() == "content-length":
+                    length = int(value)
+            self.rfile.read(length)
+            self.server.received.append(line.split()[0].decode())
+            if len(self.server.received) in self.server.drop:
+                return
+            self.wfile.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n"
+                             b"Content-Type: application/json\r\n\r\n{}")
+
+
+class Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class PoolTestCase(TestCase):
+
+    def setUp(self):
+        self.server = Server(("127.0.0.1", 0), Handler)
+        self.server.received = []
+        self.server.drop = ()
+        threading.Thread(target=self.server.serve_forever,
+                         kwargs={"poll_interval": 0.05}, daemon=True).start()
+        self.pool = pool.ConnectionPool(
+            "http://127.0.0.1:{}".format(self.server.server_address[1]))
+
+    def tearDown(self):
+        self.pool.clear()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_reuse(self):
+        self.pool.request("GET", "/v1/vpcs")
+        self.pool.request("GET", "/v1/vpcs")
+        self.assertEqual(len(self.pool.idle), 1)
+        self.assertEqual(self.server.received, ["GET", "GET"])
+
+    def test_idempotent_resent(self):
+        self.server.drop = (2,)
+        self.pool.request("GET", "/v1/vpcs")
+        res, data = self.pool.request("GET", "/v1/vpcs")
+        self.assertEqual(res.status, 200)
+        self.assertEqual(self.server.received, ["GET", "GET", "GET"])
+
+    def test_post_not_resent(self):
+        self.server.drop = (2,)
+        self.pool.request("GET", "/v1/vpcs")
+        with self.assertRaises(http.client.RemoteDisconnected):
+            self.pool.request("POST", "/v1/instances", "{}",
+                              {"Content-Type": "application/json"})
+        self.assertEqual(self.server.received, ["GET", "POST"])
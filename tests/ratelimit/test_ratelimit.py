@@ -0,0 +1,83 @@
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk.utils import ratelimit
+from tests.cache.test_cache import FakeMemcached
+
+
+class RateLimitTestCase(TestCase):
+
+    def setUp(self):
+        self.memcached = FakeMemcached()
+        self.config = {'rate_limit': {
+            'iaas': {'rate': 10, 'burst': 2},
+            'resource-controller.cloud.ibm.com': 5,
+            'em': {'rate': 2, 'shared': True},
+        }}
+        self.patchers = [
+            patch('ibmcloud_python_sdk.utils.ratelimit.sdk',
+                  lambda: self.config),
+            patch('ibmcloud_python_sdk.utils.cache.client',
+                  lambda: self.memcached),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+        ratelimit.limiters.clear()
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def test_burst_then_wait(self):
+        bucket = ratelimit.TokenBucket(10, burst=2)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertTrue(0 < bucket.reserve() <= 0.1)
+
+    def test_limiter_by_conn_type_and_host(self):
+        self.assertEqual(
+            ratelimit.limiter('iaas', 'us-south.iaas.cloud.ibm.com').capacity,
+            2)
+        self.assertEqual(ratelimit.limiter(
+            'rg', 'resource-controller.cloud.ibm.com').rate, 5)
+        self.assertIsNone(ratelimit.limiter('dns', 'api.dns-svcs.cloud'))
+        self.assertEqual(ratelimit.reserve('dns', 'api.dns-svcs.cloud'), 0)
+
+    def test_limiter_is_reused(self):
+        self.assertIs(ratelimit.limiter('iaas', 'host'),
+                      ratelimit.limiter('iaas', 'host'))
+
+    def test_shared_window(self):
+        with patch('ibmcloud_python_sdk.utils.ratelimit.time.time',
+                   lambda: 1000.25):
+            self.assertEqual(ratelimit.reserve('em', 'host'), 0)
+            self.assertEqual(ratelimit.reserve('em', 'host'), 0)
+            self.assertEqual(ratelimit.reserve('em', 'host'), 0.75)
+            self.assertEqual(ratelimit.reserve('em', 'host'), 0.75)
+        # Refused queries aren't counted
+        self.assertEqual(self.memcached.items['ratelimit:em:1000'], b'2')
+
+    def test_shared_window_below_one_query_per_second(self):
+        self.config['rate_limit']['em'] = {'rate': 0.5, 'shared': True}
+        with patch('ibmcloud_python_sdk.utils.ratelimit.time.time',
+                   lambda: 1000.25):
+            self.assertEqual(ratelimit.reserve('em', 'host'), 0)
+            self.assertEqual(ratelimit.reserve('em', 'host'), 1.75)
+        with patch('ibmcloud_python_sdk.utils.ratelimit.time.time',
+                   lambda: 1002):
+            self.assertEqual(ratelimit.reserve('em', 'host'), 0)
+        self.assertEqual(self.memcached.items['ratelimit:em:500'], b'1')
+
+    def test_shared_window_lost_race(self):
+        bucket = ratelimit.limiter('em', 'host')
+        self.memcached.get = lambda key: None
+        self.memcached.items['ratelimit:em:1000'] = b'2'
+        with patch('ibmcloud_python_sdk.utils.ratelimit.time.time',
+                   lambda: 1000.25):
+            self.assertEqual(bucket.reserve(), 0.75)
+        self.assertEqual(self.memcached.items['ratelimit:em:1000'], b'2')
+
+    def test_shared_window_fallback(self):
+        self.memcached = False
+        bucket = ratelimit.limiter('em', 'host')
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.fallback.tokens, 1)
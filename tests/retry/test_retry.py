@@ -0,0 +1,95 @@
+import email.utils
+import time
+from types import SimpleNamespace
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk.utils import retry
+
+
+def response(status, headers=None):
+    headers = headers or {}
+    return SimpleNamespace(status=status, reason='',
+                           getheader=lambda name: headers.get(name))
+
+
+class RetryTestCase(TestCase):
+
+    def setUp(self):
+        self.config = {'retry': {'max_attempts': 3, 'backoff_factor': 0.1,
+                                 'max_backoff': 1, 'deadline': 10}}
+        self.sleeps = []
+        self.patchers = [
+            patch('ibmcloud_python_sdk.utils.retry.sdk',
+                  lambda: self.config),
+            patch('ibmcloud_python_sdk.utils.retry.time.sleep',
+                  self.sleeps.append),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def sender(self, *results):
+        results = list(results)
+
+        def send():
+            result = results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result, b'{}'
+        return send
+
+    def test_retry_after_seconds(self):
+        self.assertEqual(retry.retry_after(
+            response(503, {'Retry-After': '3'})), 3)
+
+    def test_retry_after_date(self):
+        date = email.utils.formatdate(time.time() + 30, usegmt=True)
+        wait = retry.retry_after(response(429, {'Retry-After': date}))
+        self.assertTrue(25 < wait <= 30)
+
+    def test_retry_after_invalid(self):
+        self.assertIsNone(retry.retry_after(
+            response(503, {'Retry-After': 'soon'})))
+
+    def test_retry_until_success(self):
+        res, _ = retry.call(self.sender(response(503), response(200)), 'GET')
+        self.assertEqual(res.status, 200)
+        self.assertEqual(len(self.sleeps), 1)
+        self.assertLessEqual(self.sleeps[0], 0.2)
+
+    def test_honour_retry_after(self):
+        retry.call(self.sender(response(429, {'Retry-After': '2'}),
+                               response(200)), 'GET')
+        self.assertEqual(self.sleeps, [2])
+
+    def test_max_attempts(self):
+        res, _ = retry.call(self.sender(response(503), response(502),
+                                        response(500), response(200)), 'GET')
+        self.assertEqual(res.status, 500)
+        self.assertEqual(len(self.sleeps), 2)
+
+    def test_deadline(self):
+        res, _ = retry.call(self.sender(response(503, {'Retry-After': '60'}),
+                                        response(200)), 'GET')
+        self.assertEqual(res.status, 503)
+        self.assertEqual(self.sleeps, [])
+
+    def test_post_not_retried(self):
+        res, _ = retry.call(self.sender(response(503), response(200)),
+                            'POST')
+        self.assertEqual(res.status, 503)
+        with self.assertRaises(ConnectionResetError):
+            retry.call(self.sender(ConnectionResetError()), 'POST')
+
+    def test_connection_error_retried(self):
+        res, _ = retry.call(self.sender(ConnectionResetError(),
+                                        response(200)), 'DELETE')
+        self.assertEqual(res.status, 200)
+
+    def test_disabled(self):
+        self.config = {'retry': False}
+        res, _ = retry.call(self.sender(response(503), response(200)), 'GET')
+        self.assertEqual(res.status, 503)
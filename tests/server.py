@@ -0,0 +1,507 @@
+"""Local stand-in for the IBM Cloud APIs used by the SDK
+
+The server answers the IAM token, VPC (`/v1`), Resource Controller
+(`/v2`) and Power (`/pcloud/v1`) endpoints from an in-memory store seeded
+with the JSON fixtures of the tests and with synthetic resources. It
+supports pagination, ETags, latency with jitter and error injection to
+benchmark the SDK without an account.
+
+Point the SDK at it with the `endpoint` option of sdk.yaml:
+
+    sdk:
+      endpoint: http://127.0.0.1:8080
+
+Run it with `python -m tests.server --resources /v1/instances=5000`.
+"""
+import argparse
+import copy
+import json
+import os
+import random
+import threading
+import time
+import uuid
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urlsplit
+import jwt
+from ibmcloud_python_sdk.utils.transport import Response, Transport
+
+
+# Collections listed by the SDK, created empty. Sub-collections of a
+# resource such as /v1/instances/{id}/network_interfaces are created when
+# first queried.
+COLLECTIONS = [
+    "/v1/bare_metal_server/profiles", "/v1/bare_metal_servers",
+    "/v1/floating_ips", "/v1/ike_policies", "/v1/images",
+    "/v1/instance/profiles", "/v1/instances", "/v1/ipsec_policies",
+    "/v1/keys", "/v1/load_balancers", "/v1/network_acls",
+    "/v1/operating_systems", "/v1/public_gateways", "/v1/regions",
+    "/v1/security_groups", "/v1/subnets", "/v1/volume/profiles",
+    "/v1/volumes", "/v1/vpcs", "/v1/vpn_gateways", "/v1/accounts",
+    "/v1/enterprises", "/v1/policies", "/v2/quota_definitions",
+    "/v2/resource_bindings", "/v2/resource_groups",
+    "/v2/resource_instances", "/v2/resource_keys", "/v2/roles",
+    "/pcloud/v1/cloud-instances", "/pcloud/v1/images",
+    "/pcloud/v1/tenants",
+]
+
+# Collections seeded from the fixtures of the tests
+FIXTURES = {
+    "/v1/subnets": ("subnet/subnets.json", "subnets"),
+    "/v2/resource_groups": ("resource_group/resource_groups.json",
+                            "resources"),
+    "/v2/quota_definitions": ("resource_group/quotas.json", "resources"),
+}
+
+# Key signing the tokens, the SDK doesn't verify them
+SECRET = "ibmcloud-python-sdk-mock-server-key"
+
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+
+def _camel(name):
+    first, *others = name.split("-")
+
+    return first + "".join(other.capitalize() for other in others)
+
+
+def _key(item):
+    # Quota definitions are identified by `_id`, regions and zones by name
+    return item.get("id", item.get("_id", item.get("name")))
+
+
+def _error(status, code, message):
+    return status, {"errors": [{"code": code, "message": message}]}
+
+
+class Store():
+    """In-memory collections of resources keyed by collection path
+
+    :param account: Account ID of the tokens and CRNs
+    :type account: str
+    :param region: Region of the Power resource instance
+    :type region: str
+    :param seed: Seed of the generated IDs
+    :type seed: int
+    """
+
+    def __init__(self, account, region, seed):
+        self.account = account
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        # Incremented by every change, to cache the encoded responses
+        self.version = 0
+        self.collections = {path: [] for path in COLLECTIONS}
+        self.ids = {path: {} for path in COLLECTIONS}
+        folder = os.path.dirname(__file__)
+        for path, (filename, key) in FIXTURES.items():
+            with open(os.path.join(folder, filename), "r") as fixture:
+                for item in json.load(fixture)[key]:
+                    self._add(path, item)
+
+        # Regions and zones are identified by name
+        self._add("/v1/regions", {
+            "name": region, "status": "available",
+            "href": "/v1/regions/{}".format(region),
+            "endpoint": "https://{}.iaas.cloud.ibm.com".format(region),
+        })
+        zones = "/v1/regions/{}/zones".format(region)
+        for index in range(1, 4):
+            name = "{}-{}".format(region, index)
+            self._add(zones, {
+                "name": name, "status": "available",
+                "href": "{}/{}".format(zones, name),
+                "region": {"name": region},
+            })
+
+        # Resource instance detected by the power package
+        self.power = self._id()
+        self._add("/v2/resource_instances", {
+            "id": "crn:v1:bluemix:public:power-iaas:{}:a/{}:{}::".format(
+                region, account, self.power),
+            "guid": self.power,
+            "name": "power-instance",
+        })
+        self._add("/pcloud/v1/cloud-instances", {
+            "cloudInstanceID": self.power,
+            "id": self.power,
+            "name": "power-instance",
+            "region": region,
+        })
+        self._add("/pcloud/v1/tenants", {
+            "id": account,
+            "tenantID": account,
+        })
+
+    def _add(self, path, item):
+        self.collections.setdefault(path, []).append(item)
+        self.ids.setdefault(path, {})[_key(item)] = item
+        self.version += 1
+
+    def _id(self):
+        return str(uuid.UUID(int=self.random.getrandbits(128), version=4))
+
+    def _item(self, path, template, name):
+        """Build a resource of a collection from a template
+        """
+        item = copy.deepcopy(template)
+        item["id"] = self._id()
+        item["name"] = name
+        if path.startswith("/pcloud/"):
+            # Power resources are identified by pvmInstanceID, networkID...
+            item["{}ID".format(_camel(path.rsplit("/", 1)[1])[:-1])] = \
+                item["id"]
+        else:
+            item["href"] = "{}/{}".format(path, item["id"])
+            item["crn"] = "crn:v1:bluemix:public:mock::a/{}::{}".format(
+                self.account, item["id"])
+
+        return item
+
+    def generate(self, path, count):
+        """Add synthetic resources to a collection
+
+        :param path: Collection path such as `/v1/instances`
+        :type path: str
+        :param count: Number of resources
+        :type count: int
+        """
+        with self.lock:
+            items = self.collections.setdefault(path, [])
+            template = dict(items[0]) if items else {}
+            singular = path.rsplit("/", 1)[1].rstrip("s")
+            start = len(items)
+            for index in range(start, start + count):
+                self._add(path, self._item(path, template, "{}-{}".format(
+                    singular, index)))
+
+    def _find(self, path):
+        """Find the collection and the resource targeted by a path
+
+        :return: Collection path and resource ID or None
+        :rtype: tuple
+        """
+        if path in self.collections:
+            return path, None
+        parent, _, resource_id = path.rpartition("/")
+        if not parent:
+            return None, None
+        collection, parent_id = self._find(parent)
+        if collection is None:
+            return None, None
+        if parent_id is None:
+            return collection, resource_id
+        if self._get(collection, parent_id) is None:
+            return None, None
+
+        # Sub-collection of an existing resource
+        self.collections[path] = []
+        self.ids[path] = {}
+
+        return path, None
+
+    def _page(self, path, query):
+        items = self.collections[path]
+        if "name" in query:
+            items = [item for item in items if item["name"] == query["name"]]
+        if path.startswith("/pcloud/"):
+            return {_camel(path.rsplit("/", 1)[1]): items}
+
+        limit = min(int(query.get("limit", PAGE_SIZE)), MAX_PAGE_SIZE)
+        start = int(query.get("start", 0))
+        page = items[start:start + limit]
+        following = None
+        if start + limit < len(items):
+            next_query = dict(query, start=start + limit, limit=limit)
+            following = "{}?{}".format(path, urlencode(next_query))
+
+        if path.startswith("/v2/"):
+            return {"rows_count": len(page), "next_url": following,
+                    "resources": page}
+
+        key = path.rsplit("/", 1)[1]
+        data = {key: page, "limit": limit, "total_count": len(items),
+                "first": {"href": "{}?limit={}".format(path, limit)}}
+        if following:
+            data["next"] = {"href": following}
+
+        return data
+
+    def _get(self, collection, resource_id):
+        item = self.ids[collection].get(resource_id)
+        if item is None and collection.startswith("/pcloud/"):
+            # Power resources are also retrieved by name
+            for candidate in self.collections[collection]:
+                if candidate.get("name") == resource_id:
+                    return candidate
+
+        return item
+
+    def handle(self, method, path, query, body):
+        """Answer a query
+
+        :return: Status and response body
+        :rtype: tuple
+        """
+        if path == "/identity/token" and method == "POST":
+            claims = {"exp": int(time.time()) + 3600,
+                      "account": {"bss": self.account}}
+            token = jwt.encode(claims, SECRET, algorithm="HS256")
+            if isinstance(token, bytes):
+                token = token.decode()
+            return 200, {"access_token": token, "token_type": "Bearer",
+                         "expires_in": 3600}
+
+        with self.lock:
+            collection, resource_id = self._find(path)
+            if collection is None:
+                if method != "POST":
+                    return _error(404, "not_found", "Path not found")
+                collection, resource_id = path, None
+
+            if resource_id is None:
+                if method == "GET":
+                    return 200, self._page(collection, query)
+                if method == "POST":
+                    item = self._item(collection, body or {},
+                                      (body or {}).get("name", ""))
+                    self._add(collection, item)
+                    return 201, item
+                return _error(405, "method_not_allowed", "Not allowed")
+
+            item = self._get(collection, resource_id)
+            if item is None:
+                return _error(404, "not_found", "Resource not found")
+
+            if method == "GET":
+                return 200, item
+            if method in ("PATCH", "PUT"):
+                item.update(body or {})
+                self.version += 1
+                return 200, item
+            if method == "DELETE":
+                self.collections[collection].remove(item)
+                del self.ids[collection][_key(item)]
+                self.version += 1
+                return 204, None
+
+        return _error(405, "method_not_allowed", "Not allowed")
+
+    def respond(self, method, target, headers, raw):
+        """Answer an HTTP query
+
+        :param method: HTTP method
+        :type method: str
+        :param target: Path with the query string
+        :type target: str
+        :param headers: Query headers
+        :type headers: dict
+        :param raw: Query body
+        :type raw: bytes
+        :return: Status, response headers and response body
+        :rtype: tuple
+        """
+        url = urlsplit(target)
+        query = dict(parse_qsl(url.query, keep_blank_values=True))
+        try:
+            body = json.loads(raw) if raw else None
+        except ValueError:
+            body = None
+        status, data = self.handle(method, url.path, query, body)
+
+        return _encode(method, status, data, headers)
+
+
+def _encode(method, status, data, headers):
+    """Encode a response body and answer conditional queries
+    """
+    payload = json.dumps(data).encode() if data is not None else b""
+    response_headers = []
+    if payload:
+        response_headers.append(("Content-Type", "application/json"))
+    if status == 200:
+        etag = '"{:x}"'.format(zlib.crc32(payload))
+        response_headers.append(("ETag", etag))
+        if method == "GET" and headers.get("If-None-Match") == etag:
+            status, payload = 304, b""
+
+    return status, response_headers, payload
+
+
+class StoreTransport(Transport):
+    """Answer the SDK queries from a store without any socket, to measure
+    the overhead of the SDK alone
+
+    Encoded responses of GET queries are reused until the store changes.
+
+    :param store: Resources store, a new one by default
+    :type store: Store, optional
+    """
+
+    def __init__(self, store=None):
+        self.store = store or Store("mock-account", "us-south", 0)
+        self.responses = {}
+        self.requests = 0
+
+    def send(self, conn_type, host, method, path, payload, headers):
+        self.requests += 1
+        headers = headers or {}
+        key = (path, self.store.version)
+        if method == "GET" and "If-None-Match" not in headers:
+            response = self.responses.get(key)
+            if response is None:
+                response = self.store.respond(method, path, headers, None)
+                if len(self.responses) > 10000:
+                    self.responses = {}
+                self.responses[key] = response
+        else:
+            raw = payload.encode() if isinstance(payload, str) else payload
+            response = self.store.respond(method, path, headers, raw)
+
+        status, response_headers, data = response
+
+        return Response(status, "", response_headers), data
+
+
+class Handler(BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, don't wait for the ACK of
+    # the headers to send the body
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _handle(self):
+        server = self.server
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        with server.lock:
+            server.requests += 1
+            delay = server.latency + server.random.uniform(0, server.jitter)
+            failed = (server.error_rate
+                      and server.random.random() < server.error_rate)
+        if delay:
+            time.sleep(delay)
+
+        if failed:
+            status, headers, payload = _encode(
+                self.command, *_error(server.error_status, "injected",
+                                      "Injected error"), {})
+        else:
+            status, headers, payload = server.store.respond(
+                self.command, self.path, self.headers, raw)
+
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+
+class MockServer(ThreadingHTTPServer):
+    """Threaded HTTP/1.1 server answering the SDK queries
+
+    :param port: Port to listen on, a free port is picked by default
+    :type port: int, optional
+    :param resources: Number of synthetic resources by collection path
+    :type resources: dict, optional
+    :param latency: Seconds to wait before answering
+    :type latency: float, optional
+    :param jitter: Maximum random seconds added to the latency
+    :type jitter: float, optional
+    :param error_rate: Ratio of queries answered with an error
+    :type error_rate: float, optional
+    :param error_status: Status of the injected errors
+    :type error_status: int, optional
+    :param account: Account ID of the tokens and CRNs
+    :type account: str, optional
+    :param region: Region of the Power resource instance
+    :type region: str, optional
+    :param seed: Seed of the generated IDs, latencies and errors
+    :type seed: int, optional
+    """
+
+    daemon_threads = True
+
+    def __init__(self, port=0, resources=None, latency=0, jitter=0,
+                 error_rate=0, error_status=503, account="mock-account",
+                 region="us-south", seed=0):
+        super().__init__(("127.0.0.1", port), Handler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.store = Store(account, region, seed)
+        for path, count in (resources or {}).items():
+            self.store.generate(path, count)
+        self.thread = None
+
+    @property
+    def endpoint(self):
+        return "http://127.0.0.1:{}".format(self.server_address[1])
+
+    def start(self):
+        """Serve the queries from a background thread
+        """
+        self.thread = threading.Thread(target=self.serve_forever,
+                                       kwargs={"poll_interval": 0.05},
+                                       daemon=True)
+        self.thread.start()
+
+        return self
+
+    def stop(self):
+        """Stop serving and close the listening socket
+        """
+        self.shutdown()
+        self.server_close()
+        if self.thread is not None:
+            self.thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--jitter", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--resources", nargs="*", default=[],
+                        metavar="PATH=COUNT",
+                        help="synthetic resources such as "
+                             "/v1/instances=5000")
+    args = parser.parse_args()
+
+    resources = {}
+    for resource in args.resources:
+        path, _, count = resource.partition("=")
+        resources[path] = int(count)
+
+    server = MockServer(args.port, resources, args.latency, args.jitter,
+                        args.error_rate, args.error_status, seed=args.seed)
+    print("Serving on {}".format(server.endpoint))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
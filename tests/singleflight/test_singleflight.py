@@ -0,0 +1,88 @@
+import threading
+import time
+from types import SimpleNamespace
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk.utils import singleflight
+from ibmcloud_python_sdk.utils.common import query_wrapper
+from tests.common import get_headers
+
+
+class FakePool():
+    """This class mimics a connection pool answering slowly to let the
+    concurrent queries overlap.
+    """
+    def __init__(self):
+        self.requests = []
+
+    def request(self, method, path, payload=None, headers=None):
+        self.requests.append(path)
+        time.sleep(0.05)
+        return SimpleNamespace(status=200, reason='OK'), b'{"vpcs": []}'
+
+
+class SingleFlightTestCase(TestCase):
+
+    def run_threads(self, func, count=5):
+        results = [None] * count
+
+        def target(index):
+            try:
+                results[index] = func()
+            except Exception as error:
+                results[index] = error
+
+        threads = [threading.Thread(target=target, args=(index,))
+                   for index in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_concurrent_calls_share_result(self):
+        group = singleflight.Group()
+        calls = []
+
+        def func():
+            calls.append(1)
+            time.sleep(0.05)
+            return {'data': 'shared'}
+
+        results = self.run_threads(lambda: group.do('key', func))
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(group.calls, {})
+
+    def test_concurrent_calls_share_error(self):
+        group = singleflight.Group()
+
+        def func():
+            time.sleep(0.05)
+            raise ValueError('broken')
+
+        results = self.run_threads(lambda: group.do('key', func))
+        self.assertTrue(all(isinstance(result, ValueError)
+                            for result in results))
+
+    def test_sequential_calls_are_not_shared(self):
+        group = singleflight.Group()
+        calls = []
+        group.do('key', lambda: calls.append(1))
+        group.do('key', lambda: calls.append(1))
+        self.assertEqual(len(calls), 2)
+
+    def test_query_wrapper_coalesces_gets(self):
+        pool = FakePool()
+        headers = get_headers()
+        with patch('ibmcloud_python_sdk.utils.common.pool.get_pool',
+                   lambda host, timeout=None: pool), \
+                patch('ibmcloud_python_sdk.utils.common.cache.enabled',
+                      lambda: False):
+            results = self.run_threads(
+                lambda: query_wrapper('iaas', 'GET', '/v1/vpcs', headers))
+            self.run_threads(
+                lambda: query_wrapper('iaas', 'POST', '/v1/vpcs', headers,
+                                      '{}'), count=2)
+        self.assertEqual(results[0]['data'], {'vpcs': []})
+        self.assertEqual(len(pool.requests), 3)
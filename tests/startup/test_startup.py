@@ -0,0 +1,75 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from unittest import TestCase
+
+
+ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
+
+MODULES = [
+    'ibmcloud_python_sdk.auth',
+    'ibmcloud_python_sdk.power',
+    'ibmcloud_python_sdk.power.instance',
+    'ibmcloud_python_sdk.resource.resource_instance',
+    'ibmcloud_python_sdk.utils.cache',
+    'ibmcloud_python_sdk.vpc.instance',
+]
+
+# Generous bound, a regression reading the configuration or reaching the
+# network at import time fails well before on a missing file
+IMPORT_BUDGET = 10
+
+# Cumulative import time of ibmcloud_python_sdk.vpc.instance reported by
+# `python -X importtime`, in microseconds
+IMPORT_TIME_BUDGET = 500000
+
+# Packages only needed by the classic infrastructure and object storage
+HEAVY_MODULES = ['SoftLayer', 'ibm_boto3', 'botocore', 'pymemcache']
+
+
+class StartupTestCase(TestCase):
+
+    def setUp(self):
+        self.home = tempfile.TemporaryDirectory()
+        self.env = {k: v for k, v in os.environ.items()
+                    if not k.startswith(('IC_', 'SL_'))}
+        self.env['HOME'] = self.home.name
+        self.env['PYTHONPATH'] = os.path.abspath(ROOT)
+
+    def tearDown(self):
+        self.home.cleanup()
+
+    def test_import_without_configuration(self):
+        code = ('import {}\n'
+                'from ibmcloud_python_sdk import config\n'
+                'assert not config.memo, config.memo\n').format(
+                    ', '.join(MODULES))
+        start = time.monotonic()
+        proc = subprocess.run([sys.executable, '-c', code], env=self.env,
+                              stdout=subprocess.PIPE,
+                              stderr=subprocess.PIPE)
+        elapsed = time.monotonic() - start
+        self.assertEqual(proc.returncode, 0, proc.stderr.decode())
+        self.assertLess(elapsed, IMPORT_BUDGET)
+
+    def test_import_time_budget(self):
+        module = 'ibmcloud_python_sdk.vpc.instance'
+        code = ('import sys\n'
+                'import {}\n'
+                'print([m for m in {!r} if m in sys.modules])\n').format(
+                    module, HEAVY_MODULES)
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c',
+                               code], env=self.env, stdout=subprocess.PIPE,
+                              stderr=subprocess.PIPE)
+        self.assertEqual(proc.returncode, 0, proc.stderr.decode())
+        self.assertEqual(proc.stdout.decode().strip(), '[]')
+
+        cumulative = None
+        for line in proc.stderr.decode().splitlines():
+            fields = line.split('|')
+            if len(fields) == 3 and fields[2].strip() == module:
+                cumulative = int(fields[1])
+        self.assertIsNotNone(cumulative)
+        self.assertLess(cumulative, IMPORT_TIME_BUDGET)
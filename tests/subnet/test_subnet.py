@@ -5,8 +5,8 @@ from ibmcloud_python_sdk.vpc.subnet import Subnet
 from ibmcloud_python_sdk.vpc.vpc import Vpc
 from ibmcloud_python_sdk.vpc.acl import Acl
 from ibmcloud_python_sdk.vpc.gateway import Gateway
-from tests.common import get_headers, get_one, qw, qw_not_found, qw_exception, \
-    qw_api_error, qw_delete_code_204, qw_delete_code_400
+from tests.common import get_headers, get_one, get_all, qw, qw_not_found, \
+    qw_exception, qw_api_error, qw_delete_code_204, qw_delete_code_400
 
 
 class SubnetTestCase(TestCase):
@@ -47,6 +47,39 @@ class SubnetTestCase(TestCase):
         response = self.subnet.get_subnets()
         self.assertEqual(response['total_count'], 2)
 
+    def qw_pages(arg1, arg2, path, headers=None, payload=None):
+        """This function is used to mock the query_wrapper function from
+        utils/common. It splits the subnets in pages of one subnet linked
+        by the next href.
+        """
+        data = get_all('/v1/subnets?limit=1')['data']
+        index = 1 if 'start=' in path else 0
+        page = {'limit': 1, 'subnets': [data['subnets'][index]],
+                'total_count': data['total_count']}
+        if index == 0:
+            page['next'] = {'href': 'https://us-south.iaas.cloud.ibm.com'
+                                    '/v1/subnets?limit=1&start=page2'}
+        else:
+            assert 'version=' in path and 'generation=' in path
+        return {'data': page}
+
+    @patch('ibmcloud_python_sdk.vpc.subnet.qw', qw_pages)
+    def test_get_subnets_paginated(self):
+        response = self.subnet.get_subnets()
+        self.assertEqual(len(response['subnets']), 2)
+        self.assertNotIn('next', response)
+
+    @patch('ibmcloud_python_sdk.vpc.subnet.qw', qw_pages)
+    def test_iter_subnets(self):
+        response = list(self.subnet.iter_subnets(limit=1))
+        self.assertEqual(len(response), 2)
+        self.assertEqual(response[0]['id'], self.content['data']['id'])
+
+    @patch('ibmcloud_python_sdk.vpc.subnet.qw', qw_not_found)
+    def test_iter_subnets_not_found(self):
+        response = list(self.subnet.iter_subnets())
+        self.assertEqual(response[0]['errors'][0]['code'], 'not_found')
+
     @patch('ibmcloud_python_sdk.vpc.subnet.qw', qw)
     def test_get_subnet_by_id(self):
         response = self.subnet.get_subnet_by_id(self.content['data']['id'])
@@ -0,0 +1,112 @@
+import json
+import shutil
+import tempfile
+from unittest import TestCase
+from mock import patch
+from ibmcloud_python_sdk import auth
+from ibmcloud_python_sdk.utils import common
+from ibmcloud_python_sdk.utils import transport
+
+
+class FakeConnection():
+    """This class mimics the connection pool by returning the queried path.
+    """
+    def __init__(self):
+        self.calls = []
+
+    def request(self, method, path, payload, headers):
+        self.calls.append((method, path))
+        return (transport.Response(200, 'OK', []),
+                json.dumps({'path': path}).encode())
+
+
+class TransportTestCase(TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.filename = f'{self.tmp}/responses.jsonl'
+        self.responses = {}
+        self.patcher = patch('ibmcloud_python_sdk.utils.cache.enabled',
+                             lambda: False)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        shutil.rmtree(self.tmp)
+
+    def fake(self, conn_type, host, method, path, payload, headers):
+        """This function is used as the transport wrapped by the recording
+        transport.
+        """
+        count = self.responses[path] = self.responses.get(path, 0) + 1
+        return (transport.Response(200, 'OK', [('ETag', f'"{count}"')]),
+                json.dumps({'path': path, 'count': count}).encode())
+
+    def record(self, *paths):
+        recorder = transport.RecordingTransport(self.filename, self.fake)
+        with transport.use_transport(recorder):
+            common.query_wrapper('auth', 'POST', '/identity/token', {}, '')
+            for path in paths:
+                common.query_wrapper('iaas', 'GET', path, {})
+
+    def test_record_and_replay(self):
+        self.record('/v1/vpcs', '/v1/vpcs', '/v1/subnets')
+        with open(self.filename) as record_file:
+            lines = record_file.readlines()
+        # Token queries aren't recorded
+        self.assertEqual(len(lines), 3)
+        self.assertNotIn('/identity/token', ''.join(lines))
+
+        replay = transport.ReplayTransport(self.filename)
+        with transport.use_transport(replay):
+            first = common.query_wrapper('iaas', 'GET', '/v1/vpcs', {})
+            second = common.query_wrapper('iaas', 'GET', '/v1/vpcs', {})
+            third = common.query_wrapper('iaas', 'GET', '/v1/vpcs', {})
+            subnets = common.query_wrapper('iaas', 'GET', '/v1/subnets', {})
+
+        self.assertEqual(first['data'], {'path': '/v1/vpcs', 'count': 1})
+        self.assertEqual(first['response'].getheader('ETag'), '"1"')
+        self.assertEqual(second['data']['count'], 2)
+        # The last response is served again once all have been used
+        self.assertEqual(third['data']['count'], 2)
+        self.assertEqual(subnets['data']['path'], '/v1/subnets')
+        self.assertIsNone(common.transport.get())
+
+    def test_replay_missing_response(self):
+        self.record('/v1/vpcs')
+        with transport.use_transport(
+                transport.ReplayTransport(self.filename)):
+            with self.assertRaises(LookupError):
+                common.query_wrapper('iaas', 'GET', '/v1/subnets', {})
+
+    def test_replay_token(self):
+        self.record('/v1/vpcs')
+        auth.token_manager.reset()
+        try:
+            with transport.use_transport(
+                    transport.ReplayTransport(self.filename, 'a1b2')):
+                self.assertEqual(auth.token_manager.account_id, 'a1b2')
+        finally:
+            auth.token_manager.reset()
+
+    def test_http_transport_uses_pool(self):
+        conn = FakeConnection()
+        with patch('ibmcloud_python_sdk.utils.common.pool.get_pool',
+                   lambda host, timeout: conn):
+            with transport.use_transport(transport.HTTPTransport()):
+                result = common.query_wrapper('iaas', 'GET', '/v1/vpcs', {})
+
+        self.assertEqual(result['data'], {'path': '/v1/vpcs'})
+        self.assertEqual(conn.calls, [('GET', '/v1/vpcs')])
+
+    def test_http_transport_coalesces(self):
+        conn = FakeConnection()
+        with patch('ibmcloud_python_sdk.utils.common.pool.get_pool',
+                   lambda host, timeout: conn):
+            with patch('ibmcloud_python_sdk.utils.common.singleflight.group'
+                       '.do', side_effect=lambda key, func: func()) as do:
+                with transport.use_transport(transport.HTTPTransport()):
+                    common.query_wrapper('iaas', 'GET', '/v1/vpcs', {})
+                    common.query_wrapper('iaas', 'POST', '/v1/vpcs', {})
+
+        do.assert_called_once()